@@ -0,0 +1,155 @@
+import math
+
+import numpy as np
+
+# --- DISPOSICIÓN AUTOMÁTICA POR FUERZAS ---
+# Fruchterman-Reingold: las aristas atraen a sus extremos (d²/k) y todos los
+# vértices se repelen (k²/d). La repulsión se aproxima con Barnes-Hut: un
+# árbol cuaternario por niveles donde una celda lejana actúa como una sola
+# masa en su centro. Todo se calcula con arreglos de NumPy, sin bucles por
+# vértice, así que cada iteración cuesta O(n log n).
+
+
+class DisposicionFuerzas:
+    """Disposición incremental de Fruchterman-Reingold con repulsión de Barnes-Hut."""
+
+    def __init__(self, posiciones, aristas, fijos=None, caja=None, theta=0.9, enfriamiento=0.95):
+        """Prepara la disposición.
+
+        posiciones es una secuencia de (x, y) iniciales, aristas una de pares
+        de índices (i, j) y fijos una de booleanos (los vértices fijos no se
+        mueven, pero sí empujan y atraen). caja = (x0, y0, x1, y1) es el área
+        donde se reparten los vértices; por defecto la que ocupan.
+        """
+        self.pos = np.array(posiciones, dtype=np.float64).reshape(-1, 2)
+        n = len(self.pos)
+        self.aristas = np.array(aristas, dtype=np.intp).reshape(-1, 2)
+        self.fijos = np.zeros(n, dtype=bool) if fijos is None else np.array(fijos, dtype=bool)
+        if caja is None:
+            if n:
+                (x0, y0), (x1, y1) = self.pos.min(axis=0), self.pos.max(axis=0)
+            else:
+                x0 = y0 = 0.0
+                x1 = y1 = 1.0
+            caja = (x0, y0, max(x1, x0 + 1.0), max(y1, y0 + 1.0))
+        self.caja = caja
+        x0, y0, x1, y1 = caja
+        self.k = math.sqrt((x1 - x0) * (y1 - y0) / max(n, 1))  # Distancia ideal entre vértices
+        self.temperatura = max(x1 - x0, y1 - y0) / 10  # Desplazamiento máximo por iteración
+        self.temperatura_min = self.k / 100
+        self.theta = theta
+        self.enfriamiento = enfriamiento
+        self.iteraciones = 0
+
+    def terminada(self):
+        """Verdadero cuando la temperatura ya no permite movimientos apreciables."""
+        return self.temperatura < self.temperatura_min or self.fijos.all()
+
+    def paso(self):
+        """Hace una iteración y devuelve el mayor desplazamiento aplicado."""
+        n = len(self.pos)
+        if n == 0 or self.fijos.all():
+            return 0.0
+        fx, fy = self._repulsion()
+
+        if len(self.aristas):
+            u, v = self.aristas[:, 0], self.aristas[:, 1]
+            dx = self.pos[u, 0] - self.pos[v, 0]
+            dy = self.pos[u, 1] - self.pos[v, 1]
+            # Atracción d²/k en la dirección de la arista: (dx, dy) * d / k
+            d = np.hypot(dx, dy) / self.k
+            fx += np.bincount(v, dx * d, n) - np.bincount(u, dx * d, n)
+            fy += np.bincount(v, dy * d, n) - np.bincount(u, dy * d, n)
+
+        # Cada vértice se mueve en la dirección de su fuerza, como mucho la temperatura
+        largo = np.maximum(np.hypot(fx, fy), 1e-9)
+        factor = np.minimum(largo, self.temperatura) / largo
+        factor[self.fijos] = 0.0
+        desp = np.column_stack((fx * factor, fy * factor))
+        self.pos += desp
+        movibles = ~self.fijos
+        x0, y0, x1, y1 = self.caja
+        self.pos[movibles, 0] = np.clip(self.pos[movibles, 0], x0, x1)
+        self.pos[movibles, 1] = np.clip(self.pos[movibles, 1], y0, y1)
+
+        self.temperatura *= self.enfriamiento
+        self.iteraciones += 1
+        return float(np.abs(desp).max())
+
+    def _repulsion(self):
+        """Fuerza de repulsión (fx, fy) sobre cada vértice, aproximada con Barnes-Hut."""
+        pos = self.pos
+        n = len(pos)
+        k2 = self.k * self.k
+        fx = np.zeros(n)
+        fy = np.zeros(n)
+        if n < 2:
+            return fx, fy
+
+        # Celda de cada vértice en el nivel más fino (unos pocos vértices por hoja)
+        minimo = pos.min(axis=0)
+        lado = max(float((pos.max(axis=0) - minimo).max()), 1e-9)
+        prof = min(max(1, math.ceil(math.log(n, 4)) + 1), 20)
+        celda = np.minimum(((pos - minimo) * ((1 << prof) / lado)).astype(np.int64), (1 << prof) - 1)
+
+        # Por nivel: claves ordenadas de las celdas ocupadas, masa (número de
+        # vértices), centro de masa y la celda de cada vértice
+        niveles = []
+        for nivel in range(prof + 1):
+            c = celda >> (prof - nivel)
+            claves, inv = np.unique((c[:, 0] << nivel) | c[:, 1], return_inverse=True)
+            masa = np.bincount(inv, minlength=len(claves)).astype(np.float64)
+            cx = np.bincount(inv, pos[:, 0], len(claves)) / masa
+            cy = np.bincount(inv, pos[:, 1], len(claves)) / masa
+            niveles.append((claves, masa, cx, cy, inv.ravel()))
+
+        def empujar(i, dx, dy, masa):
+            d2 = np.maximum(dx * dx + dy * dy, 1e-9)
+            f = masa * k2 / d2  # (dx, dy) / d * masa * k² / d
+            fx[:] += np.bincount(i, dx * f, n)
+            fy[:] += np.bincount(i, dy * f, n)
+
+        # Recorrido de todos los vértices a la vez: pares (vértice i, celda j)
+        # que empiezan en la raíz y se abren mientras la celda esté cerca
+        i = np.arange(n)
+        j = np.zeros(n, dtype=np.intp)
+        theta2 = self.theta * self.theta
+        for nivel, (claves, masa, cx, cy, inv) in enumerate(niveles):
+            dx = pos[i, 0] - cx[j]
+            dy = pos[i, 1] - cy[j]
+            propia = inv[i] == j
+            tam = lado / (1 << nivel)
+            acepta = ~propia & (tam * tam < theta2 * (dx * dx + dy * dy))
+            empujar(i[acepta], dx[acepta], dy[acepta], masa[j[acepta]])
+            i, j = i[~acepta], j[~acepta]
+
+            if nivel == prof:
+                # Las hojas cercanas (y la propia) se abren: cada vértice que
+                # contienen empuja por separado, porque en su centro de masa
+                # se perdería la repulsión entre vértices muy próximos. Hay
+                # pocos vértices por hoja; la vuelta r toma el r-ésimo de cada una.
+                orden = np.argsort(inv, kind="stable")  # Vértices ordenados por hoja
+                tam_hoja = masa.astype(np.intp)
+                inicio = np.cumsum(tam_hoja) - tam_hoja
+                m = tam_hoja[j]
+                for r in range(int(m.max())):
+                    sel = r < m
+                    a, b = i[sel], orden[inicio[j[sel]] + r]
+                    otro = a != b
+                    a, b = a[otro], b[otro]
+                    empujar(a, pos[a, 0] - pos[b, 0], pos[a, 1] - pos[b, 1], 1.0)
+                break
+
+            # Abrir las celdas no aceptadas: pasar a sus hijos ocupados
+            padre = claves[j]
+            px = padre >> nivel
+            py = padre & ((1 << nivel) - 1)
+            hijos = np.concatenate([((2 * px + a) << (nivel + 1)) | (2 * py + b)
+                                    for a in (0, 1) for b in (0, 1)])
+            i = np.tile(i, 4)
+            claves_hijos = niveles[nivel + 1][0]
+            j = np.minimum(np.searchsorted(claves_hijos, hijos), len(claves_hijos) - 1)
+            ocupada = claves_hijos[j] == hijos
+            i, j = i[ocupada], j[ocupada]
+
+        return fx, fy
@@ -1,65 +1,146 @@
-import customtkinter as ctk
+import csv
+import functools
+import gc
+import heapq
 import math
-import random
-import os # <-- ¡NUEVO!
-
-# --- ¡NUEVO! ---
-# Importar la librería de imágenes de Pillow
-try:
-    from PIL import Image, ImageTk
-except ImportError:
-    print("Error: Se necesita la librería Pillow. Instálala con: pip install Pillow")
-    exit()
+import struct
+import sys
+import threading
+import weakref
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Mapping
+from itertools import islice
+from types import MappingProxyType
+
+# Este módulo solo contiene la estructura de datos y usa únicamente la
+# biblioteca estándar: se puede importar sin interfaz gráfica. La GUI
+# (customtkinter + Pillow) vive en visualizador.py y se carga al usarla.
 
 # --- 1. CLASES DE LA ESTRUCTURA DE DATOS ---
-# (Tu clase Graph, Vertex y Edge va aquí - sin cambios)
-class Graph:
-    """Clase principal del Grafo."""
-
-    class Vertex:
-        """Clase interna para representar un Vértice."""
-        def __init__(self, element, uid):
-            self._element = element
-            self._uid = uid  # ID único (ej: "v1", "v2")
-            self._incoming = {}  # {edge_uid: Edge}
-            self._outgoing = {}  # {edge_uid: Edge}
-
-        def __str__(self):
-            return str(self._element)
-
-    class Edge:
-        """Clase interna para representar una Arista."""
-        def __init__(self, element, uid, origin, destination, directed=False):
-            self._element = element
-            self._uid = uid  # ID único (ej: "e1", "e2")
-            self._origin = origin
-            self._destination = destination
-            self._directed = directed
-
-        def __str__(self):
-            return str(self._element)
-
-        def endpoints(self):
-            """Devuelve la tupla de vértices finales."""
-            return (self._origin, self._destination)
-
-        def opposite(self, v):
-            """Devuelve el vértice opuesto a v en esta arista."""
-            if not isinstance(v, Graph.Vertex):
-                raise TypeError("v debe ser una instancia de Vertex")
-            if self._origin == v:
-                return self._destination
-            elif self._destination == v:
-                return self._origin
-            else:
-                raise ValueError("v no es un vértice incidente de esta arista")
-
-    def __init__(self):
-        """Crea un grafo vacío."""
-        self._vertices = {}  # {vertex_uid: Vertex}
-        self._edges = {}     # {edge_uid: Edge}
-        self._v_counter = 0  # Para IDs únicos de vértices
-        self._e_counter = 0  # Para IDs únicos de aristas
+def _exclusivo(metodo):
+    """Decorador para las operaciones que modifican el grafo: toma su cerrojo."""
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        with self._cerrojo:
+            return metodo(self, *args, **kwargs)
+    return envoltura
+
+
+_AUSENTE = object()     # Marca de "la clave no existía" en una _Capa
+_SIN_ANOTAR = object()  # La clave no está en una _Capa
+
+
+class _Capa:
+    """Valores que tenían las claves del grafo cuando se creó una instantánea.
+
+    La primera vez que se modifica una clave de _vertices, _edges o _indice
+    después de la instantánea, el grafo guarda aquí su valor anterior (o
+    _AUSENTE). Las capas de instantáneas sucesivas se encadenan con
+    'siguiente', de la más antigua a la más reciente.
+    """
+    __slots__ = ("epoca", "foto", "siguiente", "_vertices", "_edges", "_indice")
+
+    def __init__(self, epoca):
+        self.epoca = epoca
+        self.foto = None  # weakref a la instantánea dueña de la capa
+        self.siguiente = None
+        self._vertices = {}
+        self._edges = {}
+        self._indice = {}
+
+    def absorber(self, otra):
+        """Agrega los valores de otra capa (posterior) que esta no tenga."""
+        for nombre in ("_vertices", "_edges", "_indice"):
+            propios = getattr(self, nombre)
+            for clave, valor in tuple(getattr(otra, nombre).items()):
+                propios.setdefault(clave, valor)
+
+
+class _MapaInstantanea(Mapping):
+    """Diccionario de solo lectura con el contenido de un mapa del grafo en una instantánea.
+
+    Lee del diccionario vivo del grafo y lo corrige con las capas, desde la
+    de la instantánea hasta la más reciente: la primera capa que tiene la
+    clave da su valor en la instantánea. Al recorrerlo por primera vez se
+    construye un diccionario propio y las consultas siguientes usan ese.
+    """
+
+    def __init__(self, vivo, capa, nombre, longitud):
+        self._vivo = vivo
+        self._capa = capa
+        self._nombre = nombre
+        self._longitud = longitud
+        self._fijo = None
+
+    def _valor(self, clave):
+        # Primero el valor vivo y después las capas: el grafo anota el valor
+        # anterior en la capa antes de modificar el diccionario vivo.
+        valor = self._vivo.get(clave, _AUSENTE)
+        capa = self._capa
+        while capa is not None:
+            anterior = getattr(capa, self._nombre).get(clave, _SIN_ANOTAR)
+            if anterior is not _SIN_ANOTAR:
+                return anterior
+            capa = capa.siguiente
+        return valor
+
+    def _fijar(self):
+        if self._fijo is None:
+            fijo = dict(tuple(self._vivo.items()))
+            anotados = {}
+            capa = self._capa
+            while capa is not None:
+                for clave, valor in tuple(getattr(capa, self._nombre).items()):
+                    anotados.setdefault(clave, valor)
+                capa = capa.siguiente
+            for clave, valor in anotados.items():
+                if valor is _AUSENTE:
+                    fijo.pop(clave, None)
+                else:
+                    fijo[clave] = valor
+            self._fijo = fijo
+        return self._fijo
+
+    def __getitem__(self, clave):
+        if self._fijo is not None:
+            return self._fijo[clave]
+        valor = self._valor(clave)
+        if valor is _AUSENTE:
+            raise KeyError(clave)
+        return valor
+
+    def __iter__(self):
+        return iter(self._fijar())
+
+    def __len__(self):
+        return self._longitud
+
+    def keys(self):
+        return self._fijar().keys()
+
+    def values(self):
+        return self._fijar().values()
+
+    def items(self):
+        return self._fijar().items()
+
+
+def peso_elemento(o):
+    """Peso por defecto de una arista: su elemento si es un número (o un texto
+    numérico, como los que llegan de cargar_csv), y 1 en otro caso."""
+    try:
+        return float(o)
+    except (TypeError, ValueError):
+        return 1
+
+
+class _ConsultasGrafo:
+    """Consultas de solo lectura comunes a Graph y a sus instantáneas.
+
+    Las subclases definen _vertices, _edges, _indice, _version, _vistas (la
+    caché de vistas, ver _vista) y los accesos _entrada(v) / _salida(v) a los
+    diccionarios de incidencia de cada vértice.
+    """
 
     def _validate_vertex(self, v_uid):
         """Valida si el UID del vértice existe y devuelve el objeto Vertex."""
@@ -73,6 +154,42 @@ class Graph:
             raise ValueError(f"Arista '{e_uid}' no existe en el grafo.")
         return self._edges[e_uid]
 
+    def version(self):
+        """Devuelve la versión actual del grafo (crece con cada cambio)."""
+        return self._version
+
+    # --- Búsqueda por elemento ---
+    # _indice guarda, para cada elemento, el UID de su único vértice o, si
+    # hay varios, un OrderedDict {v_uid: None} en orden de inserción.
+
+    @staticmethod
+    def _primero(uids):
+        """El UID más antiguo de una entrada de _indice (o None)."""
+        if uids is None or isinstance(uids, str):
+            return uids
+        return next(iter(uids))
+
+    def buscaVertice(self, o):
+        """Devuelve el UID del vértice con elemento o (el más antiguo), o None."""
+        try:
+            uids = self._indice.get(o)
+        except TypeError:
+            return None  # Los elementos no hashables no se indexan
+        return self._primero(uids)
+
+    def buscaVertices(self, elementos):
+        """Devuelve una lista con el UID de cada elemento dado (None si no existe)."""
+        indice = self._indice
+        primero = self._primero
+        resultado = []
+        for o in elementos:
+            try:
+                uids = indice.get(o)
+            except TypeError:
+                uids = None
+            resultado.append(primero(uids))
+        return resultado
+
     # --- Operaciones Generales ---
 
     def numVertices(self):
@@ -100,14 +217,14 @@ class Graph:
         """Devuelve el grado de v."""
         v = self._validate_vertex(v_uid)
         # Combina aristas de entrada y salida (para contar no dirigidas una vez)
-        incident_edges = {**v._incoming, **v._outgoing}
+        incident_edges = {**self._entrada(v), **self._salida(v)}
         return len(incident_edges)
 
     def verticesAdyacentes(self, v_uid):
         """Devuelve una lista de los UIDs de los vértices adyacentes a v."""
         v = self._validate_vertex(v_uid)
         adyacentes = set()
-        incident_edges = {**v._incoming, **v._outgoing}
+        incident_edges = {**self._entrada(v), **self._salida(v)}
         for edge in incident_edges.values():
             adyacentes.add(edge.opposite(v)._uid)
         return list(adyacentes)
@@ -115,7 +232,7 @@ class Graph:
     def aristasIncidentes(self, v_uid):
         """Devuelve una lista de los UIDs de las aristas incidentes en v."""
         v = self._validate_vertex(v_uid)
-        incident_edges = {**v._incoming, **v._outgoing}
+        incident_edges = {**self._entrada(v), **self._salida(v)}
         return list(incident_edges.keys())
 
     def verticesFinales(self, e_uid):
@@ -149,28 +266,28 @@ class Graph:
     def gradoEnt(self, v_uid):
         """Devuelve el grado de entrada de v."""
         v = self._validate_vertex(v_uid)
-        return len(v._incoming)
+        return len(self._entrada(v))
 
     def gradoSalida(self, v_uid):
         """Devuelve el grado de salida de v."""
         v = self._validate_vertex(v_uid)
-        return len(v._outgoing)
+        return len(self._salida(v))
 
     def aristasIncidentesEnt(self, v_uid):
         """Devuelve una lista de todas las aristas de entrada a v."""
         v = self._validate_vertex(v_uid)
-        return list(v._incoming.keys())
+        return list(self._entrada(v).keys())
 
     def aristasIncidentesSal(self, v_uid):
         """Devuelve una lista de todas las aristas de salida a v."""
         v = self._validate_vertex(v_uid)
-        return list(v._outgoing.keys())
+        return list(self._salida(v).keys())
 
     def verticesAdyacentesEnt(self, v_uid):
         """Devuelve lista de vértices adyacentes a v a través de aristas de entrada."""
         v = self._validate_vertex(v_uid)
         adyacentes = set()
-        for edge in v._incoming.values():
+        for edge in self._entrada(v).values():
             if edge._directed:
                 adyacentes.add(edge._origin._uid)
             else:
@@ -181,7 +298,7 @@ class Graph:
         """Devuelve lista de vértices adyacentes a v a través de aristas de salida."""
         v = self._validate_vertex(v_uid)
         adyacentes = set()
-        for edge in v._outgoing.values():
+        for edge in self._salida(v).values():
             if edge._directed:
                 adyacentes.add(edge._destination._uid)
             else:
@@ -207,25 +324,638 @@ class Graph:
         e = self._validate_edge(e_uid)
         return e._directed
 
+    # --- Recorridos (iterativos, sin recursión) ---
+    # Trabajan directamente sobre los diccionarios de incidencia en O(V + E).
+    # Las aristas no dirigidas se pueden recorrer en ambos sentidos.
+    # No se debe modificar el grafo mientras se consume un recorrido; si otro
+    # hilo lo modifica, hay que recorrer una instantánea (Graph.instantanea).
+
+    def bfs(self, v_uid):
+        """Recorrido en anchura desde v: genera los UIDs en orden de visita."""
+        inicio = self._validate_vertex(v_uid)
+        visitados = {v_uid}
+        cola = deque([inicio])
+        while cola:
+            v = cola.popleft()
+            yield v._uid
+            for edge in self._salida(v).values():
+                w = edge._destination if edge._origin is v else edge._origin
+                if w._uid not in visitados:
+                    visitados.add(w._uid)
+                    cola.append(w)
+
+    def dfs(self, v_uid):
+        """Recorrido en profundidad desde v: genera los UIDs en preorden."""
+        inicio = self._validate_vertex(v_uid)
+        visitados = {v_uid}
+        yield v_uid
+        pila = [(inicio, iter(self._salida(inicio).values()))]
+        while pila:
+            v, aristas = pila[-1]
+            for edge in aristas:
+                w = edge._destination if edge._origin is v else edge._origin
+                if w._uid not in visitados:
+                    visitados.add(w._uid)
+                    yield w._uid
+                    pila.append((w, iter(self._salida(w).values())))
+                    break
+            else:
+                pila.pop()
+
+    def componentesConexas(self):
+        """Genera las componentes conexas (listas de UIDs), ignorando la dirección."""
+        visitados = set()
+        for raiz in self._vertices.values():
+            if raiz._uid in visitados:
+                continue
+            visitados.add(raiz._uid)
+            componente = []
+            pila = [raiz]
+            while pila:
+                v = pila.pop()
+                componente.append(v._uid)
+                for incidentes in (self._salida(v), self._entrada(v)):
+                    for edge in incidentes.values():
+                        w = edge._destination if edge._origin is v else edge._origin
+                        if w._uid not in visitados:
+                            visitados.add(w._uid)
+                            pila.append(w)
+            yield componente
+
+    def componentesFuertementeConexas(self):
+        """Genera las componentes fuertemente conexas (Tarjan iterativo)."""
+        indice = {}
+        bajo = {}
+        pila = []
+        en_pila = set()
+        contador = 0
+        for raiz in self._vertices.values():
+            if raiz._uid in indice:
+                continue
+            indice[raiz._uid] = bajo[raiz._uid] = contador
+            contador += 1
+            pila.append(raiz)
+            en_pila.add(raiz._uid)
+            llamadas = [(raiz, iter(self._salida(raiz).values()))]
+            while llamadas:
+                v, aristas = llamadas[-1]
+                for edge in aristas:
+                    w = edge._destination if edge._origin is v else edge._origin
+                    if w._uid not in indice:
+                        # "Llamada recursiva": se apila w y se continúa desde él
+                        indice[w._uid] = bajo[w._uid] = contador
+                        contador += 1
+                        pila.append(w)
+                        en_pila.add(w._uid)
+                        llamadas.append((w, iter(self._salida(w).values())))
+                        break
+                    if w._uid in en_pila and indice[w._uid] < bajo[v._uid]:
+                        bajo[v._uid] = indice[w._uid]
+                else:
+                    # Se agotaron las aristas de v: "retorno" al padre
+                    llamadas.pop()
+                    if llamadas:
+                        padre = llamadas[-1][0]
+                        if bajo[v._uid] < bajo[padre._uid]:
+                            bajo[padre._uid] = bajo[v._uid]
+                    if bajo[v._uid] == indice[v._uid]:
+                        componente = []
+                        while True:
+                            w = pila.pop()
+                            en_pila.discard(w._uid)
+                            componente.append(w._uid)
+                            if w is v:
+                                break
+                        yield componente
+
+    def ordenTopologico(self):
+        """Devuelve una lista de UIDs en orden topológico (algoritmo de Kahn).
+
+        Lanza ValueError si el grafo tiene ciclos (una arista no dirigida
+        cuenta como ciclo).
+        """
+        grado_ent = {v_uid: len(self._entrada(v)) for v_uid, v in self._vertices.items()}
+        cola = deque(v for v in self._vertices.values() if grado_ent[v._uid] == 0)
+        orden = []
+        while cola:
+            v = cola.popleft()
+            orden.append(v._uid)
+            for edge in self._salida(v).values():
+                w = edge._destination if edge._origin is v else edge._origin
+                grado_ent[w._uid] -= 1
+                if grado_ent[w._uid] == 0:
+                    cola.append(w)
+        if len(orden) != len(self._vertices):
+            raise ValueError("El grafo tiene ciclos; no existe un orden topológico.")
+        return orden
+
+    # --- Caminos y árboles con pesos ---
+    # peso(elemento) da el costo de cada arista a partir de su elemento; por
+    # defecto se usa peso_elemento.
+
+    def dijkstra(self, v_uid, peso=peso_elemento):
+        """Caminos más cortos desde v (Dijkstra).
+
+        Genera (w_uid, distancia, e_uid) para cada vértice alcanzable en el
+        orden en que su distancia queda fijada; e_uid es la última arista del
+        camino (None para v). Lanza ValueError si hay un peso negativo.
+        """
+        inicio = self._validate_vertex(v_uid)
+        distancias = {v_uid: 0}
+        fijados = set()
+        contador = 0  # Desempate en el montículo: los vértices no se comparan
+        monticulo = [(0, contador, inicio, None)]
+        while monticulo:
+            d, _, v, e_uid = heapq.heappop(monticulo)
+            if v._uid in fijados:
+                continue
+            fijados.add(v._uid)
+            yield v._uid, d, e_uid
+            for uid, edge in self._salida(v).items():
+                w = edge._destination if edge._origin is v else edge._origin
+                if w._uid in fijados:
+                    continue
+                costo = peso(edge._element)
+                if costo < 0:
+                    raise ValueError(f"Arista '{uid}' con peso negativo: Dijkstra no aplica.")
+                nueva = d + costo
+                if nueva < distancias.get(w._uid, math.inf):
+                    distancias[w._uid] = nueva
+                    contador += 1
+                    heapq.heappush(monticulo, (nueva, contador, w, uid))
+
+    def caminoMasCorto(self, v_uid, w_uid, peso=peso_elemento):
+        """Devuelve (distancia, [e_uid, ...]) del camino más corto de v a w, o None."""
+        self._validate_vertex(w_uid)
+        llegada = {}
+        for u_uid, d, e_uid in self.dijkstra(v_uid, peso):
+            llegada[u_uid] = e_uid
+            if u_uid == w_uid:
+                break
+        else:
+            return None
+        camino = []
+        while llegada[w_uid] is not None:
+            e_uid = llegada[w_uid]
+            camino.append(e_uid)
+            w_uid = self._edges[e_uid].opposite(self._vertices[w_uid])._uid
+        camino.reverse()
+        return d, camino
+
+    def arbolExpansionMinima(self, peso=peso_elemento):
+        """Bosque de expansión mínima (Kruskal): genera los UIDs de sus aristas.
+
+        Las aristas dirigidas se tratan como no dirigidas. Se generan en orden
+        de peso, a medida que se aceptan.
+        """
+        padre = {v_uid: v_uid for v_uid in self._vertices}
+
+        def raiz(v_uid):
+            # Unión-búsqueda con compresión de caminos (iterativa)
+            r = v_uid
+            while padre[r] != r:
+                r = padre[r]
+            while padre[v_uid] != r:
+                padre[v_uid], v_uid = r, padre[v_uid]
+            return r
+
+        aristas = sorted((peso(e._element), e_uid) for e_uid, e in self._edges.items())
+        restantes = len(padre) - 1
+        for _, e_uid in aristas:
+            if restantes <= 0:
+                break
+            edge = self._edges[e_uid]
+            a, b = raiz(edge._origin._uid), raiz(edge._destination._uid)
+            if a != b:
+                padre[a] = b
+                restantes -= 1
+                yield e_uid
+
+    # --- Vistas para los algoritmos de ADA8 ---
+    # Cada vista se construye una vez por versión del grafo (y función de
+    # peso) y se devuelve de solo lectura, así que las llamadas siguientes la
+    # comparten sin copiar nada. Los vértices se numeran con indiceVertices().
+
+    def _vista(self, tipo, parametros, construir):
+        """Devuelve la vista de ese tipo, reconstruyéndola si cambió el grafo o los parámetros."""
+        guardada = self._vistas.get(tipo)
+        if guardada is not None and guardada[0] == self._version and guardada[1] == parametros:
+            return guardada[2]
+        version = self._version
+        vista = construir()
+        self._vistas[tipo] = (version, parametros, vista)
+        return vista
+
+    def indiceVertices(self):
+        """Devuelve (uids, posicion): la tupla de UIDs en orden y {v_uid: índice}."""
+        def construir():
+            uids = tuple(self._vertices)
+            return uids, MappingProxyType({v_uid: i for i, v_uid in enumerate(uids)})
+        return self._vista("indice", None, construir)
+
+    def comoDiccionario(self, peso=peso_elemento):
+        """Vista {v_uid: {w_uid: peso}} para dijkstra.py.
+
+        Las aristas no dirigidas aparecen en los dos sentidos; de varias
+        aristas paralelas se toma la de menor peso.
+        """
+        def construir():
+            adyacencia = {v_uid: {} for v_uid in self._vertices}
+            for e in self._edges.values():
+                a, b, w = e._origin._uid, e._destination._uid, peso(e._element)
+                if w < adyacencia[a].get(b, math.inf):
+                    adyacencia[a][b] = w
+                if not e._directed and w < adyacencia[b].get(a, math.inf):
+                    adyacencia[b][a] = w
+            return MappingProxyType({v_uid: MappingProxyType(vecinos)
+                                     for v_uid, vecinos in adyacencia.items()})
+        return self._vista("diccionario", peso, construir)
+
+    def comoMatriz(self, peso=peso_elemento, infinito=sys.maxsize):
+        """Matriz V×V (tupla de tuplas) para floyd.py y Warshall.py.
+
+        Fila y columna i corresponden a indiceVertices()[0][i]; la diagonal es
+        0 y los pares sin arista valen infinito (sys.maxsize, como INF en ADA8).
+        """
+        def construir():
+            uids, posicion = self.indiceVertices()
+            n = len(uids)
+            filas = [[infinito] * n for _ in range(n)]
+            for i in range(n):
+                filas[i][i] = 0
+            for e in self._edges.values():
+                i, j, w = posicion[e._origin._uid], posicion[e._destination._uid], peso(e._element)
+                if w < filas[i][j]:
+                    filas[i][j] = w
+                if not e._directed and w < filas[j][i]:
+                    filas[j][i] = w
+            return tuple(map(tuple, filas))
+        return self._vista("matriz", (peso, infinito), construir)
+
+    def comoAristas(self, peso=peso_elemento):
+        """Tupla de (i, j, peso) con vértices numerados, para Kruskal.py.
+
+        Sirve como lista de aristas de Kruskal.Graph (kruskal_mst la ordena
+        en una lista nueva sin modificarla):
+            k = Kruskal.Graph(g.numVertices()); k.graph = g.comoAristas()
+        """
+        def construir():
+            uids, posicion = self.indiceVertices()
+            return tuple((posicion[e._origin._uid], posicion[e._destination._uid], peso(e._element))
+                         for e in self._edges.values())
+        return self._vista("aristas", peso, construir)
+
+    # --- Formato binario ---
+
+    # Formato binario: cabecera, tabla de cadenas, vértices y aristas de tamaño fijo
+    _MAGIA = b"GRFB"
+    _CABECERA = struct.Struct("<4sBIII")  # magia, versión, n_cadenas, n_vértices, n_aristas
+    _LONGITUD = struct.Struct("<I")
+    _REGISTRO_ARISTA = struct.Struct("<IIIB")  # origen, destino, elemento, dirigida
+    _NINGUNO = 0xFFFFFFFF  # Índice de cadena para elementos None
+
+    def guardar(self, ruta):
+        """Guarda el grafo en el formato binario compacto (ver cargar_binario).
+
+        Los elementos se guardan como texto (str), salvo None.
+        """
+        cadenas = {}
+
+        def indice(elemento):
+            if elemento is None:
+                return self._NINGUNO
+            return cadenas.setdefault(str(elemento), len(cadenas))
+
+        indice_v = {}
+        elementos_v = []
+        for i, (v_uid, v) in enumerate(self._vertices.items()):
+            indice_v[v_uid] = i
+            elementos_v.append(indice(v._element))
+        registros = bytearray()
+        for e in self._edges.values():
+            registros += self._REGISTRO_ARISTA.pack(indice_v[e._origin._uid],
+                                                    indice_v[e._destination._uid],
+                                                    indice(e._element), e._directed)
+
+        with open(ruta, "wb") as f:
+            f.write(self._CABECERA.pack(self._MAGIA, 1, len(cadenas), len(elementos_v), len(self._edges)))
+            for cadena in cadenas:
+                datos = cadena.encode("utf-8")
+                f.write(self._LONGITUD.pack(len(datos)))
+                f.write(datos)
+            f.write(struct.pack(f"<{len(elementos_v)}I", *elementos_v))
+            f.write(registros)
+
+
+# (Tu clase Graph, Vertex y Edge va aquí - sin cambios)
+class Graph(_ConsultasGrafo):
+    """Clase principal del Grafo."""
+
+    class Vertex:
+        """Clase interna para representar un Vértice."""
+        def __init__(self, element, uid):
+            self._element = element
+            self._uid = uid  # ID único (ej: "v1", "v2")
+            self._incoming = {}  # {edge_uid: Edge}
+            self._outgoing = {}  # {edge_uid: Edge}
+            self._epoca = 0      # Época en que se crearon sus diccionarios de incidencia
+            self._historia = ()  # ((época, incoming, outgoing), ...) que aún usan instantáneas
+
+        def __str__(self):
+            return str(self._element)
+
+    class Edge:
+        """Clase interna para representar una Arista."""
+        def __init__(self, element, uid, origin, destination, directed=False):
+            self._element = element
+            self._uid = uid  # ID único (ej: "e1", "e2")
+            self._origin = origin
+            self._destination = destination
+            self._directed = directed
+
+        def __str__(self):
+            return str(self._element)
+
+        def endpoints(self):
+            """Devuelve la tupla de vértices finales."""
+            return (self._origin, self._destination)
+
+        def opposite(self, v):
+            """Devuelve el vértice opuesto a v en esta arista."""
+            if not isinstance(v, Graph.Vertex):
+                raise TypeError("v debe ser una instancia de Vertex")
+            if self._origin == v:
+                return self._destination
+            elif self._destination == v:
+                return self._origin
+            else:
+                raise ValueError("v no es un vértice incidente de esta arista")
+
+    # --- Diario de cambios ---
+    # datos: el elemento para vértices y (v_uid, w_uid, o, dirigida) para aristas
+    Cambio = namedtuple("Cambio", ["version", "tipo", "uid", "datos"])
+
+    VERTICE_INSERTADO = "inserta_vertice"
+    VERTICE_ELIMINADO = "elimina_vertice"
+    ARISTA_INSERTADA = "inserta_arista"
+    ARISTA_ELIMINADA = "elimina_arista"
+
+    def __init__(self, elementos_unicos=False):
+        """Crea un grafo vacío.
+
+        Si elementos_unicos es verdadero, no se permiten dos vértices con el
+        mismo elemento.
+        """
+        self._vertices = {}  # {vertex_uid: Vertex}
+        self._edges = {}     # {edge_uid: Edge}
+        self._indice = {}    # {element: vertex_uid u OrderedDict de vertex_uid} (ver buscaVertice)
+        self._elementos_unicos = elementos_unicos
+        self._v_counter = 0  # Para IDs únicos de vértices
+        self._e_counter = 0  # Para IDs únicos de aristas
+        self._version = 0    # Aumenta con cada cambio del grafo
+        self._diario = None  # deque acotado de Cambio (desactivado por defecto)
+        self._suscriptores = []
+        self._vistas = {}    # {tipo: (versión, parámetros, vista)} (ver _vista)
+        # --- Instantáneas (copia al escribir) ---
+        self._cerrojo = threading.RLock()  # Lo toman las escrituras y instantanea()
+        self._epoca = 0            # Aumenta con cada instantánea
+        self._instantaneas = weakref.WeakSet()
+        self._capas = []           # _Capa de las instantáneas vivas, de la más antigua a la más reciente
+
+    def _entrada(self, v):
+        return v._incoming
+
+    def _salida(self, v):
+        return v._outgoing
+
+    # --- Instantáneas ---
+
+    class Instantanea(_ConsultasGrafo):
+        """Vista inmutable del grafo tal como estaba al crearla.
+
+        Comparte vértices, aristas y diccionarios de incidencia con el grafo.
+        El grafo anota en la capa de la instantánea el valor anterior de cada
+        clave que modifica y copia solo los diccionarios de incidencia que
+        toca. Se puede consultar y recorrer desde otro hilo mientras el grafo
+        sigue cambiando.
+        """
+        def __init__(self, grafo, capa):
+            self._capa = capa
+            self._vertices = _MapaInstantanea(grafo._vertices, capa, "_vertices", len(grafo._vertices))
+            self._edges = _MapaInstantanea(grafo._edges, capa, "_edges", len(grafo._edges))
+            self._indice = _MapaInstantanea(grafo._indice, capa, "_indice", len(grafo._indice))
+            self._version = grafo._version
+            self._epoca = grafo._epoca
+            self._vistas = {}
+
+        def _incidencia(self, v):
+            """Devuelve los diccionarios (incoming, outgoing) de v en esta instantánea."""
+            # Primero los diccionarios y luego la época: el grafo cambia la
+            # época antes de sustituirlos (ver Graph._mutable).
+            entrada, salida = v._incoming, v._outgoing
+            if v._epoca <= self._epoca:
+                return entrada, salida
+            for epoca, entrada, salida in reversed(v._historia):
+                if epoca <= self._epoca:
+                    return entrada, salida
+            raise RuntimeError(f"No se conservó la incidencia de '{v._uid}' para la instantánea.")
+
+        def _entrada(self, v):
+            return self._incidencia(v)[0]
+
+        def _salida(self, v):
+            return self._incidencia(v)[1]
+
+    def instantanea(self):
+        """Devuelve una instantánea (Graph.Instantanea) del grafo en O(1)."""
+        with self._cerrojo:
+            self._podar_capas()
+            capa = _Capa(self._epoca)
+            foto = self.Instantanea(self, capa)
+            capa.foto = weakref.ref(foto)
+            if self._capas:
+                self._capas[-1].siguiente = capa
+            self._capas.append(capa)
+            self._instantaneas.add(foto)
+            self._epoca += 1
+        return foto
+
+    def _podar_capas(self):
+        """Descarta las capas de instantáneas que ya no existen.
+
+        Lo anotado en una capa descartada pasa a la capa viva anterior, que
+        lo necesita para reconstruir su instantánea.
+        """
+        vivas = []
+        for capa in self._capas:
+            if capa.foto() is not None:
+                if vivas:
+                    vivas[-1].siguiente = capa
+                vivas.append(capa)
+            elif vivas:
+                vivas[-1].absorber(capa)
+        if vivas:
+            vivas[-1].siguiente = None
+        self._capas = vivas
+
+    def _anotar(self, nombre, clave):
+        """Anota el valor actual de clave en el mapa nombre ('_vertices',
+        '_edges' o '_indice') antes de modificarla, si alguna instantánea lo
+        necesita. Devuelve verdadero si es la primera modificación de la
+        clave desde la última instantánea.
+        """
+        if not self._capas:
+            return False
+        if self._capas[-1].foto() is None:
+            self._podar_capas()
+            if not self._capas:
+                return False
+        anotados = getattr(self._capas[-1], nombre)
+        if clave in anotados:
+            return False
+        anotados[clave] = getattr(self, nombre).get(clave, _AUSENTE)
+        return True
+
+    def _mutable(self, v):
+        """Prepara los diccionarios de incidencia de v para modificarlos.
+
+        Si alguna instantánea viva puede estar usándolos, se guardan en la
+        historia de v y v pasa a tener copias propias.
+        """
+        if v._epoca == self._epoca:
+            return
+        vivas = [foto._epoca for foto in self._instantaneas]
+        if not vivas:
+            v._historia = ()
+            v._epoca = self._epoca
+            return
+        # Conservar solo las versiones que alguna instantánea viva necesita
+        historia = v._historia + ((v._epoca, v._incoming, v._outgoing),)
+        conservar = []
+        siguiente = self._epoca
+        for entrada in reversed(historia):
+            if any(entrada[0] <= epoca < siguiente for epoca in vivas):
+                conservar.append(entrada)
+            siguiente = entrada[0]
+        # El orden importa para los lectores de otros hilos: historia, época y
+        # por último los diccionarios nuevos.
+        v._historia = tuple(reversed(conservar))
+        v._epoca = self._epoca
+        v._incoming = dict(v._incoming)
+        v._outgoing = dict(v._outgoing)
+
+    # --- Versiones y diario de cambios ---
+
+    def activarDiario(self, capacidad=10000):
+        """Empieza a guardar los últimos 'capacidad' cambios del grafo."""
+        self._diario = deque(maxlen=capacidad)
+
+    def desactivarDiario(self):
+        """Deja de guardar cambios y descarta los guardados."""
+        self._diario = None
+
+    def cambiosDesde(self, version):
+        """Devuelve la lista de cambios posteriores a 'version'.
+
+        Devuelve None si el diario está desactivado o ya descartó alguno de
+        esos cambios; en ese caso el consumidor debe recalcular todo.
+        """
+        if version == self._version:
+            return []
+        if self._diario is None:
+            return None
+        if not self._diario or self._diario[0].version > version + 1:
+            return None
+        # Los cambios están ordenados por versión: saltamos los ya vistos
+        inicio = version + 1 - self._diario[0].version
+        return list(islice(self._diario, inicio, None))
+
+    def suscribir(self, funcion):
+        """Registra funcion(cambio), que se llamará tras cada cambio del grafo."""
+        self._suscriptores.append(funcion)
+
+    def desuscribir(self, funcion):
+        """Cancela una suscripción hecha con suscribir."""
+        self._suscriptores.remove(funcion)
+
+    def _registrar(self, tipo, uid, datos):
+        """Avanza la versión y publica el cambio en el diario y a los suscriptores."""
+        self._version += 1
+        if self._diario is None and not self._suscriptores:
+            return
+        cambio = self.Cambio(self._version, tipo, uid, datos)
+        if self._diario is not None:
+            self._diario.append(cambio)
+        for funcion in tuple(self._suscriptores):
+            funcion(cambio)
+
     # --- Operaciones para actualizar grafos ---
 
+    def _indexar(self, o, v_uid):
+        """Agrega v_uid al índice de elementos (ValueError si debe ser único y ya existe)."""
+        try:
+            uids = self._indice.get(o)
+        except TypeError:
+            return  # Los elementos no hashables no se indexan
+        if uids is not None and self._elementos_unicos:
+            raise ValueError(f"Ya existe un vértice con el elemento '{o}'.")
+        # El OrderedDict de un elemento se modifica en su lugar; si alguna
+        # instantánea puede estar usándolo, antes se hace una copia propia.
+        copiar = self._anotar("_indice", o)
+        if uids is None:
+            self._indice[o] = v_uid
+        elif isinstance(uids, str):
+            self._indice[o] = OrderedDict.fromkeys((uids, v_uid))
+        else:
+            if copiar:
+                uids = self._indice[o] = OrderedDict(uids)
+            uids[v_uid] = None
+
+    def _desindexar(self, o, v_uid):
+        """Quita v_uid del índice de elementos."""
+        try:
+            uids = self._indice.get(o)
+        except TypeError:
+            return
+        if uids is None or (uids != v_uid if isinstance(uids, str) else v_uid not in uids):
+            return
+        copiar = self._anotar("_indice", o)
+        if isinstance(uids, str):
+            del self._indice[o]
+        elif len(uids) == 2:
+            # Queda un solo vértice con ese elemento
+            self._indice[o] = next(uid for uid in uids if uid != v_uid)
+        else:
+            if copiar:
+                uids = self._indice[o] = OrderedDict(uids)
+            del uids[v_uid]
+
+    @_exclusivo
     def insertaVertice(self, o):
         """Inserta y devuelve un nuevo vértice (su UID) almacenando el objeto o."""
         v_uid = f"v{self._v_counter}"
+        self._indexar(o, v_uid)
         self._v_counter += 1
         nuevo_v = self.Vertex(o, v_uid)
+        nuevo_v._epoca = self._epoca
+        self._anotar("_vertices", v_uid)
         self._vertices[v_uid] = nuevo_v
+        self._registrar(self.VERTICE_INSERTADO, v_uid, o)
         return v_uid
 
+    @_exclusivo
     def insertaArista(self, v_uid, w_uid, o):
         """Inserta y devuelve una arista no dirigida (su UID) entre v y w."""
         v = self._validate_vertex(v_uid)
         w = self._validate_vertex(w_uid)
+        self._mutable(v)
+        self._mutable(w)
         
         e_uid = f"e{self._e_counter}"
         self._e_counter += 1
         
         nueva_e = self.Edge(o, e_uid, v, w, directed=False)
+        self._anotar("_edges", e_uid)
         self._edges[e_uid] = nueva_e
         
         # Al ser no dirigida, es entrante y saliente para ambos
@@ -234,42 +964,79 @@ class Graph:
         w._incoming[e_uid] = nueva_e
         w._outgoing[e_uid] = nueva_e
         
+        self._registrar(self.ARISTA_INSERTADA, e_uid, (v_uid, w_uid, o, False))
         return e_uid
 
+    @_exclusivo
     def insertaAristaDirigida(self, v_uid, w_uid, o):
         """Inserta y devuelve una arista dirigida (su UID) de v a w."""
         v = self._validate_vertex(v_uid)
         w = self._validate_vertex(w_uid)
+        self._mutable(v)
+        self._mutable(w)
         
         e_uid = f"e{self._e_counter}"
         self._e_counter += 1
         
         nueva_e = self.Edge(o, e_uid, v, w, directed=True)
+        self._anotar("_edges", e_uid)
         self._edges[e_uid] = nueva_e
         
         # Al ser dirigida, es saliente de v y entrante a w
         v._outgoing[e_uid] = nueva_e
         w._incoming[e_uid] = nueva_e
         
+        self._registrar(self.ARISTA_INSERTADA, e_uid, (v_uid, w_uid, o, True))
         return e_uid
 
+    @staticmethod
+    def _datos_arista(edge):
+        """Datos de una arista tal como se publican en el diario de cambios."""
+        return (edge._origin._uid, edge._destination._uid, edge._element, edge._directed)
+
     def eliminaVertice(self, v_uid):
         """Elimina vértice v y todas las aristas incidentes."""
-        v = self._validate_vertex(v_uid)
-        
-        # Eliminar todas las aristas incidentes (copiamos keys para evitar error de tamaño)
-        aristas_a_eliminar = list(self.aristasIncidentes(v_uid))
-        for e_uid in aristas_a_eliminar:
-            self.eliminaArista(e_uid)
-            
-        # Eliminar el vértice
-        del self._vertices[v_uid]
+        self.eliminaVertices((v_uid,))
 
+    @_exclusivo
+    def eliminaVertices(self, v_uids):
+        """Elimina en bloque los vértices dados y todas sus aristas incidentes.
+
+        Se validan todos antes de modificar el grafo. Las aristas se quitan
+        solo de los extremos que sobreviven.
+        """
+        a_eliminar = {v_uid: self._validate_vertex(v_uid) for v_uid in v_uids}
+
+        # Reunir una sola vez las aristas incidentes a cualquiera de los vértices
+        aristas = {}
+        for v in a_eliminar.values():
+            aristas.update(v._incoming)
+            aristas.update(v._outgoing)
+
+        for e_uid, edge in aristas.items():
+            for extremo in (edge._origin, edge._destination):
+                if extremo._uid not in a_eliminar:
+                    self._mutable(extremo)
+                    extremo._incoming.pop(e_uid, None)
+                    extremo._outgoing.pop(e_uid, None)
+            self._anotar("_edges", e_uid)
+            del self._edges[e_uid]
+            self._registrar(self.ARISTA_ELIMINADA, e_uid, self._datos_arista(edge))
+
+        for v_uid, v in a_eliminar.items():
+            self._anotar("_vertices", v_uid)
+            del self._vertices[v_uid]
+            self._desindexar(v._element, v_uid)
+            self._registrar(self.VERTICE_ELIMINADO, v_uid, v._element)
+
+    @_exclusivo
     def eliminaArista(self, e_uid):
         """Elimina arista e."""
         e = self._validate_edge(e_uid)
         
         v1, v2 = e.endpoints()
+        self._mutable(v1)
+        self._mutable(v2)
         
         # Quitarla de los vértices
         v1._incoming.pop(e_uid, None)
@@ -278,676 +1045,193 @@ class Graph:
         v2._outgoing.pop(e_uid, None)
         
         # Quitarla del grafo
+        self._anotar("_edges", e_uid)
         del self._edges[e_uid]
-
-
-# --- 2. CLASE DE LA APLICACIÓN GUI (CUSTOMTKINTER) ---
-
-class GraphApp(ctk.CTk):
-    
-    VERTEX_RADIUS = 20
-    NODE_COLOR = "#2b2b2b"
-    NODE_HIGHLIGHT_COLOR = "#00AFFF" # Azul
-    NODE_SECOND_COLOR = "#FFAF00" # Naranja
-    EDGE_COLOR = "#303030" # Color más oscuro para mejor contraste
-    EDGE_HIGHLIGHT_COLOR = "#00AFFF"
-    TEXT_COLOR = "#FFFFFF"
-
-    def __init__(self):
-        super().__init__()
-        
-        self.title("Visualizador de Grafos sobre Mapa")
-        self.geometry("1200x800")
-        ctk.set_appearance_mode("Dark")
-        
-        self.graph = Graph()
-        self.vertex_coords = {}  # {v_uid: (x, y)}
-        self.vertex_elements = {} # {element: v_uid}
-        
-        self._drag_data = {"x": 0, "y": 0, "item": None}
-
-        # --- Variables para la imagen de fondo ---
-        self.bg_image_original = None
-        self.bg_image_tk = None
-        self.bg_canvas_item = None
-
-        # --- Layout Principal ---
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_columnconfigure(1, weight=3)
-        self.grid_rowconfigure(0, weight=1)
-        
-        # --- Frame de Controles (Izquierda) ---
-        self.control_frame = ctk.CTkScrollableFrame(self, width=350)
-        self.control_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        
-        # --- Canvas de Dibujo (Derecha) ---
-        self.canvas_frame = ctk.CTkFrame(self)
-        self.canvas_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        
-        # Quitamos el color de fondo, la imagen lo reemplazará
-        self.canvas = ctk.CTkCanvas(self.canvas_frame, highlightthickness=0)
-        self.canvas.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # --- Etiqueta de Resultados (Abajo) ---
-        self.result_label = ctk.CTkLabel(self, text="Bienvenido al Visualizador de Grafos",
-                                         font=ctk.CTkFont(size=14, weight="bold"))
-        self.result_label.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
-
-        # --- Poblar Controles ---
-        self.setup_controls()
-        
-        # --- Bindeo para Drag-and-Drop ---
-        self.canvas.tag_bind("vertex", "<ButtonPress-1>", self.on_vertex_press)
-        self.canvas.tag_bind("vertex", "<B1-Motion>", self.on_vertex_drag)
-
-        # --- ¡NUEVO! ---
-        # --- Cargar la imagen de fondo y bindeo de redimensionar ---
+        self._registrar(self.ARISTA_ELIMINADA, e_uid, self._datos_arista(e))
+
+    @_exclusivo
+    def eliminaAristas(self, e_uids):
+        """Elimina en bloque las aristas dadas (se validan todas antes de borrar)."""
+        a_eliminar = {e_uid: self._validate_edge(e_uid) for e_uid in e_uids}
+        for e_uid, edge in a_eliminar.items():
+            v1, v2 = edge._origin, edge._destination
+            self._mutable(v1)
+            self._mutable(v2)
+            v1._outgoing.pop(e_uid, None)
+            v2._incoming.pop(e_uid, None)
+            if not edge._directed:
+                v1._incoming.pop(e_uid, None)
+                v2._outgoing.pop(e_uid, None)
+            self._anotar("_edges", e_uid)
+            del self._edges[e_uid]
+            self._registrar(self.ARISTA_ELIMINADA, e_uid, self._datos_arista(edge))
+
+    # --- Carga masiva y formatos de archivo ---
+
+    @_exclusivo
+    def _agregar_aristas(self, aristas):
+        """Inserta aristas (Vertex, Vertex, o, dirigida) sin validar. Devuelve cuántas."""
+        edges = self._edges
+        Edge = self.Edge
+        inicio = contador = self._e_counter
+        epoca = self._epoca
+        notificar = self._diario is not None or bool(self._suscriptores)
+        anotar = bool(self._capas)
+        # Cada arista forma ciclos de referencias con sus vértices; pausamos el
+        # recolector cíclico mientras se crean en bloque para no recorrerlas una y otra vez.
+        gc_activo = gc.isenabled()
+        gc.disable()
         try:
-            # Abrir la imagen original
-            self.bg_image_original = Image.open("mapa_fondo.png")
-            
-            # Crear el item de imagen en el canvas
-            self.bg_canvas_item = self.canvas.create_image(0, 0, anchor="nw")
-            
-            # Bindeo para que la imagen se redimensione con la ventana
-            self.canvas.bind("<Configure>", self.on_canvas_resize)
-            
-        except FileNotFoundError:
-            self.show_result("ADVERTENCIA: No se encontró 'mapa_fondo.png'. Se usará fondo gris.", is_error=True)
-            self.canvas.configure(bg="#1c1c1c") # Fondo de fallback
-            self.bg_image_original = None
-        except Exception as e:
-            self.show_result(f"Error cargando imagen: {e}", is_error=True)
-            self.canvas.configure(bg="#1c1c1c")
-            self.bg_image_original = None
-        # --- FIN NUEVO ---
-
-        # --- Cargar un grafo de ejemplo ---
-        self.load_sample_graph()
-        self.draw_graph()
-
-    # --- ¡NUEVO! ---
-    def on_canvas_resize(self, event):
-        """Se activa cuando el canvas cambia de tamaño. Redimensiona la imagen de fondo."""
-        if not self.bg_image_original:
-            return # No hay imagen para redimensionar
-
-        width = event.width
-        height = event.height
-        
-        # Evitar redimensionar a 0x0 al inicio
-        if width == 0 or height == 0:
-            return
-
-        # Redimensionar la imagen original (alta calidad)
-        resized_image = self.bg_image_original.resize((width, height), Image.Resampling.LANCZOS)
-        
-        # Actualizar la imagen de PhotoImage (guardamos referencia)
-        self.bg_image_tk = ImageTk.PhotoImage(resized_image)
-        
-        # Actualizar el item del canvas
-        self.canvas.itemconfig(self.bg_canvas_item, image=self.bg_image_tk)
-        self.canvas.coords(self.bg_canvas_item, 0, 0)
-        self.canvas.lower(self.bg_canvas_item) # Asegurar que esté al fondo
-
-    # --- Lógica de Dibujo ---
-
-    def draw_graph(self, highlights={}):
-        """Dibuja el grafo completo en el canvas.
-        highlights = {"vertices": {v_uid: color}, "edges": {e_uid: color}}
+            for v, w, o, dirigida in aristas:
+                if v._epoca != epoca:
+                    self._mutable(v)
+                if w._epoca != epoca:
+                    self._mutable(w)
+                e_uid = f"e{contador}"
+                contador += 1
+                nueva_e = Edge(o, e_uid, v, w, directed=dirigida)
+                if anotar:
+                    self._anotar("_edges", e_uid)
+                edges[e_uid] = nueva_e
+                v._outgoing[e_uid] = nueva_e
+                w._incoming[e_uid] = nueva_e
+                if not dirigida:
+                    v._incoming[e_uid] = nueva_e
+                    w._outgoing[e_uid] = nueva_e
+                if notificar:
+                    self._e_counter = contador
+                    self._registrar(self.ARISTA_INSERTADA, e_uid, (v._uid, w._uid, o, dirigida))
+        finally:
+            if gc_activo:
+                gc.enable()
+            insertadas = contador - inicio
+            self._e_counter = contador
+            if not notificar:
+                self._version += insertadas
+        return insertadas
+
+    def _resolver_aristas(self, aristas, dirigida):
+        """Traduce tuplas (u, w[, o]) de elementos a vértices, creando los que falten.
+
+        Cada elemento distinto se busca en el índice una sola vez por llamada
+        (por bloque en cargar_csv): las demás apariciones salen de una caché
+        local {elemento: Vertex}. Los elementos no hashables no se indexan, así
+        que cada aparición crea su propio vértice, como con buscaVertice.
         """
-        
-        # --- ¡MODIFICADO! ---
-        # Ya no usamos self.canvas.delete("all") para no borrar el fondo
-        self.canvas.delete("edge")
-        self.canvas.delete("vertex")
-        self.canvas.delete("vertex_text")
-        # --- FIN MODIFICADO ---
-        
-        highlight_v = highlights.get("vertices", {})
-        highlight_e = highlights.get("edges", {})
-
-        # 1. Dibujar Aristas
-        for e_uid, edge in self.graph._edges.items():
-            v1, v2 = edge.endpoints()
-            # Validar que ambas coordenadas existen antes de dibujar
-            if v1._uid not in self.vertex_coords or v2._uid not in self.vertex_coords:
-                continue
-            
-            x1, y1 = self.vertex_coords[v1._uid]
-            x2, y2 = self.vertex_coords[v2._uid]
-            
-            color = highlight_e.get(e_uid, self.EDGE_COLOR)
-            width = 3 if e_uid in highlight_e else 1.5
-            
-            # Usamos tags para poder borrarlos luego
-            line_tags = ("edge", e_uid)
-            self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width, tags=line_tags)
-            
-            if edge._directed:
-                # El tag 'edge' también se aplica a la flecha
-                self._draw_arrow(x1, y1, x2, y2, color, line_tags)
-
-        # 2. Dibujar Vértices (encima de las aristas)
-        for v_uid, vertex in self.graph._vertices.items():
-            if v_uid not in self.vertex_coords:
-                continue # No dibujar si no tiene coords
-                
-            x, y = self.vertex_coords[v_uid]
-            
-            color = highlight_v.get(v_uid, self.NODE_COLOR)
-            
-            self.canvas.create_oval(
-                x - self.VERTEX_RADIUS, y - self.VERTEX_RADIUS,
-                x + self.VERTEX_RADIUS, y + self.VERTEX_RADIUS,
-                fill=color, outline=color, tags=("vertex", "vertex_" + v_uid, v_uid)
-            )
-            self.canvas.create_text(
-                x, y, text=str(vertex._element), fill=self.TEXT_COLOR,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                tags=("vertex_text", "text_" + v_uid, v_uid)
-            )
-            
-    # --- ¡NUEVO! ---
-    # Modificado para aceptar tags
-    def _draw_arrow(self, x1, y1, x2, y2, color, tags):
-        """Dibuja una flecha al final de una línea."""
-        size = 15
-        try:
-            angle = math.atan2(y2 - y1, x2 - x1)
-        except ValueError:
-            angle = 0 # Evitar crash si (x1,y1) == (x2,y2)
-        
-        # Calcular el punto final en el borde del círculo
-        end_x = x2 - self.VERTEX_RADIUS * math.cos(angle)
-        end_y = y2 - self.VERTEX_RADIUS * math.sin(angle)
-        
-        p1_x = end_x - size * math.cos(angle - math.pi / 6)
-        p1_y = end_y - size * math.sin(angle - math.pi / 6)
-        p2_x = end_x - size * math.cos(angle + math.pi / 6)
-        p2_y = end_y - size * math.sin(angle + math.pi / 6)
-        
-        self.canvas.create_polygon(end_x, end_y, p1_x, p1_y, p2_x, p2_y, 
-                                   fill=color, tags=tags)
-    # --- FIN NUEVO ---
-
-
-    # --- EL RESTO DE TU CÓDIGO ---
-    # (setup_controls, load_sample_graph, Handlers de Drag-and-Drop,
-    #  Handlers de Botones, etc. van aquí SIN CAMBIOS)
-    def setup_controls(self):
-        """Crea todos los botones y campos de entrada."""
-        frame = self.control_frame
-        row = 0
-
-        # --- Entradas ---
-        ctk.CTkLabel(frame, text="Parámetros:", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(5, 5), sticky="w")
-        row += 1
-        
-        ctk.CTkLabel(frame, text="Vértice v:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
-        self.entry_v = ctk.CTkEntry(frame, placeholder_text="Ej: A")
-        self.entry_v.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
-        row += 1
-
-        ctk.CTkLabel(frame, text="Vértice w:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
-        self.entry_w = ctk.CTkEntry(frame, placeholder_text="Ej: B")
-        self.entry_w.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
-        row += 1
-
-        ctk.CTkLabel(frame, text="Arista e:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
-        self.entry_e = ctk.CTkEntry(frame, placeholder_text="UID (ej: e0)")
-        self.entry_e.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
-        row += 1
-        
-        ctk.CTkLabel(frame, text="Objeto o:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
-        self.entry_o = ctk.CTkEntry(frame, placeholder_text="Dato (ej: A)")
-        self.entry_o.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
-        row += 1
-        
-        # --- Separador ---
-        ctk.CTkLabel(frame, text="").grid(row=row, column=0)
-        row += 1
-
-        # --- Operaciones Generales ---
-        ctk.CTkLabel(frame, text="Operaciones Generales", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5), sticky="w")
-        row += 1
-        
-        ctk.CTkButton(frame, text="numVertices()", command=self.on_numVertices).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="numAristas()", command=self.on_numAristas).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-        
-        ctk.CTkButton(frame, text="vertices()", command=self.on_vertices).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="aristas()", command=self.on_aristas).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-        
-        ctk.CTkButton(frame, text="grado(v)", command=self.on_grado).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="verticesAdyacentes(v)", command=self.on_verticesAdyacentes).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-
-        ctk.CTkButton(frame, text="aristasIncidentes(v)", command=self.on_aristasIncidentes).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="verticesFinales(e)", command=self.on_verticesFinales).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-        
-        ctk.CTkButton(frame, text="opuesto(v, e)", command=self.on_opuesto).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="esAdyacente(v, w)", command=self.on_esAdyacente).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-
-        # --- Operaciones Dirigidas ---
-        ctk.CTkLabel(frame, text="Operaciones Dirigidas", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5), sticky="w")
-        row += 1
-        
-        ctk.CTkButton(frame, text="aristasDirigidas()", command=self.on_aristasDirigidas).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="aristasNodirigidas()", command=self.on_aristasNodirigidas).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-        ctk.CTkButton(frame, text="gradoEnt(v)", command=self.on_gradoEnt).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="gradoSalida(v)", command=self.on_gradoSalida).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-
-        # --- Operaciones de Actualización ---
-        ctk.CTkLabel(frame, text="Operaciones de Actualización", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5), sticky="w")
-        row += 1
-        
-        ctk.CTkButton(frame, text="insertaVertice(o)", command=self.on_insertaVertice, fg_color="green").grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="eliminaVertice(v)", command=self.on_eliminaVertice, fg_color="red").grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-
-        ctk.CTkButton(frame, text="insertaArista(v,w,o)", command=self.on_insertaArista, fg_color="green").grid(row=row, column=0, padx=5, pady=3, sticky="ew")
-        ctk.CTkButton(frame, text="eliminaArista(e)", command=self.on_eliminaArista, fg_color="red").grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        row += 1
-
-        ctk.CTkButton(frame, text="insertaAristaDirigida(v,w,o)", command=self.on_insertaAristaDirigida, fg_color="green").grid(row=row, column=0, columnspan=2, padx=5, pady=3, sticky="ew")
-        row += 1
-        
-        # --- Control ---
-        ctk.CTkLabel(frame, text="").grid(row=row, column=0)
-        row += 1
-        ctk.CTkButton(frame, text="Limpiar Grafo", command=self.on_clear_graph, fg_color="#D35400").grid(row=row, column=0, columnspan=2, padx=5, pady=10, sticky="ew")
-        row += 1
-
-
-    def load_sample_graph(self):
-        """Carga un grafo simple para demostración."""
-        self.on_clear_graph()
-        try:
-            # Estas coordenadas ahora se dibujarán SOBRE el mapa
-            vA = self.graph.insertaVertice("A")
-            vB = self.graph.insertaVertice("B")
-            vC = self.graph.insertaVertice("C")
-            vD = self.graph.insertaVertice("D")
-            
-            self.vertex_coords[vA] = (100, 100)
-            self.vertex_coords[vB] = (300, 150)
-            self.vertex_coords[vC] = (100, 300)
-            self.vertex_coords[vD] = (400, 350)
-            
-            self.vertex_elements = {"A": vA, "B": vB, "C": vC, "D": vD}
-
-            self.graph.insertaArista(vA, vB, "e_AB")
-            self.graph.insertaArista(vA, vC, "e_AC")
-            self.graph.insertaAristaDirigida(vB, vC, "e_BC")
-            self.graph.insertaAristaDirigida(vC, vD, "e_CD")
-        except Exception as e:
-            self.show_result(f"Error cargando grafo: {e}", is_error=True)
-            
-    # --- Handlers de Drag-and-Drop ---
-
-    def on_vertex_press(self, event):
-        """Inicia el arrastre de un vértice."""
-        v_tag = self.canvas.find_closest(event.x, event.y)[0]
-        tags = self.canvas.gettags(v_tag)
-        v_uid = None
-        for t in tags:
-            if t.startswith("v"): 
-                v_uid = t
-                break
-        
-        if v_uid and v_uid in self.vertex_coords:
-            self._drag_data["item"] = v_uid
-            self._drag_data["x"] = event.x
-            self._drag_data["y"] = event.y
-
-    def on_vertex_drag(self, event):
-        """Mueve el vértice mientras se arrastra."""
-        if self._drag_data["item"]:
-            v_uid = self._drag_data["item"]
-            dx = event.x - self._drag_data["x"]
-            dy = event.y - self._drag_data["y"]
-            
-            self.canvas.move("vertex_" + v_uid, dx, dy)
-            self.canvas.move("text_" + v_uid, dx, dy)
-            
-            self.vertex_coords[v_uid] = (self.vertex_coords[v_uid][0] + dx, 
-                                         self.vertex_coords[v_uid][1] + dy)
-            
-            self._drag_data["x"] = event.x
-            self._drag_data["y"] = event.y
-            
-            # Redibujamos solo el grafo, el fondo no se mueve
-            self.draw_graph()
-
-    # --- Handlers de Botones (Visualización) ---
-    
-    def _get_vertex_uid_from_entry(self, entry_widget):
-        """Helper para obtener UID desde el elemento en la entrada."""
-        element = entry_widget.get()
-        if not element:
-            self.show_result("Error: El campo del vértice está vacío.", is_error=True)
-            return None
-        
-        v_uid = self.vertex_elements.get(element)
-        if not v_uid:
-            self.show_result(f"Error: Vértice '{element}' no encontrado.", is_error=True)
-            return None
-        return v_uid
-    
-    def _reset_visual(self):
-        """Resetea el grafo a su estado normal después de una visualización."""
-        self.draw_graph()
-        
-    def show_result(self, message, is_error=False):
-        """Muestra un mensaje en la etiqueta de resultados."""
-        if is_error:
-            self.result_label.configure(text=message, text_color="#FF5555")
-        else:
-            self.result_label.configure(text=message, text_color="white")
-
-    # --- IMPLEMENTADOS CON VISUALIZACIÓN ---
-
-    def on_insertaVertice(self):
-        """Visualiza la inserción de un vértice."""
-        element = self.entry_o.get()
-        if not element:
-            self.show_result("Error: Debe ingresar un 'Objeto o' (nombre) para el vértice.", is_error=True)
-            return
-        if element in self.vertex_elements:
-            self.show_result(f"Error: El vértice '{element}' ya existe.", is_error=True)
-            return
-
-        try:
-            # Colocar en un lugar aleatorio
-            x = random.randint(self.VERTEX_RADIUS + 10, self.canvas.winfo_width() - self.VERTEX_RADIUS - 10)
-            y = random.randint(self.VERTEX_RADIUS + 10, self.canvas.winfo_height() - self.VERTEX_RADIUS - 10)
-            
-            v_uid = self.graph.insertaVertice(element)
-            self.vertex_coords[v_uid] = (x, y)
-            self.vertex_elements[element] = v_uid
-            
-            self.draw_graph(highlights={"vertices": {v_uid: "green"}})
-            self.show_result(f"Vértice '{element}' (UID: {v_uid}) insertado.")
-            
-            self.after(2000, self._reset_visual)
-            
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    def on_insertaArista(self, dirigida=False):
-        """Visualiza la inserción de una arista (dirigida o no)."""
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        w_uid = self._get_vertex_uid_from_entry(self.entry_w)
-        o = self.entry_o.get() or None # 'None' si está vacío
-        
-        if not v_uid or not w_uid:
-            return 
-            
-        try:
-            if dirigida:
-                e_uid = self.graph.insertaAristaDirigida(v_uid, w_uid, o)
-                msg = f"Arista dirigida '{o or e_uid}' insertada de {self.entry_v.get()} a {self.entry_w.get()}."
-            else:
-                e_uid = self.graph.insertaArista(v_uid, w_uid, o)
-                msg = f"Arista no dirigida '{o or e_uid}' insertada entre {self.entry_v.get()} y {self.entry_w.get()}."
-
-            self.draw_graph(highlights={"edges": {e_uid: "green"}})
-            self.show_result(msg)
-            self.after(2000, self._reset_visual)
+        vertices = self._vertices
+        buscar = self.buscaVertice
+        insertar = self.insertaVertice
+        cache = {}
+
+        def resolver(elemento):
+            v_uid = buscar(elemento)
+            if v_uid is None:
+                v_uid = insertar(elemento)
+            cache[elemento] = v = vertices[v_uid]
+            return v
+
+        for arista in aristas:
+            u, w = arista[0], arista[1]
+            try:
+                v_u = cache[u]
+            except KeyError:
+                v_u = resolver(u)
+            except TypeError:
+                v_u = vertices[insertar(u)]
+            try:
+                v_w = cache[w]
+            except KeyError:
+                v_w = resolver(w)
+            except TypeError:
+                v_w = vertices[insertar(w)]
+            yield v_u, v_w, arista[2] if len(arista) > 2 else None, dirigida
+
+    def cargar_aristas(self, aristas, dirigida=False):
+        """Inserta en bloque las aristas dadas como tuplas (u, w) o (u, w, o).
+
+        u y w son los elementos de los vértices: se reutiliza el primer vértice
+        con ese elemento y se crean los que no existan. Devuelve cuántas aristas
+        se insertaron.
+        """
+        return self._agregar_aristas(self._resolver_aristas(aristas, dirigida))
 
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
+    def cargar_csv(self, ruta, delimitador=None, dirigida=False, encabezado=False, tam_bloque=65536):
+        """Carga una lista de aristas 'u,w[,o]' desde un CSV (o TSV) por bloques.
 
-    def on_insertaAristaDirigida(self):
-        self.on_insertaArista(dirigida=True)
+        Si no se indica delimitador, se usa tabulador para archivos .tsv y coma
+        en otro caso. Devuelve el número de aristas insertadas.
+        """
+        if delimitador is None:
+            delimitador = "\t" if ruta.lower().endswith(".tsv") else ","
+
+        total = 0
+        with open(ruta, newline="", encoding="utf-8") as f:
+            filas = (fila for fila in csv.reader(f, delimiter=delimitador) if fila)
+            if encabezado:
+                next(filas, None)
+            while True:
+                bloque = list(islice(filas, tam_bloque))
+                if not bloque:
+                    break
+                for fila in bloque:
+                    if len(fila) < 2:
+                        raise ValueError(f"Fila inválida en '{ruta}': {fila}")
+                total += self._agregar_aristas(self._resolver_aristas(bloque, dirigida))
+        return total
+
+    def cargar_binario(self, ruta, tam_bloque=65536):
+        """Agrega al grafo los vértices y aristas de un archivo creado con guardar.
+
+        Las aristas se leen por bloques de tam_bloque registros. Devuelve el
+        número de aristas insertadas.
+        """
+        with open(ruta, "rb") as f:
+            datos = f.read(self._CABECERA.size)
+            if len(datos) < self._CABECERA.size:
+                raise ValueError(f"'{ruta}' no es un archivo de grafo válido.")
+            magia, version, n_cadenas, n_vertices, n_aristas = self._CABECERA.unpack(datos)
+            if magia != self._MAGIA or version != 1:
+                raise ValueError(f"'{ruta}' no es un archivo de grafo válido.")
+
+            cadenas = []
+            for _ in range(n_cadenas):
+                (longitud,) = self._LONGITUD.unpack(f.read(self._LONGITUD.size))
+                cadenas.append(f.read(longitud).decode("utf-8"))
+
+            def elemento(i):
+                return None if i == self._NINGUNO else cadenas[i]
+
+            nuevos = []
+            for (i,) in struct.iter_unpack("<I", f.read(4 * n_vertices)):
+                nuevos.append(self._vertices[self.insertaVertice(elemento(i))])
+
+            total = 0
+            tam_registro = self._REGISTRO_ARISTA.size
+            while total < n_aristas:
+                n = min(tam_bloque, n_aristas - total)
+                datos = f.read(n * tam_registro)
+                if len(datos) != n * tam_registro:
+                    raise ValueError(f"'{ruta}' está truncado.")
+                total += self._agregar_aristas(
+                    (nuevos[o], nuevos[d], elemento(i), bool(dirigida))
+                    for o, d, i, dirigida in self._REGISTRO_ARISTA.iter_unpack(datos)
+                )
+        return total
 
-    def on_eliminaVertice(self):
-        """Visualiza la eliminación de un vértice."""
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        if not v_uid:
-            return
 
-        try:
-            element = self.entry_v.get()
-            aristas_a_eliminar = self.graph.aristasIncidentes(v_uid)
-            
-            h_v = {v_uid: "red"}
-            h_e = {e_uid: "red" for e_uid in aristas_a_eliminar}
-            
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            self.show_result(f"Eliminando vértice '{element}' y {len(aristas_a_eliminar)} aristas incidentes...")
-            
-            def do_delete():
-                self.graph.eliminaVertice(v_uid)
-                # También eliminar de nuestros diccionarios de GUI
-                if v_uid in self.vertex_coords:
-                    del self.vertex_coords[v_uid]
-                if element in self.vertex_elements:
-                    del self.vertex_elements[element]
-                    
-                self.draw_graph()
-                self.show_result(f"Vértice '{element}' eliminado.")
-                
-            self.after(2000, do_delete)
-
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    def on_eliminaArista(self):
-        e_uid = self.entry_e.get()
-        if not e_uid:
-            self.show_result("Error: Debe ingresar un 'UID de Arista e'.", is_error=True)
-            return
-            
-        try:
-            self.graph._validate_edge(e_uid)
-            
-            self.draw_graph(highlights={"edges": {e_uid: "red"}})
-            self.show_result(f"Eliminando arista '{e_uid}'...")
-            
-            def do_delete():
-                self.graph.eliminaArista(e_uid)
-                self.draw_graph()
-                self.show_result(f"Arista '{e_uid}' eliminada.")
-                
-            self.after(2000, do_delete)
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-
-    def on_grado(self):
-        """Visualiza las aristas que contribuyen al grado de v."""
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        if not v_uid:
-            return
-        
-        try:
-            grado = self.graph.grado(v_uid)
-            aristas_incidentes = self.graph.aristasIncidentes(v_uid)
-            
-            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
-            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas_incidentes}
-            
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            self.show_result(f"grado({self.entry_v.get()}) = {grado}")
-            self.after(3000, self._reset_visual)
-            
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    def on_verticesAdyacentes(self):
-        """Visualiza los vértices adyacentes a v."""
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        if not v_uid:
-            return
+# --- 2. CLASE DE LA APLICACIÓN GUI (CUSTOMTKINTER) ---
+# Se importa bajo demanda (grafos.GraphApp) para no cargar el toolkit gráfico.
 
-        try:
-            adyacentes_uids = self.graph.verticesAdyacentes(v_uid)
-            aristas_incidentes = self.graph.aristasIncidentes(v_uid)
-            
-            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
-            for uid in adyacentes_uids:
-                h_v[uid] = self.NODE_SECOND_COLOR
-                
-            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas_incidentes}
-            
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            
-            adyacentes_elements = [self.graph.get_vertex_element(uid) for uid in adyacentes_uids]
-            self.show_result(f"verticesAdyacentes({self.entry_v.get()}) = {adyacentes_elements}")
-            self.after(3000, self._reset_visual)
-
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    # --- STUBS (Sin visualización, solo muestran resultado) ---
-    
-    def on_numVertices(self):
-        num = self.graph.numVertices()
-        self.show_result(f"numVertices() = {num}")
-        self.draw_graph(highlights={"vertices": {v_uid: self.NODE_HIGHLIGHT_COLOR for v_uid in self.graph.vertices()}})
-        self.after(2000, self._reset_visual)
-
-    def on_numAristas(self):
-        num = self.graph.numAristas()
-        self.show_result(f"numAristas() = {num}")
-        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in self.graph.aristas()}})
-        self.after(2000, self._reset_visual)
-
-    def on_vertices(self):
-        v_list = self.graph.vertices()
-        self.show_result(f"vertices() = {v_list}")
-        self.draw_graph(highlights={"vertices": {v_uid: self.NODE_HIGHLIGHT_COLOR for v_uid in v_list}})
-        self.after(2000, self._reset_visual)
-
-    def on_aristas(self):
-        e_list = self.graph.aristas()
-        self.show_result(f"aristas() = {e_list}")
-        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in e_list}})
-        self.after(2000, self._reset_visual)
-
-    def on_aristasIncidentes(self):
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        if not v_uid: return
-        try:
-            aristas = self.graph.aristasIncidentes(v_uid)
-            self.show_result(f"aristasIncidentes({self.entry_v.get()}) = {aristas}")
-            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
-            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            self.after(3000, self._reset_visual)
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    def on_verticesFinales(self):
-        e_uid = self.entry_e.get()
-        if not e_uid:
-            self.show_result("Error: Debe ingresar un 'UID de Arista e'.", is_error=True)
-            return
-        try:
-            v1, v2 = self.graph.verticesFinales(e_uid)
-            v1_elem = self.graph.get_vertex_element(v1)
-            v2_elem = self.graph.get_vertex_element(v2)
-            self.show_result(f"verticesFinales({e_uid}) = ({v1_elem}, {v2_elem})")
-            h_v = {v1: self.NODE_SECOND_COLOR, v2: self.NODE_SECOND_COLOR}
-            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR}
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            self.after(3000, self._reset_visual)
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    def on_opuesto(self):
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        e_uid = self.entry_e.get()
-        if not v_uid or not e_uid: return
-        try:
-            op_uid = self.graph.opuesto(v_uid, e_uid)
-            op_elem = self.graph.get_vertex_element(op_uid)
-            self.show_result(f"opuesto({self.entry_v.get()}, {e_uid}) = {op_elem} (UID: {op_uid})")
-            
-            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR, op_uid: self.NODE_SECOND_COLOR}
-            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR}
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            self.after(3000, self._reset_visual)
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    def on_esAdyacente(self):
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        w_uid = self._get_vertex_uid_from_entry(self.entry_w)
-        if not v_uid or not w_uid: return
-        try:
-            resultado = self.graph.esAdyacente(v_uid, w_uid)
-            self.show_result(f"esAdyacente({self.entry_v.get()}, {self.entry_w.get()}) = {resultado}")
-            
-            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR, w_uid: self.NODE_HIGHLIGHT_COLOR}
-            self.draw_graph(highlights={"vertices": h_v})
-            self.after(3000, self._reset_visual)
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    # --- Handlers para Métodos Dirigidos (Stubs) ---
-    def on_aristasDirigidas(self):
-        aristas = self.graph.aristasDirigidas()
-        self.show_result(f"aristasDirigidas() = {aristas}")
-        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}})
-        self.after(2000, self._reset_visual)
-
-    def on_aristasNodirigidas(self):
-        aristas = self.graph.aristasNodirigidas()
-        self.show_result(f"aristasNodirigidas() = {aristas}")
-        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}})
-        self.after(2000, self._reset_visual)
-
-    def on_gradoEnt(self):
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        if not v_uid: return
-        try:
-            grado = self.graph.gradoEnt(v_uid)
-            aristas = self.graph.aristasIncidentesEnt(v_uid)
-            self.show_result(f"gradoEnt({self.entry_v.get()}) = {grado}")
-            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
-            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in arISTAS}
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            self.after(3000, self._reset_visual)
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-    def on_gradoSalida(self):
-        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
-        if not v_uid: return
-        try:
-            grado = self.graph.gradoSalida(v_uid)
-            aristas = self.graph.aristasIncidentesSal(v_uid)
-            self.show_result(f"gradoSalida({self.entry_v.get()}) = {grado}")
-            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
-            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}
-            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
-            self.after(3000, self._reset_visual)
-        except Exception as e:
-            self.show_result(f"Error: {e}", is_error=True)
-
-
-    # --- Otros ---
-    
-    def on_clear_graph(self):
-        """Limpia el grafo y el canvas."""
-        self.graph = Graph()
-        self.vertex_coords = {}
-        self.vertex_elements = {}
-        # No borramos el fondo, solo los items del grafo
-        self.draw_graph()
-        self.show_result("Grafo limpiado.")
+def __getattr__(nombre):
+    if nombre == "GraphApp":
+        from visualizador import GraphApp
+        return GraphApp
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 
 # --- 3. EJECUCIÓN DE LA APP ---
 
 if __name__ == "__main__":
+    from visualizador import GraphApp
     app = GraphApp()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()
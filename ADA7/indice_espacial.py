@@ -0,0 +1,112 @@
+import math
+
+# --- ÍNDICE ESPACIAL DE REJILLA UNIFORME ---
+# Cada clave (UID de vértice o arista) se guarda en las celdas que toca: un
+# punto en una sola celda y un segmento en las celdas que atraviesa. Las
+# consultas por rectángulo solo miran las celdas que lo cubren.
+
+
+class RejillaEspacial:
+    """Índice espacial de puntos y segmentos sobre una rejilla uniforme."""
+
+    def __init__(self, tam_celda=64.0):
+        self.tam = tam_celda
+        self._celdas = {}  # {(cx, cy): set de claves}
+        self._claves = {}  # {clave: (celdas, geometría)}
+
+    def __len__(self):
+        return len(self._claves)
+
+    def __contains__(self, clave):
+        return clave in self._claves
+
+    def _celda(self, x, y):
+        return (math.floor(x / self.tam), math.floor(y / self.tam))
+
+    def _celdas_segmento(self, x0, y0, x1, y1):
+        """Celdas que atraviesa el segmento (recorrido de Amanatides-Woo)."""
+        cx, cy = self._celda(x0, y0)
+        cx1, cy1 = self._celda(x1, y1)
+        celdas = [(cx, cy)]
+        dx, dy = x1 - x0, y1 - y0
+        paso_x = 1 if dx > 0 else -1
+        paso_y = 1 if dy > 0 else -1
+        # Distancia (en fracción del segmento) hasta el próximo borde vertical/horizontal
+        t_max_x = ((cx + (paso_x > 0)) * self.tam - x0) / dx if dx else math.inf
+        t_max_y = ((cy + (paso_y > 0)) * self.tam - y0) / dy if dy else math.inf
+        t_delta_x = self.tam / abs(dx) if dx else math.inf
+        t_delta_y = self.tam / abs(dy) if dy else math.inf
+        for _ in range(abs(cx1 - cx) + abs(cy1 - cy)):
+            if t_max_x < t_max_y:
+                cx += paso_x
+                t_max_x += t_delta_x
+            else:
+                cy += paso_y
+                t_max_y += t_delta_y
+            celdas.append((cx, cy))
+        return celdas
+
+    def _agregar(self, clave, celdas, geometria):
+        if clave in self._claves:
+            self.eliminar(clave)
+        for celda in celdas:
+            self._celdas.setdefault(celda, set()).add(clave)
+        self._claves[clave] = (celdas, geometria)
+
+    def insertar_punto(self, clave, x, y):
+        """Inserta (o mueve) la clave como un punto."""
+        self._agregar(clave, (self._celda(x, y),), (x, y, x, y))
+
+    def insertar_segmento(self, clave, x0, y0, x1, y1):
+        """Inserta (o mueve) la clave como un segmento."""
+        caja = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        self._agregar(clave, self._celdas_segmento(x0, y0, x1, y1), caja)
+
+    def eliminar(self, clave):
+        """Quita la clave del índice (no hace nada si no está)."""
+        entrada = self._claves.pop(clave, None)
+        if entrada is None:
+            return
+        for celda in entrada[0]:
+            claves = self._celdas[celda]
+            claves.discard(clave)
+            if not claves:
+                del self._celdas[celda]
+
+    def limpiar(self):
+        self._celdas.clear()
+        self._claves.clear()
+
+    def consultar(self, x0, y0, x1, y1):
+        """Devuelve el conjunto de claves cuya caja envolvente corta el rectángulo."""
+        cx0, cy0 = self._celda(x0, y0)
+        cx1, cy1 = self._celda(x1, y1)
+        candidatos = set()
+        # Si el rectángulo cubre más celdas de las que están ocupadas, es más
+        # barato recorrer solo las ocupadas (p. ej. con la vista muy alejada)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._celdas):
+            for (cx, cy), claves in self._celdas.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    candidatos.update(claves)
+        else:
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    claves = self._celdas.get((cx, cy))
+                    if claves:
+                        candidatos.update(claves)
+        resultado = set()
+        for clave in candidatos:
+            bx0, by0, bx1, by1 = self._claves[clave][1]
+            if bx0 <= x1 and bx1 >= x0 and by0 <= y1 and by1 >= y0:
+                resultado.add(clave)
+        return resultado
+
+    def mas_cercano(self, x, y, radio):
+        """Devuelve el punto más cercano a (x, y) a distancia <= radio, o None."""
+        mejor, mejor_d2 = None, radio * radio
+        for clave in self.consultar(x - radio, y - radio, x + radio, y + radio):
+            px, py = self._claves[clave][1][:2]
+            d2 = (px - x) ** 2 + (py - y) ** 2
+            if d2 <= mejor_d2:
+                mejor, mejor_d2 = clave, d2
+        return mejor
@@ -0,0 +1,131 @@
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+# --- PIRÁMIDE DE TESELAS PARA EL MAPA DE FONDO ---
+# La imagen se corta una sola vez en teselas cuadradas para varios niveles
+# (el nivel k está reducido 2**k veces) y se guarda en disco. Después solo se
+# decodifican las teselas que se ven, y se guardan en una caché LRU.
+
+
+class PiramideTeselas:
+    """Pirámide de teselas de una imagen, construida una vez y cacheada en disco."""
+
+    TAM_TESELA = 256
+
+    def __init__(self, ruta_imagen, dir_cache=None, capacidad=64):
+        """Abre (o construye si no existe) la pirámide de ruta_imagen.
+
+        dir_cache es donde se guardan las teselas (por defecto '.teselas'
+        junto a la imagen) y capacidad el número de teselas en memoria.
+        """
+        if dir_cache is None:
+            dir_cache = os.path.join(os.path.dirname(os.path.abspath(ruta_imagen)), ".teselas")
+        # El nombre incluye tamaño y fecha: si la imagen cambia, se reconstruye
+        info = os.stat(ruta_imagen)
+        base = os.path.splitext(os.path.basename(ruta_imagen))[0]
+        self.directorio = os.path.join(dir_cache, f"{base}_{info.st_size}_{int(info.st_mtime)}")
+        self.capacidad = capacidad
+        self._cache = OrderedDict()  # LRU {(nivel, tx, ty): Image}
+        self._cerrojo = threading.Lock()  # La usan el hilo de la GUI y los de trabajo
+
+        meta = os.path.join(self.directorio, "piramide.json")
+        if not os.path.exists(meta):
+            self._construir(ruta_imagen, meta)
+        with open(meta, encoding="utf-8") as f:
+            datos = json.load(f)
+        self.tam = datos["tam_tesela"]
+        self.tamanos = [tuple(t) for t in datos["tamanos"]]  # (ancho, alto) por nivel
+        self.ancho, self.alto = self.tamanos[0]
+        self.niveles = len(self.tamanos)
+
+    def _construir(self, ruta_imagen, meta):
+        """Corta la imagen en teselas para todos los niveles y las guarda."""
+        imagen = Image.open(ruta_imagen).convert("RGBA")
+        tam = self.TAM_TESELA
+        tamanos = []
+        nivel = 0
+        while True:
+            ancho, alto = imagen.size
+            tamanos.append((ancho, alto))
+            carpeta = os.path.join(self.directorio, str(nivel))
+            os.makedirs(carpeta, exist_ok=True)
+            for ty in range(math.ceil(alto / tam)):
+                for tx in range(math.ceil(ancho / tam)):
+                    caja = (tx * tam, ty * tam, min((tx + 1) * tam, ancho), min((ty + 1) * tam, alto))
+                    imagen.crop(caja).save(os.path.join(carpeta, f"{tx}_{ty}.png"))
+            if ancho <= tam and alto <= tam:
+                break
+            imagen = imagen.reduce(2)
+            nivel += 1
+
+        # El archivo de metadatos se escribe al final: marca la pirámide como completa
+        with open(meta, "w", encoding="utf-8") as f:
+            json.dump({"tam_tesela": tam, "tamanos": tamanos}, f)
+
+    def tesela(self, nivel, tx, ty):
+        """Devuelve la tesela (tx, ty) del nivel dado, desde la caché LRU o el disco."""
+        clave = (nivel, tx, ty)
+        with self._cerrojo:
+            imagen = self._cache.get(clave)
+            if imagen is not None:
+                self._cache.move_to_end(clave)
+                return imagen
+        imagen = Image.open(os.path.join(self.directorio, str(nivel), f"{tx}_{ty}.png"))
+        imagen.load()
+        with self._cerrojo:
+            self._cache[clave] = imagen
+            while len(self._cache) > self.capacidad:
+                self._cache.popitem(last=False)
+        return imagen
+
+    def nivel_para_zoom(self, zoom):
+        """Nivel más reducido que aún tiene al menos la resolución de pantalla."""
+        if zoom >= 1:
+            return 0
+        return min(int(math.floor(math.log2(1 / zoom))), self.niveles - 1)
+
+    def componer(self, zoom, ox, oy, ancho, alto, filtro, fondo=(28, 28, 28)):
+        """Dibuja la parte visible del mapa en una imagen de ancho x alto.
+
+        La vista es: pantalla = (mundo - (ox, oy)) * zoom, donde el mundo son
+        los píxeles de la imagen original. Solo se leen las teselas visibles.
+        """
+        salida = Image.new("RGB", (ancho, alto), fondo)
+        nivel = self.nivel_para_zoom(zoom)
+        factor = 2 ** nivel       # px del mundo por px del nivel
+        escala = zoom * factor    # px de pantalla por px del nivel
+        ancho_n, alto_n = self.tamanos[nivel]
+
+        # Región visible en px del nivel, recortada a los bordes del mapa
+        x0 = max(ox / factor, 0)
+        y0 = max(oy / factor, 0)
+        x1 = min((ox + ancho / zoom) / factor, ancho_n)
+        y1 = min((oy + alto / zoom) / factor, alto_n)
+        if x1 <= x0 or y1 <= y0:
+            return salida
+
+        # Posición y tamaño en pantalla de esa región
+        px = round((x0 * factor - ox) * zoom)
+        py = round((y0 * factor - oy) * zoom)
+        pw = round((x1 - x0) * escala)
+        ph = round((y1 - y0) * escala)
+        if pw <= 0 or ph <= 0:
+            return salida
+
+        tam = self.tam
+        tx0, ty0 = int(x0 // tam), int(y0 // tam)
+        tx1, ty1 = math.ceil(x1 / tam), math.ceil(y1 / tam)
+        region = Image.new("RGBA", ((tx1 - tx0) * tam, (ty1 - ty0) * tam))
+        for ty in range(ty0, ty1):
+            for tx in range(tx0, tx1):
+                region.paste(self.tesela(nivel, tx, ty), ((tx - tx0) * tam, (ty - ty0) * tam))
+
+        caja = (x0 - tx0 * tam, y0 - ty0 * tam, x1 - tx0 * tam, y1 - ty0 * tam)
+        parte = region.resize((pw, ph), filtro, box=caja)
+        salida.paste(parte, (px, py), parte)
+        return salida
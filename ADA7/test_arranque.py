@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+# --- PRUEBA DE ARRANQUE DEL NÚCLEO ---
+# grafos.py debe importarse sin interfaz gráfica y en pocos milisegundos. La
+# importación se mide en un proceso nuevo con "python -X importtime", que
+# escribe en stderr el tiempo acumulado de cada módulo en microsegundos.
+# Se ejecuta con pytest o directamente: python test_arranque.py
+
+LIMITE_MS = 100  # Solo customtkinter ya tarda ~200 ms en importarse
+PROHIBIDOS = ("customtkinter", "tkinter", "PIL")
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+
+
+def medir_importacion():
+    """Importa grafos en un proceso nuevo y devuelve el tiempo acumulado en ms."""
+    codigo = ("import sys, grafos; "
+              f"print(','.join(m for m in {PROHIBIDOS!r} if m in sys.modules))")
+    proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                             cwd=CARPETA, capture_output=True, text=True, check=True)
+
+    cargados = proceso.stdout.strip()
+    assert not cargados, f"grafos importa módulos de la GUI: {cargados}"
+
+    acumulado = None
+    for linea in proceso.stderr.splitlines():
+        campos = [c.strip() for c in linea.split("|")]
+        if len(campos) == 3 and campos[2] == "grafos":
+            acumulado = int(campos[1]) / 1000
+    assert acumulado is not None, "No se encontró grafos en la salida de -X importtime"
+    return acumulado
+
+
+def test_importacion_ligera():
+    """grafos no carga la GUI ni Pillow y se importa por debajo de LIMITE_MS."""
+    acumulado = medir_importacion()
+    assert acumulado < LIMITE_MS, f"Importar grafos tardó {acumulado:.1f} ms (límite {LIMITE_MS} ms)"
+
+
+if __name__ == "__main__":
+    test_importacion_ligera()
+    print(f"Importar grafos: {medir_importacion():.1f} ms, sin {', '.join(PROHIBIDOS)}")
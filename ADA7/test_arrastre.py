@@ -0,0 +1,78 @@
+import pytest
+
+from grafos import Graph
+
+# --- PRUEBAS DEL ARRASTRE INCREMENTAL ---
+# Al mover un vértice solo se reubican sus items y los de sus aristas
+# incidentes (GraphApp._render_moved_vertices). Se usan los métodos de
+# GraphApp sobre un lienzo falso, sin abrir ventanas. Se ejecuta con pytest
+# (se omite si customtkinter no está instalado).
+
+visualizador = pytest.importorskip("visualizador")
+GraphApp = visualizador.GraphApp
+
+
+class Lienzo:
+    """Canvas falso: guarda las últimas coordenadas puestas a cada item."""
+    def __init__(self):
+        self.coordenadas = {}
+
+    def coords(self, item, *puntos):
+        self.coordenadas[item] = puntos
+
+
+class Vista:
+    """Lo mínimo de GraphApp que usa el redibujado incremental."""
+    VERTEX_RADIUS = GraphApp.VERTEX_RADIUS
+    world_to_screen = GraphApp.world_to_screen
+    _vertex_radius = GraphApp._vertex_radius
+    _arrow_points = GraphApp._arrow_points
+    _render_moved_vertices = GraphApp._render_moved_vertices
+    _update_edge_coords = GraphApp._update_edge_coords
+
+    def __init__(self, graph, coords):
+        self.graph = graph
+        self.canvas = Lienzo()
+        self.view_offset = (0, 0)
+        self.view_zoom = 1.0
+        self.vertex_coords = dict(coords)
+        # Ids como los que asigna draw_graph: (óvalo, texto) y (línea, flecha)
+        self.vertex_items = {v_uid: (f"o_{v_uid}", f"t_{v_uid}") for v_uid in graph.vertices()}
+        self.edge_items = {e_uid: (f"l_{e_uid}", f"f_{e_uid}" if graph.esDirigida(e_uid) else None)
+                           for e_uid in graph.aristas()}
+
+
+def test_mover_un_vertice_solo_toca_sus_items():
+    g = Graph()
+    a, b, c, d = (g.insertaVertice(x) for x in "ABCD")
+    ab = g.insertaArista(a, b, None)
+    ac = g.insertaAristaDirigida(c, a, None)
+    g.insertaArista(c, d, None)
+    vista = Vista(g, {a: (0, 0), b: (100, 0), c: (0, 100), d: (100, 100)})
+
+    vista.vertex_coords[a] = (50, 50)
+    vista._render_moved_vertices([a])
+
+    r = GraphApp.VERTEX_RADIUS
+    assert vista.canvas.coordenadas == {
+        f"o_{a}": (50 - r, 50 - r, 50 + r, 50 + r),
+        f"t_{a}": (50, 50),
+        f"l_{ab}": (50, 50, 100, 0),
+        f"l_{ac}": (0, 100, 50, 50),
+        f"f_{ac}": GraphApp._arrow_points(vista, 0, 100, 50, 50),
+    }
+
+
+def test_vertices_y_aristas_sin_items_se_ignoran():
+    """Lo que no está dibujado (fuera de la vista) no se toca."""
+    g = Graph()
+    a, b = g.insertaVertice("A"), g.insertaVertice("B")
+    e = g.insertaArista(a, b, None)
+    vista = Vista(g, {a: (0, 0), b: (10, 0)})
+    del vista.vertex_items[b]
+    del vista.edge_items[e]
+    vista.view_zoom = 2.0
+
+    vista._render_moved_vertices([a, b])
+    r = GraphApp.VERTEX_RADIUS
+    assert vista.canvas.coordenadas == {f"o_{a}": (-r, -r, r, r), f"t_{a}": (0, 0)}
@@ -0,0 +1,79 @@
+import pytest
+
+from grafos import Graph
+
+# --- PRUEBAS DE CAMINOS Y ÁRBOLES CON PESOS ---
+# Graph.dijkstra, caminoMasCorto y arbolExpansionMinima (los que la GUI
+# ejecuta en segundo plano sobre una instantánea). Se ejecuta con pytest.
+
+
+def ejemplo():
+    """El grafo de dijkstra.py (ADA8) como grafo no dirigido con pesos."""
+    g = Graph()
+    g.cargar_aristas([("A", "B", 1), ("A", "C", 4), ("B", "C", 2), ("B", "D", 5), ("C", "D", 1)])
+    return g, dict(zip("ABCD", g.buscaVertices("ABCD")))
+
+
+def test_dijkstra_distancias_y_orden():
+    """Genera cada vértice al fijar su distancia, en orden creciente."""
+    g, v = ejemplo()
+    fijados = list(g.dijkstra(v["A"]))
+    distancias = {u_uid: d for u_uid, d, _ in fijados}
+    assert distancias == {v["A"]: 0, v["B"]: 1, v["C"]: 3, v["D"]: 4}
+    assert [d for _, d, _ in fijados] == sorted(distancias.values())
+    assert fijados[0][2] is None
+
+
+def test_camino_mas_corto():
+    g, v = ejemplo()
+    distancia, camino = g.caminoMasCorto(v["A"], v["D"])
+    assert distancia == 4
+    recorrido = [v["A"]]
+    for e_uid in camino:
+        recorrido.append(g.opuesto(recorrido[-1], e_uid))
+    assert recorrido == [v["A"], v["B"], v["C"], v["D"]]
+    assert g.caminoMasCorto(v["A"], v["A"]) == (0, [])
+
+
+def test_camino_respeta_la_direccion_y_los_pesos():
+    g = Graph()
+    g.cargar_aristas([("A", "B", "10"), ("B", "C", "x")], dirigida=True)
+    a, b, c = g.buscaVertices("ABC")
+    # Los textos numéricos son pesos y los demás elementos pesan 1
+    assert g.caminoMasCorto(a, c)[0] == 11
+    assert g.caminoMasCorto(c, a) is None
+    assert g.caminoMasCorto(a, c, peso=lambda o: 0)[0] == 0
+
+
+def test_dijkstra_con_peso_negativo():
+    g = Graph()
+    g.cargar_aristas([("A", "B", -1)])
+    with pytest.raises(ValueError):
+        list(g.dijkstra(g.buscaVertice("A")))
+
+
+def test_arbol_expansion_minima():
+    g, v = ejemplo()
+    arbol = list(g.arbolExpansionMinima())
+    pesos = [float(g._edges[e_uid]._element) for e_uid in arbol]
+    assert pesos == [1, 1, 2]
+    assert len(set(arbol)) == g.numVertices() - 1
+
+
+def test_bosque_de_expansion_minima():
+    """Con varias componentes se obtiene un árbol por componente."""
+    g = Graph()
+    g.cargar_aristas([("A", "B", 3), ("B", "C", 1), ("A", "C", 2), ("D", "E", 5)])
+    g.insertaVertice("F")
+    arbol = list(g.arbolExpansionMinima())
+    assert sorted(float(g._edges[e_uid]._element) for e_uid in arbol) == [1, 2, 5]
+
+
+def test_sobre_una_instantanea():
+    """Los algoritmos dan el resultado del momento de la instantánea."""
+    g, v = ejemplo()
+    foto = g.instantanea()
+    g.insertaArista(v["A"], v["D"], 1)
+    assert foto.caminoMasCorto(v["A"], v["D"])[0] == 4
+    assert g.caminoMasCorto(v["A"], v["D"])[0] == 1
+    assert len(list(foto.arbolExpansionMinima())) == 3
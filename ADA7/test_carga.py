@@ -0,0 +1,118 @@
+import pytest
+
+from grafos import Graph
+
+# --- PRUEBAS DE CARGA MASIVA Y FORMATOS DE ARCHIVO ---
+# cargar_aristas, cargar_csv (CSV/TSV) y el formato binario GRFB
+# (guardar / cargar_binario). Se ejecuta con pytest.
+
+
+def resumen(g):
+    """Vértices (elementos) y aristas (elementos de sus extremos, elemento, dirigida) de g."""
+    vertices = sorted(str(g.get_vertex_element(v_uid)) for v_uid in g.vertices())
+    aristas = []
+    for e_uid in g.aristas():
+        v_uid, w_uid = g.verticesFinales(e_uid)
+        aristas.append((g.get_vertex_element(v_uid), g.get_vertex_element(w_uid),
+                        str(g._edges[e_uid]), g.esDirigida(e_uid)))
+    return vertices, sorted(aristas)
+
+
+def test_cargar_aristas_reutiliza_vertices():
+    """Los elementos repetidos se resuelven al mismo vértice y se crean los que faltan."""
+    g = Graph()
+    a = g.insertaVertice("A")
+    assert g.cargar_aristas([("A", "B", 1), ("B", "C", 2), ("C", "A")]) == 3
+    assert g.numVertices() == 3
+    assert g.buscaVertice("A") == a
+    assert sorted(g.verticesAdyacentes(a)) == sorted(g.buscaVertices(["B", "C"]))
+    assert g.aristasNodirigidas() == g.aristas()
+
+
+def test_cargar_aristas_dirigidas():
+    """Con dirigida=True las aristas van del primer elemento al segundo."""
+    g = Graph()
+    g.cargar_aristas([("A", "B", 5)], dirigida=True)
+    a, b = g.buscaVertices(["A", "B"])
+    (e_uid,) = g.aristas()
+    assert g.origen(e_uid) == a and g.destino(e_uid) == b
+    assert g.gradoSalida(a) == 1 and g.gradoEnt(a) == 0
+
+
+def test_cargar_aristas_con_repetidos_y_no_hashables():
+    """Con elementos repetidos se usa el vértice más antiguo; cada aparición de
+    un elemento no hashable crea su propio vértice, como al insertarlo a mano."""
+    g = Graph()
+    viejo = g.insertaVertice("A")
+    g.insertaVertice("A")
+    lista = ["x"]
+    assert g.cargar_aristas([("A", "B"), ("B", "A"), (lista, "A"), ("A", lista), ("B", "B")]) == 5
+    assert g.numVertices() == 5  # A, A, B y dos vértices para la lista
+    b = g.buscaVertice("B")
+    copias = [v_uid for v_uid in g.vertices() if g.get_vertex_element(v_uid) is lista]
+    assert len(copias) == 2
+    assert sorted(g.verticesAdyacentes(viejo)) == sorted([b] + copias)
+    assert g.gradoSalida(b) == 3  # Las dos aristas con A y el lazo B-B
+
+
+def test_cargar_csv_y_tsv(tmp_path):
+    """Lee CSV con encabezado y TSV por bloques pequeños con el mismo resultado."""
+    csv = tmp_path / "aristas.csv"
+    csv.write_text("u,w,o\nA,B,1\nB,C,2\n\nC,D,3\n", encoding="utf-8")
+    tsv = tmp_path / "aristas.tsv"
+    tsv.write_text("A\tB\t1\nB\tC\t2\nC\tD\t3\n", encoding="utf-8")
+
+    g1 = Graph()
+    assert g1.cargar_csv(str(csv), encabezado=True) == 3
+    g2 = Graph()
+    assert g2.cargar_csv(str(tsv), tam_bloque=2) == 3
+    assert resumen(g1) == resumen(g2)
+    assert resumen(g1)[0] == ["A", "B", "C", "D"]
+
+
+def test_cargar_csv_fila_invalida(tmp_path):
+    """Una fila con menos de dos columnas es un error."""
+    ruta = tmp_path / "mal.csv"
+    ruta.write_text("A,B\nC\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        Graph().cargar_csv(str(ruta))
+
+
+def test_binario_ida_y_vuelta(tmp_path):
+    """cargar → guardar → cargar conserva vértices, aristas, elementos y dirección."""
+    origen = tmp_path / "grafo.csv"
+    origen.write_text("A,B,1\nB,C,2\nC,A,3\nC,D,4\n", encoding="utf-8")
+    g = Graph()
+    g.cargar_csv(str(origen))
+    d = g.insertaVertice("D")  # Elemento repetido: también debe conservarse
+    g.insertaAristaDirigida(d, g.buscaVertice("A"), None)
+    g.insertaVertice(None)
+
+    ruta = tmp_path / "grafo.grfb"
+    g.guardar(str(ruta))
+    copia = Graph()
+    assert copia.cargar_binario(str(ruta), tam_bloque=2) == g.numAristas()
+    assert copia.numVertices() == g.numVertices()
+    assert resumen(copia) == resumen(g)
+
+    # Guardar la copia produce el mismo archivo
+    ruta2 = tmp_path / "copia.grfb"
+    copia.guardar(str(ruta2))
+    assert ruta2.read_bytes() == ruta.read_bytes()
+
+
+def test_binario_invalido_o_truncado(tmp_path):
+    """Un archivo que no es GRFB o que está cortado lanza ValueError."""
+    ruta = tmp_path / "otro.bin"
+    ruta.write_bytes(b"no es un grafo")
+    with pytest.raises(ValueError):
+        Graph().cargar_binario(str(ruta))
+
+    g = Graph()
+    g.cargar_aristas([("A", "B"), ("B", "C")])
+    completo = tmp_path / "grafo.grfb"
+    g.guardar(str(completo))
+    truncado = tmp_path / "truncado.grfb"
+    truncado.write_bytes(completo.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        Graph().cargar_binario(str(truncado))
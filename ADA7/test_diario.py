@@ -0,0 +1,63 @@
+from grafos import Graph
+
+# --- PRUEBAS DE VERSIONES Y DIARIO DE CAMBIOS ---
+# version, activarDiario / cambiosDesde y suscribir. Se ejecuta con pytest.
+
+
+def test_version_crece_con_cada_cambio():
+    g = Graph()
+    assert g.version() == 0
+    a = g.insertaVertice("A")
+    b = g.insertaVertice("B")
+    g.insertaArista(a, b, 1)
+    assert g.version() == 3
+    g.cargar_aristas([("A", "C"), ("C", "B")])  # Un vértice y dos aristas nuevos
+    assert g.version() == 6
+    assert g.cambiosDesde(g.version()) == []
+
+
+def test_diario_tras_eliminacion_en_bloque():
+    """Borrar vértices publica primero sus aristas y luego los vértices, con versiones seguidas."""
+    g = Graph()
+    g.activarDiario()
+    g.cargar_aristas([("A", "B", 1), ("B", "C", 2)])
+    a, b, c = g.buscaVertices(["A", "B", "C"])
+    antes = g.version()
+
+    g.eliminaVertices([a, b])
+    cambios = g.cambiosDesde(antes)
+    assert [cambio.version for cambio in cambios] == list(range(antes + 1, g.version() + 1))
+    tipos = [cambio.tipo for cambio in cambios]
+    assert tipos == [Graph.ARISTA_ELIMINADA] * 2 + [Graph.VERTICE_ELIMINADO] * 2
+    assert {cambio.datos for cambio in cambios[:2]} == {(a, b, 1, False), (b, c, 2, False)}
+    assert sorted(cambio.uid for cambio in cambios[2:]) == sorted([a, b])
+    assert [cambio.datos for cambio in cambios[2:]] == ["A", "B"]
+    assert g.numVertices() == 1
+
+
+def test_diario_acotado_y_desactivado():
+    """Si el diario ya descartó cambios (o está apagado) cambiosDesde devuelve None."""
+    g = Graph()
+    assert g.cambiosDesde(-1) is None
+    g.activarDiario(capacidad=3)
+    for i in range(5):
+        g.insertaVertice(i)
+    assert g.cambiosDesde(0) is None
+    assert [cambio.datos for cambio in g.cambiosDesde(2)] == [2, 3, 4]
+    g.desactivarDiario()
+    assert g.cambiosDesde(2) is None
+
+
+def test_suscriptores():
+    """Cada suscriptor recibe los cambios en orden hasta desuscribirse."""
+    g = Graph()
+    recibidos = []
+    g.suscribir(recibidos.append)
+    a = g.insertaVertice("A")
+    e = g.insertaAristaDirigida(a, a, "lazo")
+    g.desuscribir(recibidos.append)
+    g.insertaVertice("B")
+    assert recibidos == [
+        Graph.Cambio(1, Graph.VERTICE_INSERTADO, a, "A"),
+        Graph.Cambio(2, Graph.ARISTA_INSERTADA, e, (a, a, "lazo", True)),
+    ]
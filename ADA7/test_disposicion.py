@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from disposicion import DisposicionFuerzas
+
+# --- PRUEBAS DE LA DISPOSICIÓN POR FUERZAS ---
+# La repulsión de Barnes-Hut contra la suma exacta O(n²) y los pasos de
+# Fruchterman-Reingold (vértices fijos, caja y enfriamiento). Se ejecuta con
+# pytest (se omite si NumPy no está instalado).
+
+
+def repulsion_exacta(pos, k):
+    """Suma sobre j != i de (dx, dy) * k² / d²."""
+    dx = pos[:, None, 0] - pos[None, :, 0]
+    dy = pos[:, None, 1] - pos[None, :, 1]
+    d2 = dx * dx + dy * dy
+    np.fill_diagonal(d2, np.inf)
+    return (dx * k * k / d2).sum(axis=1), (dy * k * k / d2).sum(axis=1)
+
+
+def error_relativo(disposicion):
+    fx, fy = disposicion._repulsion()
+    ex, ey = repulsion_exacta(disposicion.pos, disposicion.k)
+    return float(np.hypot(fx - ex, fy - ey).max() / np.hypot(ex, ey).max())
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_theta_cero_es_exacta_con_un_vertice_por_hoja(semilla):
+    """Rejilla de 8x8 con ruido: cada vértice queda solo en su hoja, así que
+    con theta -> 0 no se agrupa nada y la suma es la exacta."""
+    rng = np.random.default_rng(semilla)
+    pos = [((i + 0.5 + rng.uniform(-0.3, 0.3)) * 10, (j + 0.5 + rng.uniform(-0.3, 0.3)) * 10)
+           for i in range(8) for j in range(8)]
+    disposicion = DisposicionFuerzas(pos, [], theta=1e-9)
+    assert error_relativo(disposicion) < 1e-9
+
+
+@pytest.mark.parametrize("n", [2, 3, 17, 100, 300, 1000])
+def test_theta_cero_es_exacta_en_una_nube(n):
+    """Al azar varios vértices comparten hoja; con theta -> 0 se abren todas
+    las hojas y cada vértice empuja por separado."""
+    rng = np.random.default_rng(n)
+    pos = rng.uniform(0, 500, (n, 2))
+    assert error_relativo(DisposicionFuerzas(pos, [], theta=1e-9)) < 1e-9
+
+
+@pytest.mark.parametrize("n", [100, 1000])
+def test_theta_usual_es_aproximada(n):
+    rng = np.random.default_rng(n)
+    pos = rng.uniform(0, 500, (n, 2))
+    media = error_relativo(DisposicionFuerzas(pos, [], theta=0.5))
+    assert media < error_relativo(DisposicionFuerzas(pos, [], theta=0.9)) < 0.1
+
+
+def test_vertices_muy_cercanos():
+    """Dos vértices casi encima uno del otro se repelen con fuerza k²/d aunque
+    compartan hoja con otros."""
+    rng = np.random.default_rng(3)
+    pos = np.vstack([rng.uniform(0, 500, (200, 2)), [[250, 250], [250.01, 250], [250.02, 250.03]]])
+    assert error_relativo(DisposicionFuerzas(pos, [], theta=0.9)) < 1e-3
+
+
+def test_repulsion_en_sentido_opuesto():
+    fx, fy = DisposicionFuerzas([(0, 0), (3, 4)], [])._repulsion()
+    assert fx[0] < 0 and fy[0] < 0 and fx[1] > 0 and fy[1] > 0
+    assert fx[0] == pytest.approx(-fx[1]) and fy[0] == pytest.approx(-fy[1])
+
+
+def test_pasos_respetan_fijos_y_caja():
+    rng = random.Random(1)
+    pos = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(50)]
+    aristas = [(i, (i + 1) % 50) for i in range(50)]
+    fijos = [i % 7 == 0 for i in range(50)]
+    caja = (0, 0, 100, 100)
+    disposicion = DisposicionFuerzas(pos, aristas, fijos=fijos, caja=caja)
+    inicial = disposicion.pos.copy()
+
+    temperaturas = []
+    while not disposicion.terminada():
+        temperaturas.append(disposicion.temperatura)
+        assert disposicion.paso() <= temperaturas[-1] + 1e-9
+        assert disposicion.iteraciones < 1000
+    assert temperaturas == sorted(temperaturas, reverse=True)
+    assert np.array_equal(disposicion.pos[disposicion.fijos], inicial[disposicion.fijos])
+    assert not np.array_equal(disposicion.pos, inicial)
+    assert (disposicion.pos >= 0).all() and (disposicion.pos <= 100).all()
+
+
+def test_casos_triviales():
+    assert DisposicionFuerzas([], []).paso() == 0.0
+    sola = DisposicionFuerzas([(5, 5)], [])
+    assert [list(f) for f in sola._repulsion()] == [[0.0], [0.0]]
+    todos_fijos = DisposicionFuerzas([(0, 0), (1, 1)], [(0, 1)], fijos=[True, True])
+    assert todos_fijos.terminada() and todos_fijos.paso() == 0.0
@@ -0,0 +1,58 @@
+import pytest
+
+from grafos import Graph
+
+# --- PRUEBAS DE ELIMINACIÓN EN BLOQUE ---
+# eliminaVertices y eliminaAristas. Se ejecuta con pytest.
+
+
+def cuadrado():
+    """A-B-C-D-A no dirigido con la diagonal dirigida A -> C."""
+    g = Graph()
+    g.cargar_aristas([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
+    a, c = g.buscaVertices(["A", "C"])
+    g.insertaAristaDirigida(a, c, None)
+    return g
+
+
+def test_elimina_vertices_y_sus_aristas():
+    """Se quitan los vértices, todas sus aristas y la incidencia en los que quedan."""
+    g = cuadrado()
+    a, b, c, d = g.buscaVertices(["A", "B", "C", "D"])
+    g.eliminaVertices([a, b])
+    assert sorted(g.vertices()) == sorted([c, d])
+    assert g.numAristas() == 1
+    assert g.verticesAdyacentes(c) == [d]
+    assert g.gradoEnt(c) == 1 and g.gradoSalida(c) == 1
+    assert g.buscaVertice("A") is None
+
+
+def test_elimina_vertices_valida_antes_de_borrar():
+    """Si un UID no existe no se elimina ninguno."""
+    g = cuadrado()
+    a = g.buscaVertice("A")
+    with pytest.raises(ValueError):
+        g.eliminaVertices([a, "v999"])
+    assert g.numVertices() == 4 and g.numAristas() == 5
+
+
+def test_elimina_vertice_uno_solo():
+    g = cuadrado()
+    g.eliminaVertice(g.buscaVertice("C"))
+    assert g.numVertices() == 3 and g.numAristas() == 2
+
+
+def test_elimina_aristas():
+    """eliminaAristas quita aristas dirigidas y no dirigidas de ambos extremos."""
+    g = cuadrado()
+    a, b, c = g.buscaVertices(["A", "B", "C"])
+    dirigida = g.aristasDirigidas()[0]
+    ab = next(e for e in g.aristasIncidentes(a) if b in g.verticesFinales(e))
+    g.eliminaAristas([dirigida, ab])
+    assert g.numAristas() == 3
+    assert g.gradoEnt(c) == 2 and g.gradoSalida(a) == 1
+    assert not g.esAdyacente(a, b)
+
+    with pytest.raises(ValueError):
+        g.eliminaAristas([g.aristas()[0], "e999"])
+    assert g.numAristas() == 3
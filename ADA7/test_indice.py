@@ -0,0 +1,99 @@
+import pytest
+
+from grafos import Graph
+
+# --- PRUEBAS DEL ÍNDICE DE ELEMENTOS ---
+# buscaVertice / buscaVertices con elementos repetidos, su borrado y
+# elementos_unicos. Se ejecuta con pytest.
+
+
+def test_elementos_repetidos_devuelven_el_mas_antiguo():
+    g = Graph()
+    primero = g.insertaVertice("X")
+    segundo = g.insertaVertice("X")
+    tercero = g.insertaVertice("X")
+    otro = g.insertaVertice("Y")
+    assert g.buscaVertice("X") == primero
+    assert g.buscaVertices(["Y", "X", "Z"]) == [otro, primero, None]
+
+    g.eliminaVertice(primero)
+    assert g.buscaVertice("X") == segundo
+    g.eliminaVertice(tercero)
+    assert g.buscaVertice("X") == segundo
+    g.eliminaVertice(segundo)
+    assert g.buscaVertice("X") is None
+    assert g.buscaVertice("Y") == otro
+
+
+def test_uids_parecidos_no_se_confunden():
+    """Quitar v1 no quita v10 aunque uno sea prefijo del otro."""
+    g = Graph()
+    uids = [g.insertaVertice(i % 2) for i in range(12)]
+    g.eliminaVertices([uids[1], uids[0]])
+    assert g.buscaVertice(0) == uids[2]
+    assert g.buscaVertice(1) == uids[3]
+    g.eliminaVertices(uids[2:10])
+    assert g.buscaVertices([0, 1]) == [uids[10], uids[11]]
+
+
+def test_elementos_no_hashables():
+    """Los elementos no hashables se aceptan pero no se indexan."""
+    g = Graph()
+    v = g.insertaVertice(["lista"])
+    assert g.buscaVertice(["lista"]) is None
+    g.eliminaVertice(v)
+    assert g.numVertices() == 0
+
+
+def test_elementos_unicos():
+    g = Graph(elementos_unicos=True)
+    a = g.insertaVertice("A")
+    with pytest.raises(ValueError):
+        g.insertaVertice("A")
+    assert g.numVertices() == 1
+    g.eliminaVertice(a)
+    assert g.insertaVertice("A") != a
+
+
+def test_instantanea_conserva_su_indice():
+    """Modificar los vértices de un elemento no cambia lo que ve una instantánea."""
+    g = Graph()
+    uids = [g.insertaVertice("X") for _ in range(3)]
+    foto = g.instantanea()
+    g.eliminaVertice(uids[0])
+    g.insertaVertice("X")
+    assert foto.buscaVertice("X") == uids[0]
+    assert g.buscaVertice("X") == uids[1]
+    foto2 = g.instantanea()
+    g.eliminaVertices(uids[1:])
+    assert foto.buscaVertice("X") == uids[0]
+    assert foto2.buscaVertice("X") == uids[1]
+
+
+def test_muchos_vertices_con_el_mismo_elemento():
+    """La entrada de un elemento repetido se modifica en su lugar: insertar o
+    quitar uno de sus vértices no la reconstruye (eso haría cuadrática la
+    carga de n vértices iguales) y conserva el orden de inserción."""
+    g = Graph()
+    uids = [g.insertaVertice(None) for _ in range(1000)]
+    entrada = g._indice[None]
+    quitados = (500, 0, 998, 1)
+    for k in quitados:
+        g.eliminaVertice(uids[k])
+    nuevo = g.insertaVertice(None)
+    assert g._indice[None] is entrada
+    quedan = [v_uid for k, v_uid in enumerate(uids) if k not in quitados] + [nuevo]
+    assert list(entrada) == quedan
+    assert g.buscaVertice(None) == uids[2]
+
+    # Con una instantánea viva la entrada se copia una sola vez
+    foto = g.instantanea()
+    g.eliminaVertice(uids[2])
+    copia = g._indice[None]
+    assert copia is not entrada
+    g.eliminaVertice(uids[3])
+    g.insertaVertice(None)
+    assert g._indice[None] is copia
+    assert list(copia)[:2] == quedan[2:4] and len(copia) == len(quedan) - 1
+    assert foto.buscaVertice(None) == uids[2]
+    assert g.buscaVertice(None) == uids[4]
@@ -0,0 +1,94 @@
+import gc
+import threading
+
+from grafos import Graph
+
+# --- PRUEBAS DE INSTANTÁNEAS ---
+# Graph.instantanea: la foto no cambia aunque el grafo siga modificándose,
+# ni siquiera si otro hilo escribe mientras se recorre. Se ejecuta con pytest.
+
+
+def contenido(g):
+    """Vértices, aristas e incidencia de g (o de una instantánea) para comparar."""
+    return (sorted(g.vertices()), sorted(g.aristas()),
+            {v_uid: sorted(g.aristasIncidentes(v_uid)) for v_uid in g.vertices()})
+
+
+def test_instantanea_no_ve_cambios_posteriores():
+    g = Graph()
+    g.cargar_aristas([("A", "B"), ("B", "C")])
+    a, b, c = g.buscaVertices(["A", "B", "C"])
+    esperado = contenido(g)
+    foto = g.instantanea()
+
+    d = g.insertaVertice("D")
+    g.insertaArista(c, d, None)
+    g.eliminaVertice(a)
+    g.cargar_aristas([("E", "F")])
+
+    assert contenido(foto) == esperado
+    assert foto.numVertices() == 3 and foto.numAristas() == 2
+    assert foto.version() < g.version()
+    # Consultas puntuales, antes de recorrer los mapas de la instantánea
+    otra = g.instantanea()
+    g.eliminaVertice(b)
+    assert otra.get_vertex_element(b) == "B" and otra.buscaVertice("D") == d
+    assert b in otra.vertices()
+
+
+def test_consultas_puntuales_sin_recorrer():
+    """Sin recorrer la instantánea, las búsquedas por clave ven su estado."""
+    g = Graph()
+    a = g.insertaVertice("A")
+    b = g.insertaVertice("B")
+    e = g.insertaArista(a, b, 7)
+    foto = g.instantanea()
+    g.eliminaArista(e)
+    g.eliminaVertice(a)
+    c = g.insertaVertice("C")
+    assert foto.get_vertex_element(a) == "A"
+    assert foto.verticesFinales(e) == (a, b)
+    assert foto.buscaVertice("A") == a and foto.buscaVertice("C") is None
+    assert c not in foto._vertices
+
+
+def test_varias_instantaneas_y_descartadas():
+    """Cada instantánea ve su propio momento, también si se descartan las intermedias."""
+    g = Graph()
+    fotos = []
+    for i in range(6):
+        g.cargar_aristas([(i, i + 1)])
+        fotos.append((g.instantanea(), contenido(g)))
+        if i % 2:
+            g.eliminaVertice(g.buscaVertice(i - 1))
+    del fotos[1:4]
+    gc.collect()
+    g.insertaVertice("nuevo")
+    for foto, esperado in fotos:
+        assert contenido(foto) == esperado
+
+
+def test_lectura_desde_otro_hilo():
+    """Un hilo recorre la instantánea mientras otro sigue cargando aristas."""
+    g = Graph()
+    g.cargar_aristas([(i, i + 1) for i in range(2000)])
+    foto = g.instantanea()
+    esperado = list(range(2001))
+    errores = []
+
+    def leer():
+        try:
+            for _ in range(5):
+                recorrido = [foto.get_vertex_element(v_uid) for v_uid in foto.bfs(foto.buscaVertice(0))]
+                assert recorrido == esperado
+        except Exception as e:  # Se informa en el hilo principal
+            errores.append(e)
+
+    lector = threading.Thread(target=leer)
+    lector.start()
+    for i in range(2000):
+        g.cargar_aristas([(i, -i - 1)])
+        if i % 100 == 0:
+            g.eliminaVertice(g.buscaVertice(-i - 1))
+    lector.join()
+    assert not errores
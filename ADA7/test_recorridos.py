@@ -0,0 +1,97 @@
+import sys
+
+import pytest
+
+from grafos import Graph
+
+# --- PRUEBAS DE RECORRIDOS ---
+# bfs, dfs, componentes conexas y fuertemente conexas y orden topológico
+# sobre grafos pequeños con resultado conocido. Se ejecuta con pytest.
+
+
+def dirigido(aristas):
+    """Grafo dirigido con las aristas (u, w) dadas y {elemento: v_uid}."""
+    g = Graph()
+    g.cargar_aristas([(u, w, None) for u, w in aristas], dirigida=True)
+    return g, {g.get_vertex_element(v_uid): v_uid for v_uid in g.vertices()}
+
+
+def nombres(g, uids):
+    return [g.get_vertex_element(v_uid) for v_uid in uids]
+
+
+def test_bfs_por_niveles():
+    """bfs visita por niveles y solo lo alcanzable siguiendo la dirección."""
+    g, v = dirigido([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "E"), ("F", "A")])
+    orden = nombres(g, g.bfs(v["A"]))
+    assert orden[0] == "A"
+    assert set(orden[1:3]) == {"B", "C"}
+    assert orden[3:] == ["D", "E"]
+
+
+def test_dfs_preorden():
+    """dfs genera cada vértice alcanzable una vez, en preorden."""
+    g, v = dirigido([("A", "B"), ("B", "C"), ("A", "D"), ("C", "A")])
+    assert nombres(g, g.dfs(v["A"])) == ["A", "B", "C", "D"]
+
+
+def test_recorrido_no_dirigido_en_ambos_sentidos():
+    """Las aristas no dirigidas se recorren desde cualquiera de sus extremos."""
+    g = Graph()
+    g.cargar_aristas([("A", "B"), ("B", "C")])
+    assert sorted(nombres(g, g.bfs(g.buscaVertice("C")))) == ["A", "B", "C"]
+    assert sorted(nombres(g, g.dfs(g.buscaVertice("C")))) == ["A", "B", "C"]
+
+
+def test_componentes_conexas_ignoran_la_direccion():
+    g, v = dirigido([("A", "B"), ("C", "B"), ("D", "E")])
+    g.insertaVertice("F")
+    componentes = sorted(sorted(nombres(g, c)) for c in g.componentesConexas())
+    assert componentes == [["A", "B", "C"], ["D", "E"], ["F"]]
+
+
+def test_componentes_fuertemente_conexas():
+    """Tarjan sobre el ejemplo clásico de tres componentes y un vértice suelto."""
+    g, v = dirigido([("A", "B"), ("B", "C"), ("C", "A"), ("B", "D"),
+                     ("D", "E"), ("E", "F"), ("F", "D"), ("G", "F"), ("G", "H"), ("H", "G")])
+    g.insertaVertice("I")
+    componentes = list(g.componentesFuertementeConexas())
+    assert sorted(sorted(nombres(g, c)) for c in componentes) == [
+        ["A", "B", "C"], ["D", "E", "F"], ["G", "H"], ["I"]]
+    # Tarjan entrega las componentes en orden topológico inverso
+    posicion = {nombre: i for i, c in enumerate(componentes) for nombre in nombres(g, c)}
+    assert posicion["D"] < posicion["A"]
+    assert posicion["D"] < posicion["G"]
+
+
+def test_componentes_fuertemente_conexas_sin_recursion():
+    """Un camino más largo que el límite de recursión no desborda la pila."""
+    n = sys.getrecursionlimit() + 100
+    g, v = dirigido([(i, i + 1) for i in range(n)] + [(n, 0)])
+    (componente,) = g.componentesFuertementeConexas()
+    assert len(componente) == n + 1
+    assert len(list(g.dfs(v[0]))) == n + 1
+
+
+def test_orden_topologico():
+    """Cada arista va de un vértice anterior a uno posterior en el orden."""
+    aristas = [("ropa", "zapatos"), ("calcetines", "zapatos"), ("ropa", "cinturón"),
+               ("camisa", "cinturón"), ("camisa", "corbata"), ("corbata", "saco"), ("cinturón", "saco")]
+    g, v = dirigido(aristas)
+    g.insertaVertice("reloj")
+    orden = nombres(g, g.ordenTopologico())
+    assert sorted(orden) == sorted(set(orden)) and len(orden) == g.numVertices()
+    for u, w in aristas:
+        assert orden.index(u) < orden.index(w)
+
+
+def test_orden_topologico_con_ciclo():
+    g, v = dirigido([("A", "B"), ("B", "C"), ("C", "A")])
+    with pytest.raises(ValueError):
+        g.ordenTopologico()
+
+    # Una arista no dirigida cuenta como ciclo
+    g = Graph()
+    g.cargar_aristas([("A", "B")])
+    with pytest.raises(ValueError):
+        g.ordenTopologico()
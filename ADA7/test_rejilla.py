@@ -0,0 +1,135 @@
+import math
+import random
+
+import pytest
+
+from indice_espacial import RejillaEspacial
+
+# --- PRUEBAS DEL ÍNDICE ESPACIAL ---
+# RejillaEspacial contra búsquedas por fuerza bruta: consultas por rectángulo,
+# mas_cercano y las celdas que atraviesa un segmento. Se ejecuta con pytest.
+
+TAM = 10.0
+
+
+def recorte(x0, y0, x1, y1, bx0, by0, bx1, by1):
+    """Tramo [t0, t1] del segmento dentro de la caja (Liang-Barsky), o None."""
+    t0, t1 = 0.0, 1.0
+    for p, q in ((x0 - x1, x0 - bx0), (x1 - x0, bx1 - x0), (y0 - y1, y0 - by0), (y1 - y0, by1 - y0)):
+        if p == 0:
+            if q < 0:
+                return None
+            continue
+        t = q / p
+        if p < 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+    return (t0, t1) if t0 <= t1 else None
+
+
+def celdas_por_fuerza_bruta(x0, y0, x1, y1):
+    """Celdas en las que el segmento recorre un tramo de longitud positiva."""
+    celdas = set()
+    for cx in range(math.floor(min(x0, x1) / TAM), math.floor(max(x0, x1) / TAM) + 1):
+        for cy in range(math.floor(min(y0, y1) / TAM), math.floor(max(y0, y1) / TAM) + 1):
+            tramo = recorte(x0, y0, x1, y1, cx * TAM, cy * TAM, (cx + 1) * TAM, (cy + 1) * TAM)
+            if tramo and (tramo[1] > tramo[0] or x0 == x1 and y0 == y1):
+                celdas.add((cx, cy))
+    return celdas
+
+
+def segmentos_al_azar(n, semilla):
+    rng = random.Random(semilla)
+    segmentos = []
+    for _ in range(n):
+        x0, y0 = rng.uniform(-60, 60), rng.uniform(-60, 60)
+        forma = rng.random()
+        if forma < 0.1:
+            x1, y1 = x0, y0 + rng.uniform(-40, 40)  # Vertical
+        elif forma < 0.2:
+            x1, y1 = x0 + rng.uniform(-40, 40), y0  # Horizontal
+        elif forma < 0.3:
+            x1, y1 = x0 + rng.uniform(-2, 2), y0 + rng.uniform(-2, 2)  # Corto
+        else:
+            x1, y1 = rng.uniform(-60, 60), rng.uniform(-60, 60)
+        segmentos.append((x0, y0, x1, y1))
+    return segmentos
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_celdas_de_un_segmento(semilla):
+    rejilla = RejillaEspacial(TAM)
+    for segmento in segmentos_al_azar(200, semilla):
+        celdas = rejilla._celdas_segmento(*segmento)
+        assert len(celdas) == len(set(celdas))
+        assert set(celdas) == celdas_por_fuerza_bruta(*segmento)
+        # El recorrido va de la celda del inicio a la del final, de vecina en vecina
+        assert celdas[0] == rejilla._celda(*segmento[:2])
+        assert celdas[-1] == rejilla._celda(*segmento[2:])
+        assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(celdas, celdas[1:]))
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_consultar_rectangulos(semilla):
+    """Puntos: exactamente los de dentro. Segmentos: todos los que cruzan y
+    ninguno cuya caja envolvente quede fuera. Rectángulos chicos y grandes
+    pasan por los dos modos de recorrido."""
+    rng = random.Random(semilla)
+    rejilla = RejillaEspacial(TAM)
+    puntos = {f"v{i}": (rng.uniform(-80, 80), rng.uniform(-80, 80)) for i in range(300)}
+    segmentos = {f"e{i}": s for i, s in enumerate(segmentos_al_azar(150, semilla))}
+    for clave, (x, y) in puntos.items():
+        rejilla.insertar_punto(clave, x, y)
+    for clave, s in segmentos.items():
+        rejilla.insertar_segmento(clave, *s)
+
+    for _ in range(100):
+        ancho = rng.choice([1, 15, 60, 400])
+        x0, y0 = rng.uniform(-100, 100), rng.uniform(-100, 100)
+        x1, y1 = x0 + rng.uniform(0, ancho), y0 + rng.uniform(0, ancho)
+        resultado = rejilla.consultar(x0, y0, x1, y1)
+        assert {c for c in resultado if c[0] == "v"} == {
+            c for c, (x, y) in puntos.items() if x0 <= x <= x1 and y0 <= y <= y1}
+        cruzan = {c for c, s in segmentos.items() if recorte(*s, x0, y0, x1, y1)}
+        cajas = {c for c, (ax, ay, bx, by) in segmentos.items()
+                 if min(ax, bx) <= x1 and max(ax, bx) >= x0 and min(ay, by) <= y1 and max(ay, by) >= y0}
+        assert cruzan <= {c for c in resultado if c[0] == "e"} <= cajas
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_mas_cercano(semilla):
+    rng = random.Random(semilla)
+    rejilla = RejillaEspacial(TAM)
+    puntos = {i: (rng.uniform(-50, 50), rng.uniform(-50, 50)) for i in range(200)}
+    for clave, (x, y) in puntos.items():
+        rejilla.insertar_punto(clave, x, y)
+    for _ in range(200):
+        x, y, radio = rng.uniform(-60, 60), rng.uniform(-60, 60), rng.choice([0.5, 3, 12, 40])
+        distancia, cercano = min((math.hypot(px - x, py - y), c) for c, (px, py) in puntos.items())
+        assert rejilla.mas_cercano(x, y, radio) == (cercano if distancia <= radio else None)
+
+
+def test_mover_eliminar_y_limpiar():
+    rejilla = RejillaEspacial(TAM)
+    rejilla.insertar_punto("a", 5, 5)
+    rejilla.insertar_segmento("e", 0, 0, 35, 0.5)
+    assert len(rejilla) == 2 and "a" in rejilla
+    assert rejilla.consultar(30, 0, 31, 1) == {"e"}
+
+    # Insertar de nuevo mueve la clave: deja de estar en las celdas viejas
+    rejilla.insertar_punto("a", 95, 95)
+    rejilla.insertar_segmento("e", 0, 50, 0.5, 52)
+    assert len(rejilla) == 2
+    assert rejilla.consultar(0, 0, 40, 10) == set()
+    assert rejilla.mas_cercano(94, 94, 2) == "a"
+
+    rejilla.eliminar("a")
+    rejilla.eliminar("a")  # Eliminar lo que no está no hace nada
+    assert "a" not in rejilla and rejilla.mas_cercano(94, 94, 2) is None
+    rejilla.eliminar("e")
+    assert len(rejilla) == 0 and rejilla._celdas == {}
+
+    rejilla.insertar_punto("b", 1, 1)
+    rejilla.limpiar()
+    assert len(rejilla) == 0 and rejilla.consultar(-1e6, -1e6, 1e6, 1e6) == set()
@@ -0,0 +1,125 @@
+import os
+import random
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from teselas import PiramideTeselas
+
+# --- PRUEBAS DE LA PIRÁMIDE DE TESELAS ---
+# Las teselas de cada nivel, la composición de la vista contra la imagen
+# original (o reducida), la reconstrucción cuando la imagen cambia y la caché
+# LRU. Se ejecuta con pytest (se omite si Pillow no está instalado).
+
+ANCHO, ALTO = 600, 300  # No son múltiplos del tamaño de tesela
+
+
+def imagen_al_azar(ruta, semilla, tamano=(ANCHO, ALTO)):
+    rng = random.Random(semilla)
+    imagen = Image.frombytes("RGB", tamano, rng.randbytes(tamano[0] * tamano[1] * 3))
+    imagen.save(ruta)
+    return imagen
+
+
+@pytest.fixture
+def mapa(tmp_path):
+    ruta = str(tmp_path / "mapa.png")
+    imagen = imagen_al_azar(ruta, 0)
+    return ruta, imagen, PiramideTeselas(ruta, dir_cache=str(tmp_path / "cache"))
+
+
+def test_niveles_y_teselas(mapa):
+    _, imagen, piramide = mapa
+    # 600x300 -> 300x150 -> 150x75: el último nivel cabe en una tesela
+    assert piramide.tamanos == [(600, 300), (300, 150), (150, 75)]
+    tam = piramide.tam
+    for nivel, (ancho, alto) in enumerate(piramide.tamanos):
+        reducida = imagen.convert("RGBA")
+        for _ in range(nivel):
+            reducida = reducida.reduce(2)
+        for ty in range(-(-alto // tam)):
+            for tx in range(-(-ancho // tam)):
+                caja = (tx * tam, ty * tam, min((tx + 1) * tam, ancho), min((ty + 1) * tam, alto))
+                assert piramide.tesela(nivel, tx, ty).tobytes() == reducida.crop(caja).tobytes()
+
+
+def test_nivel_para_zoom(mapa):
+    piramide = mapa[2]
+    assert [piramide.nivel_para_zoom(z) for z in (4, 1, 0.9, 0.5, 0.3, 0.25, 0.01)] == [0, 0, 0, 1, 1, 2, 2]
+
+
+@pytest.mark.parametrize("ox, oy, ancho, alto", [
+    (0, 0, ANCHO, ALTO),
+    (100, 40, 300, 200),  # Cruza bordes de tesela
+    (250, 0, 20, 20),     # Dentro de una sola tesela
+])
+def test_componer_a_zoom_1(mapa, ox, oy, ancho, alto):
+    _, imagen, piramide = mapa
+    vista = piramide.componer(1, ox, oy, ancho, alto, Image.NEAREST)
+    assert vista.size == (ancho, alto)
+    assert vista.tobytes() == imagen.crop((ox, oy, ox + ancho, oy + alto)).tobytes()
+
+
+def test_componer_fuera_del_mapa_deja_el_fondo(mapa):
+    _, imagen, piramide = mapa
+    fondo = (1, 2, 3)
+    vista = piramide.componer(1, -20, -10, 100, 50, Image.NEAREST, fondo)
+    assert vista.getpixel((5, 5)) == fondo and vista.getpixel((50, 5)) == fondo
+    assert vista.crop((20, 10, 100, 50)).tobytes() == imagen.crop((0, 0, 80, 40)).tobytes()
+    vacia = piramide.componer(1, ANCHO + 10, 0, 50, 50, Image.NEAREST, fondo)
+    assert vacia.getcolors() == [(2500, fondo)]
+
+
+@pytest.mark.parametrize("zoom, nivel", [(0.5, 1), (0.25, 2)])
+def test_componer_niveles_reducidos(mapa, zoom, nivel):
+    """Con zoom 1/2**k la vista es el nivel k tal cual."""
+    _, imagen, piramide = mapa
+    reducida = imagen.convert("RGBA")
+    for _ in range(nivel):
+        reducida = reducida.reduce(2)
+    ancho, alto = piramide.tamanos[nivel]
+    vista = piramide.componer(zoom, 0, 0, ancho, alto, Image.NEAREST)
+    assert vista.tobytes() == reducida.convert("RGB").tobytes()
+    # Con desplazamiento: ox está en px del mundo, 2**nivel por px del nivel
+    f = 2 ** nivel
+    vista = piramide.componer(zoom, 8 * f, 4 * f, 40, 30, Image.NEAREST)
+    assert vista.tobytes() == reducida.convert("RGB").crop((8, 4, 48, 34)).tobytes()
+
+
+def test_reutiliza_la_piramide_del_disco(mapa, monkeypatch):
+    ruta, _, piramide = mapa
+    monkeypatch.setattr(PiramideTeselas, "_construir", lambda *a: pytest.fail("reconstruida"))
+    otra = PiramideTeselas(ruta, dir_cache=os.path.dirname(piramide.directorio))
+    assert otra.directorio == piramide.directorio and otra.tamanos == piramide.tamanos
+
+
+def test_se_reconstruye_si_la_imagen_cambia(mapa):
+    ruta, _, piramide = mapa
+    dir_cache = os.path.dirname(piramide.directorio)
+    piramide.tesela(0, 0, 0)
+
+    # Otro contenido; la fecha se adelanta por si se escribe en el mismo segundo
+    antes = os.stat(ruta).st_mtime
+    nueva = imagen_al_azar(ruta, 1)
+    os.utime(ruta, (antes + 10, antes + 10))
+    otra = PiramideTeselas(ruta, dir_cache=dir_cache)
+    assert otra.directorio != piramide.directorio
+    assert otra.tesela(0, 0, 0).tobytes() == nueva.convert("RGBA").crop((0, 0, 256, 256)).tobytes()
+
+    # Otro tamaño
+    imagen_al_azar(ruta, 2, (100, 80))
+    chica = PiramideTeselas(ruta, dir_cache=dir_cache)
+    assert chica.tamanos == [(100, 80)]
+
+
+def test_cache_lru(mapa):
+    ruta, _, piramide = mapa
+    piramide = PiramideTeselas(ruta, dir_cache=os.path.dirname(piramide.directorio), capacidad=2)
+    a = piramide.tesela(0, 0, 0)
+    piramide.tesela(0, 1, 0)
+    assert piramide.tesela(0, 0, 0) is a  # Desde la caché; ahora es la más reciente
+    piramide.tesela(0, 2, 0)
+    assert list(piramide._cache) == [(0, 0, 0), (0, 2, 0)]
+    assert piramide.tesela(0, 1, 0) is not None  # Se vuelve a leer del disco
+    assert list(piramide._cache) == [(0, 2, 0), (0, 1, 0)]
@@ -0,0 +1,75 @@
+import os
+import sys
+
+import pytest
+
+from grafos import Graph
+
+# --- PRUEBAS DE LAS VISTAS PARA ADA8 ---
+# indiceVertices, comoDiccionario, comoMatriz y comoAristas: contenido, caché
+# por versión y uso directo con los algoritmos de ADA8. Se ejecuta con pytest.
+
+ADA8 = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ADA8-Algoritmos Grafos")
+INF = sys.maxsize
+
+
+def ejemplo():
+    g = Graph()
+    g.cargar_aristas([("A", "B", 1), ("B", "C", 2)])
+    a, c = g.buscaVertices("AC")
+    g.insertaAristaDirigida(c, a, 7)
+    g.insertaAristaDirigida(c, a, 5)  # Paralela más barata
+    return g
+
+
+def test_contenido_de_las_vistas():
+    g = ejemplo()
+    uids, posicion = g.indiceVertices()
+    a, b, c = (posicion[v_uid] for v_uid in g.buscaVertices("ABC"))
+    A, B, C = g.buscaVertices("ABC")
+
+    assert g.comoDiccionario() == {A: {B: 1}, B: {A: 1, C: 2}, C: {B: 2, A: 5}}
+    matriz = g.comoMatriz()
+    assert matriz[a][b] == 1 and matriz[b][a] == 1
+    assert matriz[c][a] == 5 and matriz[a][c] == INF
+    assert all(matriz[i][i] == 0 for i in range(len(uids)))
+    assert sorted(g.comoAristas()) == sorted([(a, b, 1), (b, c, 2), (c, a, 7), (c, a, 5)])
+
+
+def test_las_vistas_se_reutilizan_hasta_que_cambia_el_grafo():
+    g = ejemplo()
+    diccionario, matriz, aristas = g.comoDiccionario(), g.comoMatriz(), g.comoAristas()
+    assert g.comoDiccionario() is diccionario
+    assert g.comoMatriz() is matriz
+    assert g.comoAristas() is aristas
+    # Otros parámetros reconstruyen la vista
+    assert g.comoMatriz(infinito=-1) is not matriz
+
+    g.insertaVertice("D")
+    assert g.comoDiccionario() is not diccionario
+    assert len(g.comoMatriz()) == 4
+    assert len(g.indiceVertices()[0]) == 4
+
+
+def test_las_vistas_son_de_solo_lectura():
+    g = ejemplo()
+    with pytest.raises(TypeError):
+        g.comoDiccionario()[g.buscaVertice("A")] = {}
+    with pytest.raises(TypeError):
+        g.comoMatriz()[0][0] = 1
+
+
+def test_con_los_algoritmos_de_ada8(monkeypatch):
+    """Las vistas sirven tal cual como entrada de dijkstra.py y floyd.py."""
+    monkeypatch.syspath_prepend(ADA8)
+    dijkstra = pytest.importorskip("dijkstra")
+    floyd = pytest.importorskip("floyd")
+    g = ejemplo()
+    A, C = g.buscaVertices("AC")
+    distancias, _ = dijkstra.dijkstra(g.comoDiccionario(), C)
+    assert distancias[A] == 3
+
+    uids, posicion = g.indiceVertices()
+    matriz = floyd.floyd_warshall(g.comoMatriz())
+    assert matriz[posicion[C]][posicion[A]] == 3
+    assert matriz[posicion[A]][posicion[C]] == 3
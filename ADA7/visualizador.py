@@ -0,0 +1,1508 @@
+import customtkinter as ctk
+import heapq
+import math
+import random
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+
+from grafos import Graph, peso_elemento
+from indice_espacial import RejillaEspacial
+
+# --- Pillow (opcional) ---
+# Sin Pillow la aplicación funciona igual, pero con fondo gris en lugar del mapa
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+    from teselas import PiramideTeselas
+except ImportError:
+    Image = ImageDraw = ImageFont = ImageTk = PiramideTeselas = None
+
+# --- NumPy (opcional) ---
+# Solo lo necesita la disposición automática de vértices
+try:
+    from disposicion import DisposicionFuerzas
+except ImportError:
+    DisposicionFuerzas = None
+
+class _TareaCancelada(Exception):
+    """Se lanza en el hilo de trabajo para abandonar un algoritmo cancelado."""
+
+
+class GraphApp(ctk.CTk):
+    
+    VERTEX_RADIUS = 20
+    NODE_COLOR = "#2b2b2b"
+    NODE_HIGHLIGHT_COLOR = "#00AFFF" # Azul
+    NODE_SECOND_COLOR = "#FFAF00" # Naranja
+    EDGE_COLOR = "#303030" # Color más oscuro para mejor contraste
+    EDGE_HIGHLIGHT_COLOR = "#00AFFF"
+    TEXT_COLOR = "#FFFFFF"
+    MAX_FPS = 60  # Límite por defecto de cuadros por segundo al redibujar
+    RESIZE_DEBOUNCE_MS = 150  # Espera tras el último resize antes del re-escalado fino
+    BG_CACHE_SIZE = 4         # Fondos ya compuestos que se conservan (por vista)
+    TILE_CACHE_SIZE = 64      # Teselas del mapa decodificadas en memoria
+    ZOOM_STEP = 1.2
+    MIN_ZOOM = 0.05
+    MAX_ZOOM = 8.0
+    INDEX_CELL_SIZE = 128     # Lado (en px del mundo) de las celdas del índice espacial
+    SELECTION_COLOR = "#FFFF00"
+    LAYOUT_FRAME_BUDGET = 0.012  # Segundos de cálculo de la disposición por cuadro
+    RASTER_THRESHOLD = 4000      # Items visibles a partir de los cuales se rasteriza con Pillow
+    FALLBACK_BG_COLOR = "#1c1c1c"
+    LABEL_CACHE_SIZE = 20000     # Etiquetas rasterizadas que se conservan
+    # Nivel de detalle: el radio en pantalla de los vértices baja con el zoom;
+    # por debajo de estos radios (px) se dejan de dibujar textos, flechas y,
+    # finalmente, vértices sueltos (se agrupan en una rejilla de CLUSTER_CELL_PX)
+    LOD_TEXT_RADIUS = 12
+    LOD_ARROW_RADIUS = 8
+    LOD_CLUSTER_RADIUS = 5
+    CLUSTER_CELL_PX = 48
+    CLUSTER_CACHE_SIZE = 8       # Agrupaciones conservadas (una por nivel de zoom)
+    CLUSTER_MAX_LINKS = 2000     # Aristas entre grupos dibujadas como máximo (las de más peso)
+    TASK_POLL_MS = 30            # Cada cuánto se recoge el progreso de los algoritmos
+    TASK_BATCH_S = 0.02          # El hilo de trabajo envía el progreso en lotes de este tiempo
+
+    def __init__(self):
+        super().__init__()
+        
+        self.title("Visualizador de Grafos sobre Mapa")
+        self.geometry("1200x800")
+        ctk.set_appearance_mode("Dark")
+        
+        self.graph = None
+        self.vertex_coords = {}  # {v_uid: (x, y)} en coordenadas del mundo (ver world_to_screen)
+
+        # --- Índices espaciales (coordenadas del mundo) ---
+        # Los vértices se guardan como puntos y las aristas como segmentos; se
+        # usan para elegir el vértice bajo el cursor, la selección por
+        # rectángulo y para dibujar solo lo que cae dentro de la vista.
+        self.vertex_index = RejillaEspacial(self.INDEX_CELL_SIZE)
+        self.edge_index = RejillaEspacial(self.INDEX_CELL_SIZE)
+
+        # --- Agrupación por nivel de detalle (ver _clusters) ---
+        self._coords_version = 0  # Cambia con cada coordenada o arista modificada
+        self._cluster_cache = OrderedDict()  # LRU {(zoom, versión): agrupación}
+        self._cluster_active = False
+        self._set_graph(Graph(elementos_unicos=True))
+        
+        self._drag_data = {"x": 0, "y": 0, "item": None}
+        self._select_data = {"x": 0, "y": 0, "item": None}  # Rectángulo de selección
+        self.selected_vertices = set()
+
+        # --- Disposición automática en curso (ver auto_layout) ---
+        self._layout = None  # (DisposicionFuerzas, uids, grafo, versión)
+        self._layout_job = None
+
+        # --- Algoritmo en segundo plano (ver _start_task) ---
+        self._task = None
+        self._task_poll_job = None
+
+        # --- Items del canvas por UID (para actualizar sin redibujar todo) ---
+        self.vertex_items = {}  # {v_uid: (oval_id, text_id)}
+        self.edge_items = {}    # {e_uid: (line_id, arrow_id o None)}
+        self.vertex_font = ctk.CTkFont(size=12, weight="bold")
+        self.cluster_font = ctk.CTkFont(size=10, weight="bold")
+
+        # --- Planificador de redibujado (ver _schedule_flush) ---
+        self.max_fps = self.MAX_FPS
+        self._dirty = set()           # Regiones pendientes: "background", "graph"
+        self._dirty_vertices = set()  # Vértices movidos desde el último cuadro
+        self._pending_highlights = {}
+        self.canvas_size = None       # (ancho, alto) actual del canvas
+        self._flush_job = None
+        self._last_frame = 0.0
+        self._frame_times = deque(maxlen=120)  # Duración (s) de los últimos cuadros
+        self._frame_count = 0
+
+        # --- Vista (zoom y desplazamiento) ---
+        # pantalla = (mundo - view_offset) * view_zoom. Las coordenadas del
+        # mundo (vertex_coords) son píxeles del mapa original.
+        self.view_zoom = 1.0
+        self.view_offset = (0.0, 0.0)
+        self._pan_data = {"x": 0, "y": 0}
+
+        # --- Variables para la imagen de fondo ---
+        self.bg_pyramid = None  # PiramideTeselas del mapa (None: fondo gris)
+        self.bg_image_tk = None
+        self.bg_image_pil = None  # La misma imagen en Pillow, para componer el raster
+        self.bg_canvas_item = None
+        self._bg_cache = OrderedDict()  # LRU {(tamaño, zoom, desplazamiento): PhotoImage}
+        self._bg_hq_job = None
+        self._bg_results = queue.Queue()  # (vista, imagen) compuestas por los hilos
+        self._bg_workers = 0
+        self._bg_poll_job = None
+
+        # --- Dibujo rasterizado (ver _render_raster) ---
+        # Con muchos items el canvas de Tk se vuelve lento: el grafo y el fondo
+        # se pintan en una sola imagen y solo lo interactivo queda como items.
+        self.raster_threshold = self.RASTER_THRESHOLD
+        self.raster_image_tk = None
+        self.raster_canvas_item = None
+        self.raster_font = None
+        self._label_cache = {}  # {texto: máscara "L"}: dibujar texto en Pillow es caro
+        self._raster_active = False
+
+        # --- Layout Principal ---
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=3)
+        self.grid_rowconfigure(0, weight=1)
+        
+        # --- Frame de Controles (Izquierda) ---
+        self.control_frame = ctk.CTkScrollableFrame(self, width=350)
+        self.control_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        
+        # --- Canvas de Dibujo (Derecha) ---
+        self.canvas_frame = ctk.CTkFrame(self)
+        self.canvas_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        
+        # Quitamos el color de fondo, la imagen lo reemplazará
+        self.canvas = ctk.CTkCanvas(self.canvas_frame, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # --- Etiqueta de Resultados (Abajo) ---
+        self.result_label = ctk.CTkLabel(self, text="Bienvenido al Visualizador de Grafos",
+                                         font=ctk.CTkFont(size=14, weight="bold"))
+        self.result_label.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
+
+        # --- Poblar Controles ---
+        self.setup_controls()
+        
+        # --- Bindeo para Drag-and-Drop y selección por rectángulo ---
+        # El vértice bajo el cursor se busca en el índice espacial, no en los items
+        self.canvas.bind("<ButtonPress-1>", self.on_canvas_press)
+        self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
+
+        # --- ¡NUEVO! ---
+        # --- Cargar la imagen de fondo y bindeo de redimensionar ---
+        try:
+            if Image is None:
+                raise ImportError("Se necesita la librería Pillow para el mapa. Instálala con: pip install Pillow.")
+
+            # Abrir la pirámide de teselas del mapa (se construye la primera vez)
+            self.bg_pyramid = PiramideTeselas("mapa_fondo.png", capacidad=self.TILE_CACHE_SIZE)
+            
+            # Crear el item de imagen en el canvas
+            self.bg_canvas_item = self.canvas.create_image(0, 0, anchor="nw")
+            
+        except ImportError as e:
+            self.show_result(f"ADVERTENCIA: {e} Se usará fondo gris.", is_error=True)
+            self.canvas.configure(bg="#1c1c1c")
+            self.bg_pyramid = None
+        except FileNotFoundError:
+            self.show_result("ADVERTENCIA: No se encontró 'mapa_fondo.png'. Se usará fondo gris.", is_error=True)
+            self.canvas.configure(bg="#1c1c1c") # Fondo de fallback
+            self.bg_pyramid = None
+        except Exception as e:
+            self.show_result(f"Error cargando imagen: {e}", is_error=True)
+            self.canvas.configure(bg="#1c1c1c")
+            self.bg_pyramid = None
+        # --- FIN NUEVO ---
+
+        # Bindeo para redimensionar, hacer zoom (rueda) y desplazar (botón derecho/central)
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
+        self.canvas.bind("<MouseWheel>", self.on_zoom)  # Windows / macOS
+        self.canvas.bind("<Button-4>", self.on_zoom)    # Linux
+        self.canvas.bind("<Button-5>", self.on_zoom)
+        for button in (2, 3):
+            self.canvas.bind(f"<ButtonPress-{button}>", self.on_pan_start)
+            self.canvas.bind(f"<B{button}-Motion>", self.on_pan_drag)
+
+        # --- Cargar un grafo de ejemplo ---
+        self.load_sample_graph()
+        self.draw_graph()
+
+    # --- ¡NUEVO! ---
+    def on_canvas_resize(self, event):
+        """Se activa cuando el canvas cambia de tamaño. Redimensiona la imagen de fondo."""
+        width = event.width
+        height = event.height
+        
+        # Evitar redimensionar a 0x0 al inicio
+        if width == 0 or height == 0:
+            return
+
+        # Solo se guarda el último tamaño; se redibuja en el próximo cuadro
+        self.canvas_size = (width, height)
+        if self.bg_pyramid:
+            self._dirty.add("background")
+        # Con más canvas puede quedar a la vista parte del grafo que no se dibujó
+        self._dirty.add("graph")
+        self._schedule_flush()
+
+    # --- Vista: zoom y desplazamiento ---
+
+    def world_to_screen(self, x, y):
+        """Convierte coordenadas del mundo (mapa) a coordenadas del canvas."""
+        ox, oy = self.view_offset
+        return ((x - ox) * self.view_zoom, (y - oy) * self.view_zoom)
+
+    def screen_to_world(self, x, y):
+        """Convierte coordenadas del canvas a coordenadas del mundo (mapa)."""
+        ox, oy = self.view_offset
+        return (x / self.view_zoom + ox, y / self.view_zoom + oy)
+
+    def _vertex_radius(self):
+        """Radio en pantalla de los vértices: se achican al alejar la vista."""
+        return self.VERTEX_RADIUS * min(self.view_zoom, 1.0)
+
+    def _visible_world_rect(self):
+        """Rectángulo (x0, y0, x1, y1) del mundo que se ve, con margen para vértices y grupos."""
+        width, height = self.canvas_size or (self.canvas.winfo_width(), self.canvas.winfo_height())
+        margin = max(self.VERTEX_RADIUS, self.CLUSTER_CELL_PX / 2) / self.view_zoom
+        x0, y0 = self.screen_to_world(0, 0)
+        x1, y1 = self.screen_to_world(width, height)
+        return (x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+
+    def _view_changed(self):
+        """Tras un zoom o desplazamiento hay que redibujar fondo y grafo."""
+        if self.bg_pyramid:
+            self._dirty.add("background")
+        self._dirty.add("graph")
+        self._schedule_flush()
+
+    def on_zoom(self, event):
+        """Zoom con la rueda del ratón, manteniendo fijo el punto bajo el cursor."""
+        factor = self.ZOOM_STEP if (event.num == 4 or event.delta > 0) else 1 / self.ZOOM_STEP
+        zoom = min(max(self.view_zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        wx, wy = self.screen_to_world(event.x, event.y)
+        self.view_zoom = zoom
+        self.view_offset = (wx - event.x / zoom, wy - event.y / zoom)
+        self._view_changed()
+
+    def on_pan_start(self, event):
+        """Inicia el desplazamiento de la vista."""
+        self._pan_data["x"] = event.x
+        self._pan_data["y"] = event.y
+
+    def on_pan_drag(self, event):
+        """Desplaza la vista mientras se arrastra con el botón derecho o central."""
+        dx = event.x - self._pan_data["x"]
+        dy = event.y - self._pan_data["y"]
+        ox, oy = self.view_offset
+        self.view_offset = (ox - dx / self.view_zoom, oy - dy / self.view_zoom)
+        self._pan_data["x"] = event.x
+        self._pan_data["y"] = event.y
+        self._view_changed()
+
+    def _view_key(self):
+        """Clave de la vista actual para la caché de fondos."""
+        return (self.canvas_size, self.view_zoom, self.view_offset)
+
+    def _render_background(self):
+        """Dibuja la parte visible del mapa para la vista actual.
+
+        Si la vista está en la caché se usa directamente; si no, se compone
+        una vista previa rápida con las teselas visibles y la versión LANCZOS
+        se hace en un hilo cuando el usuario deja de redimensionar o moverse.
+        """
+        key = self._view_key()
+        cached = self._bg_cache.get(key)
+        if cached is not None:
+            self._bg_cache.move_to_end(key)
+            self._show_background(*cached)
+            return
+
+        (width, height), zoom, (ox, oy) = key
+        preview = self.bg_pyramid.componer(zoom, ox, oy, width, height, Image.Resampling.BILINEAR)
+        self._show_background(ImageTk.PhotoImage(preview), preview)
+
+        # Debounce: cada cambio de vista reinicia la espera
+        if self._bg_hq_job is not None:
+            self.after_cancel(self._bg_hq_job)
+        self._bg_hq_job = self.after(self.RESIZE_DEBOUNCE_MS, self._start_hq_resize, key)
+
+    def _start_hq_resize(self, key):
+        """Lanza la composición de alta calidad en un hilo de trabajo."""
+        self._bg_hq_job = None
+        if key != self._view_key() or key in self._bg_cache:
+            return
+        pyramid = self.bg_pyramid
+        (width, height), zoom, (ox, oy) = key
+
+        def work():
+            # Pillow libera el GIL mientras escala: la GUI sigue respondiendo
+            image = pyramid.componer(zoom, ox, oy, width, height, Image.Resampling.LANCZOS)
+            self._bg_results.put((key, image))
+
+        self._bg_workers += 1
+        threading.Thread(target=work, daemon=True).start()
+        if self._bg_poll_job is None:
+            self._bg_poll_job = self.after(30, self._poll_bg_results)
+
+    def _poll_bg_results(self):
+        """Recoge en el hilo de la GUI los fondos escalados por los hilos de trabajo."""
+        self._bg_poll_job = None
+        while True:
+            try:
+                key, image = self._bg_results.get_nowait()
+            except queue.Empty:
+                break
+            self._bg_workers -= 1
+            photo = ImageTk.PhotoImage(image)
+            self._bg_cache[key] = (photo, image)
+            self._bg_cache.move_to_end(key)
+            while len(self._bg_cache) > self.BG_CACHE_SIZE:
+                self._bg_cache.popitem(last=False)
+            if key == self._view_key():
+                self._show_background(photo, image)
+                # El raster lleva el fondo dentro: hay que recomponerlo
+                if self._raster_active:
+                    self._dirty.add("graph")
+                    self._schedule_flush()
+        if self._bg_workers:
+            self._bg_poll_job = self.after(30, self._poll_bg_results)
+
+    def _show_background(self, photo, image):
+        """Pone la PhotoImage dada (y su imagen de Pillow) como fondo del canvas."""
+        # Actualizar la imagen de PhotoImage (guardamos referencia)
+        self.bg_image_tk = photo
+        self.bg_image_pil = image
+        
+        # Actualizar el item del canvas
+        self.canvas.itemconfig(self.bg_canvas_item, image=self.bg_image_tk)
+        self.canvas.coords(self.bg_canvas_item, 0, 0)
+        self.canvas.lower(self.bg_canvas_item) # Asegurar que esté al fondo
+
+    # --- Planificador de redibujado ---
+    # Los eventos solo marcan regiones como sucias; un único volcado por cuadro
+    # (como mucho max_fps por segundo) dibuja todo lo pendiente.
+
+    def _schedule_flush(self):
+        """Programa el volcado del próximo cuadro si no hay uno pendiente."""
+        if self._flush_job is not None:
+            return
+        wait = self._last_frame + 1.0 / self.max_fps - time.perf_counter()
+        if wait > 0:
+            self._flush_job = self.after(int(wait * 1000) + 1, self._flush)
+        else:
+            self._flush_job = self.after_idle(self._flush)
+
+    def _flush(self):
+        """Dibuja de una vez todo lo marcado como sucio desde el último cuadro."""
+        self._flush_job = None
+        start = time.perf_counter()
+        dirty, self._dirty = self._dirty, set()
+        moved, self._dirty_vertices = self._dirty_vertices, set()
+
+        if "background" in dirty and self.bg_pyramid and self.canvas_size:
+            self._render_background()
+        if "graph" in dirty:
+            self._render_graph(self._pending_highlights)
+        elif moved:
+            self._render_moved_vertices(moved)
+
+        end = time.perf_counter()
+        self._last_frame = end
+        self._frame_times.append(end - start)
+        self._frame_count += 1
+
+    def frame_stats(self):
+        """Devuelve estadísticas de los últimos cuadros (tiempos en ms)."""
+        times = self._frame_times
+        return {
+            "frames": self._frame_count,
+            "last_ms": times[-1] * 1000 if times else 0.0,
+            "avg_ms": sum(times) / len(times) * 1000 if times else 0.0,
+            "max_ms": max(times) * 1000 if times else 0.0,
+            "fps_cap": self.max_fps,
+            "raster": self._raster_active,
+        }
+
+    # --- Lógica de Dibujo ---
+
+    def draw_graph(self, highlights={}):
+        """Pide redibujar el grafo completo en el próximo cuadro.
+        highlights = {"vertices": {v_uid: color}, "edges": {e_uid: color}}
+        """
+        self._pending_highlights = highlights
+        self._dirty.add("graph")
+        self._schedule_flush()
+
+    def _render_graph(self, highlights):
+        """Dibuja en el canvas la parte del grafo que cae dentro de la vista."""
+        
+        # --- ¡MODIFICADO! ---
+        # Ya no usamos self.canvas.delete("all") para no borrar el fondo
+        self.canvas.delete("edge")
+        self.canvas.delete("vertex")
+        self.canvas.delete("vertex_text")
+        self.canvas.delete("cluster")
+        # --- FIN MODIFICADO ---
+        self.vertex_items = {}
+        self.edge_items = {}
+        
+        highlight_v = highlights.get("vertices", {})
+        highlight_e = highlights.get("edges", {})
+
+        # Solo se crean items para lo que está en la vista (los índices solo
+        # contienen vértices y aristas con coordenadas)
+        visible = self._visible_world_rect()
+
+        # Muy alejado: grupos de vértices en lugar de vértices sueltos
+        radius = self._vertex_radius()
+        self._cluster_active = radius < self.LOD_CLUSTER_RADIUS
+        if self._cluster_active:
+            if self._raster_active:
+                self.canvas.itemconfig(self.raster_canvas_item, state="hidden")
+                self._raster_active = False
+            self._render_clusters(visible, highlight_v)
+            return
+        show_text = radius >= self.LOD_TEXT_RADIUS
+        show_arrows = radius >= self.LOD_ARROW_RADIUS
+
+        edges = self.edge_index.consultar(*visible)
+        vertices = self.vertex_index.consultar(*visible)
+
+        # Con demasiados items se rasteriza todo menos lo resaltado y el
+        # vértice arrastrado (con sus aristas), que siguen siendo items
+        if Image is not None and len(edges) + len(vertices) > self.raster_threshold:
+            live_v = {v_uid for v_uid in vertices
+                      if v_uid in highlight_v or v_uid == self._drag_data["item"]}
+            live_e = {e_uid for e_uid in edges if e_uid in highlight_e}
+            for v_uid in live_v:
+                live_e.update(e_uid for e_uid in self.graph.aristasIncidentes(v_uid) if e_uid in edges)
+            self._render_raster(edges - live_e, vertices - live_v, show_text, show_arrows)
+            edges, vertices = live_e, live_v
+        elif self._raster_active:
+            self.canvas.itemconfig(self.raster_canvas_item, state="hidden")
+            self._raster_active = False
+
+        # 1. Dibujar Aristas
+        for e_uid in edges:
+            edge = self.graph._edges[e_uid]
+            v1, v2 = edge.endpoints()
+            
+            x1, y1 = self.world_to_screen(*self.vertex_coords[v1._uid])
+            x2, y2 = self.world_to_screen(*self.vertex_coords[v2._uid])
+            
+            color = highlight_e.get(e_uid, self.EDGE_COLOR)
+            width = 3 if e_uid in highlight_e else 1.5
+            
+            # Usamos tags para poder borrarlos luego
+            line_tags = ("edge", e_uid)
+            line_id = self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width, tags=line_tags)
+            
+            arrow_id = None
+            if edge._directed and show_arrows:
+                # El tag 'edge' también se aplica a la flecha
+                arrow_id = self._draw_arrow(x1, y1, x2, y2, color, line_tags)
+            self.edge_items[e_uid] = (line_id, arrow_id)
+
+        # 2. Dibujar Vértices (encima de las aristas)
+        for v_uid in vertices:
+            vertex = self.graph._vertices[v_uid]
+                
+            x, y = self.world_to_screen(*self.vertex_coords[v_uid])
+            
+            color = highlight_v.get(v_uid, self.NODE_COLOR)
+            
+            oval_id = self.canvas.create_oval(
+                x - radius, y - radius, x + radius, y + radius,
+                fill=color, outline=color, tags=("vertex", "vertex_" + v_uid, v_uid)
+            )
+            text_id = None
+            if show_text:
+                text_id = self.canvas.create_text(
+                    x, y, text=str(vertex._element), fill=self.TEXT_COLOR,
+                    font=self.vertex_font,
+                    tags=("vertex_text", "text_" + v_uid, v_uid)
+                )
+            self.vertex_items[v_uid] = (oval_id, text_id)
+
+    def _clusters(self):
+        """Agrupa los vértices en una rejilla de CLUSTER_CELL_PX px de pantalla.
+
+        Devuelve (grupos, centros, enlaces, indice_enlaces, miembro): grupos
+        es {celda: (n, x, y)} con el centro de masa en el mundo, enlaces es
+        {(celda_a, celda_b): número de aristas} y miembro {v_uid: celda}. Se
+        cachea por zoom (la rejilla está fija en el mundo, así que desplazar
+        la vista no la invalida) y por versión de las coordenadas.
+        """
+        key = (self.view_zoom, self._coords_version)
+        cached = self._cluster_cache.get(key)
+        if cached is not None:
+            self._cluster_cache.move_to_end(key)
+            return cached
+
+        cell = self.CLUSTER_CELL_PX / self.view_zoom
+        sums = {}    # {celda: [n, suma_x, suma_y]}
+        member = {}  # {v_uid: celda}
+        for v_uid, (x, y) in self.vertex_coords.items():
+            c = (math.floor(x / cell), math.floor(y / cell))
+            s = sums.get(c)
+            if s is None:
+                sums[c] = [1, x, y]
+            else:
+                s[0] += 1
+                s[1] += x
+                s[2] += y
+            member[v_uid] = c
+
+        groups = {}
+        centers = RejillaEspacial(cell)
+        for c, (n, sx, sy) in sums.items():
+            groups[c] = (n, sx / n, sy / n)
+            centers.insertar_punto(c, sx / n, sy / n)
+
+        # Aristas entre grupos distintos, sumadas por par de grupos
+        links = {}
+        for edge in self.graph._edges.values():
+            v1, v2 = edge.endpoints()
+            a, b = member.get(v1._uid), member.get(v2._uid)
+            if a is None or b is None or a == b:
+                continue
+            pair = (a, b) if a < b else (b, a)
+            links[pair] = links.get(pair, 0) + 1
+        link_index = RejillaEspacial(cell * 4)
+        for a, b in links:
+            link_index.insertar_segmento((a, b), *groups[a][1:], *groups[b][1:])
+
+        cached = (groups, centers, links, link_index, member)
+        self._cluster_cache[key] = cached
+        while len(self._cluster_cache) > self.CLUSTER_CACHE_SIZE:
+            self._cluster_cache.popitem(last=False)
+        return cached
+
+    def _render_clusters(self, visible, highlight_v):
+        """Dibuja los grupos visibles con su número de vértices y las aristas entre grupos."""
+        groups, centers, links, link_index, member = self._clusters()
+        highlighted = {member[v_uid]: color for v_uid, color in highlight_v.items() if v_uid in member}
+
+        visible_links = link_index.consultar(*visible)
+        if len(visible_links) > self.CLUSTER_MAX_LINKS:
+            visible_links = heapq.nlargest(self.CLUSTER_MAX_LINKS, visible_links, key=links.get)
+        for pair in visible_links:
+            a, b = pair
+            x1, y1 = self.world_to_screen(*groups[a][1:])
+            x2, y2 = self.world_to_screen(*groups[b][1:])
+            width = min(1 + math.log2(links[pair]), 6)
+            self.canvas.create_line(x1, y1, x2, y2, fill=self.EDGE_COLOR, width=width, tags=("cluster",))
+
+        for c in centers.consultar(*visible):
+            n, x, y = groups[c]
+            x, y = self.world_to_screen(x, y)
+            r = min(self.LOD_CLUSTER_RADIUS + 2 * math.log2(n), self.CLUSTER_CELL_PX / 2)
+            color = highlighted.get(c, self.NODE_COLOR)
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=color,
+                                    outline=self.NODE_HIGHLIGHT_COLOR if n > 1 else color,
+                                    tags=("cluster",))
+            if n > 1:
+                self.canvas.create_text(x, y, text=str(n), fill=self.TEXT_COLOR,
+                                        font=self.cluster_font, tags=("cluster",))
+            
+    def _render_raster(self, edges, vertices, show_text=True, show_arrows=True):
+        """Pinta las aristas y vértices dados sobre el fondo en una sola imagen del canvas."""
+        width, height = self.canvas_size or (self.canvas.winfo_width(), self.canvas.winfo_height())
+        # El fondo ya está compuesto para esta vista (se dibuja antes que el grafo)
+        if self.bg_image_pil is not None and self.bg_image_pil.size == (width, height):
+            image = self.bg_image_pil.convert("RGB")
+        else:
+            image = Image.new("RGB", (width, height), self.FALLBACK_BG_COLOR)
+        draw = ImageDraw.Draw(image)
+
+        for e_uid in edges:
+            edge = self.graph._edges[e_uid]
+            v1, v2 = edge.endpoints()
+            x1, y1 = self.world_to_screen(*self.vertex_coords[v1._uid])
+            x2, y2 = self.world_to_screen(*self.vertex_coords[v2._uid])
+            draw.line((x1, y1, x2, y2), fill=self.EDGE_COLOR, width=2)
+            if edge._directed and show_arrows:
+                draw.polygon(self._arrow_points(x1, y1, x2, y2), fill=self.EDGE_COLOR)
+
+        r = self._vertex_radius()
+        for v_uid in vertices:
+            x, y = self.world_to_screen(*self.vertex_coords[v_uid])
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=self.NODE_COLOR)
+            if not show_text:
+                continue
+            mask = self._label_mask(str(self.graph._vertices[v_uid]._element))
+            image.paste(self.TEXT_COLOR, (round(x - mask.width / 2), round(y - mask.height / 2)), mask)
+
+        self.raster_image_tk = ImageTk.PhotoImage(image)
+        if self.raster_canvas_item is None:
+            self.raster_canvas_item = self.canvas.create_image(0, 0, anchor="nw", tags=("raster",))
+        self.canvas.itemconfig(self.raster_canvas_item, image=self.raster_image_tk, state="normal")
+        # Encima del fondo y debajo de los items vivos
+        self.canvas.lower(self.raster_canvas_item)
+        if self.bg_canvas_item is not None:
+            self.canvas.lower(self.bg_canvas_item)
+        self._raster_active = True
+
+    def _label_mask(self, text):
+        """Máscara con el texto dibujado, creada una vez por texto y reutilizada."""
+        mask = self._label_cache.get(text)
+        if mask is None:
+            if self.raster_font is None:
+                try:
+                    self.raster_font = ImageFont.load_default(size=12)
+                except TypeError:  # Pillow < 10.1: solo la fuente de mapa de bits
+                    self.raster_font = ImageFont.load_default()
+            left, top, right, bottom = self.raster_font.getbbox(text)
+            mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+            ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=self.raster_font)
+            if len(self._label_cache) >= self.LABEL_CACHE_SIZE:
+                self._label_cache.clear()
+            self._label_cache[text] = mask
+        return mask
+
+    # --- ¡NUEVO! ---
+    # Modificado para aceptar tags
+    def _draw_arrow(self, x1, y1, x2, y2, color, tags):
+        """Dibuja una flecha al final de una línea y devuelve su id."""
+        return self.canvas.create_polygon(*self._arrow_points(x1, y1, x2, y2),
+                                          fill=color, tags=tags)
+
+    def _arrow_points(self, x1, y1, x2, y2):
+        """Calcula los tres puntos del triángulo de la flecha."""
+        radius = self._vertex_radius()
+        size = 15 * radius / self.VERTEX_RADIUS
+        try:
+            angle = math.atan2(y2 - y1, x2 - x1)
+        except ValueError:
+            angle = 0 # Evitar crash si (x1,y1) == (x2,y2)
+        
+        # Calcular el punto final en el borde del círculo
+        end_x = x2 - radius * math.cos(angle)
+        end_y = y2 - radius * math.sin(angle)
+        
+        p1_x = end_x - size * math.cos(angle - math.pi / 6)
+        p1_y = end_y - size * math.sin(angle - math.pi / 6)
+        p2_x = end_x - size * math.cos(angle + math.pi / 6)
+        p2_y = end_y - size * math.sin(angle + math.pi / 6)
+        
+        return (end_x, end_y, p1_x, p1_y, p2_x, p2_y)
+    # --- FIN NUEVO ---
+
+
+    # --- EL RESTO DE TU CÓDIGO ---
+    # (setup_controls, load_sample_graph, Handlers de Drag-and-Drop,
+    #  Handlers de Botones, etc. van aquí SIN CAMBIOS)
+    def setup_controls(self):
+        """Crea todos los botones y campos de entrada."""
+        frame = self.control_frame
+        row = 0
+
+        # --- Entradas ---
+        ctk.CTkLabel(frame, text="Parámetros:", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(5, 5), sticky="w")
+        row += 1
+        
+        ctk.CTkLabel(frame, text="Vértice v:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
+        self.entry_v = ctk.CTkEntry(frame, placeholder_text="Ej: A")
+        self.entry_v.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        row += 1
+
+        ctk.CTkLabel(frame, text="Vértice w:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
+        self.entry_w = ctk.CTkEntry(frame, placeholder_text="Ej: B")
+        self.entry_w.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        row += 1
+
+        ctk.CTkLabel(frame, text="Arista e:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
+        self.entry_e = ctk.CTkEntry(frame, placeholder_text="UID (ej: e0)")
+        self.entry_e.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        ctk.CTkLabel(frame, text="Objeto o:").grid(row=row, column=0, padx=5, pady=5, sticky="w")
+        self.entry_o = ctk.CTkEntry(frame, placeholder_text="Dato (ej: A)")
+        self.entry_o.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        # --- Separador ---
+        ctk.CTkLabel(frame, text="").grid(row=row, column=0)
+        row += 1
+
+        # --- Operaciones Generales ---
+        ctk.CTkLabel(frame, text="Operaciones Generales", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5), sticky="w")
+        row += 1
+        
+        ctk.CTkButton(frame, text="numVertices()", command=self.on_numVertices).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="numAristas()", command=self.on_numAristas).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+        
+        ctk.CTkButton(frame, text="vertices()", command=self.on_vertices).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="aristas()", command=self.on_aristas).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+        
+        ctk.CTkButton(frame, text="grado(v)", command=self.on_grado).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="verticesAdyacentes(v)", command=self.on_verticesAdyacentes).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+
+        ctk.CTkButton(frame, text="aristasIncidentes(v)", command=self.on_aristasIncidentes).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="verticesFinales(e)", command=self.on_verticesFinales).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+        
+        ctk.CTkButton(frame, text="opuesto(v, e)", command=self.on_opuesto).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="esAdyacente(v, w)", command=self.on_esAdyacente).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+
+        # --- Operaciones Dirigidas ---
+        ctk.CTkLabel(frame, text="Operaciones Dirigidas", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5), sticky="w")
+        row += 1
+        
+        ctk.CTkButton(frame, text="aristasDirigidas()", command=self.on_aristasDirigidas).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="aristasNodirigidas()", command=self.on_aristasNodirigidas).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+        ctk.CTkButton(frame, text="gradoEnt(v)", command=self.on_gradoEnt).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="gradoSalida(v)", command=self.on_gradoSalida).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+
+        # --- Operaciones de Actualización ---
+        ctk.CTkLabel(frame, text="Operaciones de Actualización", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5), sticky="w")
+        row += 1
+        
+        ctk.CTkButton(frame, text="insertaVertice(o)", command=self.on_insertaVertice, fg_color="green").grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="eliminaVertice(v)", command=self.on_eliminaVertice, fg_color="red").grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+
+        ctk.CTkButton(frame, text="insertaArista(v,w,o)", command=self.on_insertaArista, fg_color="green").grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="eliminaArista(e)", command=self.on_eliminaArista, fg_color="red").grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+
+        ctk.CTkButton(frame, text="insertaAristaDirigida(v,w,o)", command=self.on_insertaAristaDirigida, fg_color="green").grid(row=row, column=0, columnspan=2, padx=5, pady=3, sticky="ew")
+        row += 1
+
+        # --- Algoritmos (en segundo plano) ---
+        ctk.CTkLabel(frame, text="Algoritmos", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5), sticky="w")
+        row += 1
+
+        ctk.CTkButton(frame, text="Ruta más corta (v → w)", command=self.on_route).grid(row=row, column=0, padx=5, pady=3, sticky="ew")
+        ctk.CTkButton(frame, text="Árbol de expansión mínima", command=self.on_mst).grid(row=row, column=1, padx=5, pady=3, sticky="ew")
+        row += 1
+        
+        # --- Control ---
+        ctk.CTkLabel(frame, text="").grid(row=row, column=0)
+        row += 1
+        ctk.CTkButton(frame, text="Limpiar Grafo", command=self.on_clear_graph, fg_color="#D35400").grid(row=row, column=0, columnspan=2, padx=5, pady=10, sticky="ew")
+        row += 1
+        ctk.CTkButton(frame, text="Rendimiento de dibujo", command=self.on_frame_stats).grid(row=row, column=0, columnspan=2, padx=5, pady=3, sticky="ew")
+        row += 1
+        ctk.CTkButton(frame, text="Auto-disposición", command=self.auto_layout).grid(row=row, column=0, columnspan=2, padx=5, pady=3, sticky="ew")
+        row += 1
+
+
+    def load_sample_graph(self):
+        """Carga un grafo simple para demostración."""
+        self.on_clear_graph()
+        try:
+            # Estas coordenadas ahora se dibujarán SOBRE el mapa
+            vA = self.graph.insertaVertice("A")
+            vB = self.graph.insertaVertice("B")
+            vC = self.graph.insertaVertice("C")
+            vD = self.graph.insertaVertice("D")
+            
+            self._set_vertex_coords(vA, 100, 100)
+            self._set_vertex_coords(vB, 300, 150)
+            self._set_vertex_coords(vC, 100, 300)
+            self._set_vertex_coords(vD, 400, 350)
+
+            self.graph.insertaArista(vA, vB, "e_AB")
+            self.graph.insertaArista(vA, vC, "e_AC")
+            self.graph.insertaAristaDirigida(vB, vC, "e_BC")
+            self.graph.insertaAristaDirigida(vC, vD, "e_CD")
+        except Exception as e:
+            self.show_result(f"Error cargando grafo: {e}", is_error=True)
+            
+    # --- Grafo e índices espaciales ---
+
+    def _set_graph(self, graph):
+        """Cambia el grafo mostrado y sigue sus cambios para mantener los índices."""
+        if self.graph is not None:
+            self.graph.desuscribir(self._on_graph_change)
+        self.graph = graph
+        self.vertex_coords = {}
+        self.vertex_index.limpiar()
+        self.edge_index.limpiar()
+        self._cluster_cache.clear()
+        graph.suscribir(self._on_graph_change)
+
+    def _on_graph_change(self, cambio):
+        """Mantiene coordenadas e índices al día con cada cambio del grafo."""
+        self._coords_version += 1
+        if cambio.tipo == Graph.ARISTA_INSERTADA:
+            self._index_edge(cambio.uid, cambio.datos[0], cambio.datos[1])
+        elif cambio.tipo == Graph.ARISTA_ELIMINADA:
+            self.edge_index.eliminar(cambio.uid)
+        elif cambio.tipo == Graph.VERTICE_ELIMINADO:
+            self.vertex_coords.pop(cambio.uid, None)
+            self.vertex_index.eliminar(cambio.uid)
+            self.selected_vertices.discard(cambio.uid)
+
+    def _index_edge(self, e_uid, v1_uid, v2_uid):
+        """Guarda la arista en el índice si sus dos extremos tienen coordenadas."""
+        if v1_uid in self.vertex_coords and v2_uid in self.vertex_coords:
+            self.edge_index.insertar_segmento(e_uid, *self.vertex_coords[v1_uid],
+                                              *self.vertex_coords[v2_uid])
+
+    def _set_vertex_coords(self, v_uid, x, y):
+        """Coloca el vértice en (x, y) del mundo y actualiza los índices."""
+        self._coords_version += 1
+        self.vertex_coords[v_uid] = (x, y)
+        self.vertex_index.insertar_punto(v_uid, x, y)
+        for e_uid in self.graph.aristasIncidentes(v_uid):
+            self._index_edge(e_uid, *self.graph.verticesFinales(e_uid))
+
+    def vertex_at(self, x, y):
+        """Devuelve el UID del vértice bajo el punto (x, y) del canvas, o None."""
+        # Con la vista agrupada no hay vértices sueltos que tomar
+        if self._cluster_active:
+            return None
+        wx, wy = self.screen_to_world(x, y)
+        return self.vertex_index.mas_cercano(wx, wy, self._vertex_radius() / self.view_zoom)
+
+    # --- Disposición automática ---
+
+    def auto_layout(self):
+        """Coloca por fuerzas los vértices sin coordenadas, una iteración por cuadro.
+
+        Los vértices que ya tienen coordenadas quedan fijos, igual que el que
+        se esté arrastrando. Los nuevos empiezan al azar dentro de la vista.
+        """
+        if DisposicionFuerzas is None:
+            self.show_result("Error: Se necesita NumPy para la disposición automática (pip install numpy).", is_error=True)
+            return
+        uids = list(self.graph._vertices)
+        fijos = [v_uid in self.vertex_coords for v_uid in uids]
+        if all(fijos):
+            self.show_result("Todos los vértices ya tienen coordenadas.")
+            return
+
+        margin = self.VERTEX_RADIUS / self.view_zoom
+        x0, y0, x1, y1 = self._visible_world_rect()
+        caja = (x0 + 2 * margin, y0 + 2 * margin, max(x1 - 2 * margin, x0 + 3 * margin), max(y1 - 2 * margin, y0 + 3 * margin))
+        posiciones = [self.vertex_coords.get(v_uid) or (random.uniform(caja[0], caja[2]), random.uniform(caja[1], caja[3]))
+                      for v_uid in uids]
+        indices = {v_uid: i for i, v_uid in enumerate(uids)}
+        aristas = [(indices[v1._uid], indices[v2._uid])
+                   for v1, v2 in (edge.endpoints() for edge in self.graph._edges.values())]
+
+        layout = DisposicionFuerzas(posiciones, aristas, fijos=fijos, caja=caja)
+        self._layout = (layout, uids, self.graph, self.graph._version)
+        self.show_result(f"Disponiendo {fijos.count(False)} vértices...")
+        if self._layout_job is None:
+            self._layout_job = self.after_idle(self._layout_step)
+
+    def _layout_step(self):
+        """Avanza la disposición lo que quepa en un cuadro y vuelca las posiciones."""
+        self._layout_job = None
+        if self._layout is None:
+            return
+        layout, uids, graph, version = self._layout
+        # Si el grafo cambió, los índices ya no corresponden a los vértices
+        if graph is not self.graph or graph._version != version:
+            self._layout = None
+            self.show_result("Disposición cancelada: el grafo cambió.", is_error=True)
+            return
+
+        # El vértice arrastrado queda fijo donde lo tiene el usuario
+        dragged = self._drag_data["item"]
+        if dragged is not None:
+            i = uids.index(dragged)
+            layout.fijos[i] = True
+            layout.pos[i] = self.vertex_coords[dragged]
+
+        end = time.perf_counter() + self.LAYOUT_FRAME_BUDGET
+        while not layout.terminada() and time.perf_counter() < end:
+            layout.paso()
+
+        for v_uid, fijo, (x, y) in zip(uids, layout.fijos.tolist(), layout.pos.tolist()):
+            if not fijo:
+                self._set_vertex_coords(v_uid, x, y)
+        self.draw_graph(self._pending_highlights)
+
+        if layout.terminada():
+            self._layout = None
+            self.show_result(f"Disposición terminada en {layout.iteraciones} iteraciones.")
+        else:
+            self._layout_job = self.after(int(1000 / self.max_fps), self._layout_step)
+
+    # --- Algoritmos en segundo plano ---
+
+    def _start_task(self, name, work, on_done):
+        """Ejecuta work(instantánea, emitir) en un hilo sobre una instantánea del grafo.
+
+        work llama a emitir(v_uid, e_uid) con cada vértice o arista que avanza
+        (cualquiera puede ser None); el progreso llega por una cola y se dibuja
+        por lotes. on_done(resultado) se llama en el hilo de la GUI al terminar.
+        Si el grafo cambia antes, el algoritmo se cancela.
+        """
+        self._cancel_task()
+        snapshot = self.graph.instantanea()
+        cancel = threading.Event()
+        results = queue.Queue()
+        batch_s = self.TASK_BATCH_S
+
+        def run():
+            batch = []
+            last = time.perf_counter()
+
+            def emit(v_uid, e_uid):
+                nonlocal batch, last
+                if cancel.is_set():
+                    raise _TareaCancelada
+                batch.append((v_uid, e_uid))
+                now = time.perf_counter()
+                if now - last >= batch_s:
+                    results.put(("progress", batch))
+                    batch = []
+                    last = now
+
+            try:
+                result = work(snapshot, emit)
+            except _TareaCancelada:
+                return
+            except Exception as e:
+                results.put(("error", e))
+                return
+            results.put(("progress", batch))
+            results.put(("done", result))
+
+        self._task = {"name": name, "graph": self.graph, "version": self.graph._version,
+                      "cancel": cancel, "queue": results, "on_done": on_done,
+                      "highlights": {"vertices": {}, "edges": {}}}
+        self.draw_graph(self._task["highlights"])
+        self.show_result(f"{name}: calculando...")
+        threading.Thread(target=run, daemon=True).start()
+        if self._task_poll_job is None:
+            self._task_poll_job = self.after(self.TASK_POLL_MS, self._poll_task)
+
+    def _cancel_task(self):
+        """Pide al hilo de trabajo que abandone el algoritmo en curso."""
+        if self._task is not None:
+            self._task["cancel"].set()
+            self._task = None
+
+    def _poll_task(self):
+        """Recoge el progreso del algoritmo en curso y lo dibuja."""
+        self._task_poll_job = None
+        task = self._task
+        if task is None:
+            return
+        # El resultado ya no correspondería al grafo mostrado
+        if task["graph"] is not self.graph or self.graph._version != task["version"]:
+            self._cancel_task()
+            self.show_result(f"{task['name']}: cancelado porque el grafo cambió.", is_error=True)
+            self.draw_graph()
+            return
+
+        new_v, new_e = {}, {}
+        while True:
+            try:
+                kind, data = task["queue"].get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                for v_uid, e_uid in data:
+                    if v_uid is not None:
+                        new_v[v_uid] = self.NODE_SECOND_COLOR
+                    if e_uid is not None:
+                        new_e[e_uid] = self.NODE_SECOND_COLOR
+            elif kind == "error":
+                self._task = None
+                self.draw_graph()
+                self.show_result(f"{task['name']}: error: {data}", is_error=True)
+                return
+            else:
+                self._task = None
+                task["on_done"](data)
+                return
+
+        if new_v or new_e:
+            self._add_highlights(task["highlights"], new_v, new_e)
+        self._task_poll_job = self.after(self.TASK_POLL_MS, self._poll_task)
+
+    def _add_highlights(self, highlights, vertices, edges):
+        """Suma resaltados cambiando solo el color de esos items, sin redibujar todo."""
+        highlights["vertices"].update(vertices)
+        highlights["edges"].update(edges)
+        self._pending_highlights = highlights
+        # Rasterizado o agrupado, resaltar cambia qué se dibuja: hay que redibujar
+        if self._raster_active or self._cluster_active:
+            self.draw_graph(highlights)
+            return
+        for v_uid, color in vertices.items():
+            items = self.vertex_items.get(v_uid)
+            if items is not None:
+                self.canvas.itemconfig(items[0], fill=color, outline=color)
+        for e_uid, color in edges.items():
+            items = self.edge_items.get(e_uid)
+            if items is not None:
+                line_id, arrow_id = items
+                self.canvas.itemconfig(line_id, fill=color, width=3)
+                if arrow_id is not None:
+                    self.canvas.itemconfig(arrow_id, fill=color)
+
+    def on_route(self):
+        """Camino más corto de v a w (Dijkstra), mostrando los vértices ya fijados."""
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        w_uid = self._get_vertex_uid_from_entry(self.entry_w)
+        if not v_uid or not w_uid:
+            return
+        origin, target = self.entry_v.get(), self.entry_w.get()
+
+        def work(snapshot, emit):
+            arrival = {}
+            for u_uid, distance, e_uid in snapshot.dijkstra(v_uid, peso_elemento):
+                arrival[u_uid] = e_uid
+                emit(u_uid, e_uid)
+                if u_uid == w_uid:
+                    break
+            else:
+                return None
+            path_v, path_e = [w_uid], []
+            while arrival[path_v[-1]] is not None:
+                e_uid = arrival[path_v[-1]]
+                path_e.append(e_uid)
+                path_v.append(snapshot.opuesto(path_v[-1], e_uid))
+            return distance, path_v, path_e
+
+        def done(result):
+            if result is None:
+                self.draw_graph()
+                self.show_result(f"No hay camino de '{origin}' a '{target}'.", is_error=True)
+                return
+            distance, path_v, path_e = result
+            self.draw_graph(highlights={"vertices": {u: self.NODE_HIGHLIGHT_COLOR for u in path_v},
+                                        "edges": {e: self.EDGE_HIGHLIGHT_COLOR for e in path_e}})
+            self.show_result(f"Ruta de '{origin}' a '{target}': {len(path_e)} aristas, costo {distance:g}.")
+
+        self._start_task("Ruta más corta", work, done)
+
+    def on_mst(self):
+        """Árbol (bosque) de expansión mínima con Kruskal, mostrando las aristas aceptadas."""
+        def work(snapshot, emit):
+            total, tree = 0, []
+            for e_uid in snapshot.arbolExpansionMinima(peso_elemento):
+                emit(None, e_uid)
+                total += peso_elemento(snapshot._edges[e_uid]._element)
+                tree.append(e_uid)
+            return total, tree
+
+        def done(result):
+            total, tree = result
+            self.draw_graph(highlights={"edges": {e: self.EDGE_HIGHLIGHT_COLOR for e in tree}})
+            self.show_result(f"Árbol de expansión mínima: {len(tree)} aristas, peso total {total:g}.")
+
+        self._start_task("Árbol de expansión mínima", work, done)
+
+    # --- Handlers de Drag-and-Drop y selección ---
+
+    def on_canvas_press(self, event):
+        """Inicia el arrastre de un vértice o, sobre el fondo, un rectángulo de selección."""
+        v_uid = self.vertex_at(event.x, event.y)
+        if v_uid is not None:
+            self._drag_data["item"] = v_uid
+            self._drag_data["x"] = event.x
+            self._drag_data["y"] = event.y
+            # Si está rasterizado, el vértice pasa a ser un item para poder moverlo
+            if self._raster_active:
+                self.draw_graph(self._pending_highlights)
+            return
+
+        self._select_data["x"] = event.x
+        self._select_data["y"] = event.y
+        self._select_data["item"] = self.canvas.create_rectangle(
+            event.x, event.y, event.x, event.y,
+            outline=self.SELECTION_COLOR, dash=(4, 2), tags=("selection",))
+
+    def on_canvas_drag(self, event):
+        """Mueve el vértice arrastrado o estira el rectángulo de selección."""
+        if self._drag_data["item"]:
+            v_uid = self._drag_data["item"]
+            # El desplazamiento en pantalla se pasa a coordenadas del mundo
+            dx = (event.x - self._drag_data["x"]) / self.view_zoom
+            dy = (event.y - self._drag_data["y"]) / self.view_zoom
+            
+            x, y = self.vertex_coords[v_uid]
+            self._set_vertex_coords(v_uid, x + dx, y + dy)
+            
+            self._drag_data["x"] = event.x
+            self._drag_data["y"] = event.y
+            
+            # Los items del canvas se mueven en el próximo cuadro
+            self._dirty_vertices.add(v_uid)
+            self._schedule_flush()
+        elif self._select_data["item"] is not None:
+            self.canvas.coords(self._select_data["item"], self._select_data["x"],
+                               self._select_data["y"], event.x, event.y)
+
+    def on_canvas_release(self, event):
+        """Termina el arrastre o selecciona los vértices dentro del rectángulo."""
+        if self._drag_data["item"]:
+            self._drag_data["item"] = None
+            # Al soltar se recalcula qué aristas quedan a la vista
+            self.draw_graph(self._pending_highlights)
+            return
+
+        if self._select_data["item"] is None:
+            return
+        self.canvas.delete(self._select_data["item"])
+        self._select_data["item"] = None
+
+        x0, y0 = self.screen_to_world(min(event.x, self._select_data["x"]), min(event.y, self._select_data["y"]))
+        x1, y1 = self.screen_to_world(max(event.x, self._select_data["x"]), max(event.y, self._select_data["y"]))
+        self.selected_vertices = self.vertex_index.consultar(x0, y0, x1, y1)
+        if not self.selected_vertices:
+            self.draw_graph()
+            return
+        names = sorted(str(self.graph._vertices[v_uid]._element) for v_uid in self.selected_vertices)
+        self.draw_graph(highlights={"vertices": {v_uid: self.SELECTION_COLOR for v_uid in self.selected_vertices}})
+        self.show_result(f"Seleccionados ({len(names)}): {names}")
+
+    def _render_moved_vertices(self, v_uids):
+        """Mueve los items de los vértices dados y de sus aristas: O(grado)."""
+        e_uids = set()
+        for v_uid in v_uids:
+            items = self.vertex_items.get(v_uid)
+            if items is None or v_uid not in self.vertex_coords:
+                continue
+            x, y = self.world_to_screen(*self.vertex_coords[v_uid])
+            # Se usan los ids de los items: buscar por tag recorre todo el canvas
+            oval_id, text_id = items
+            radius = self._vertex_radius()
+            self.canvas.coords(oval_id, x - radius, y - radius, x + radius, y + radius)
+            if text_id is not None:
+                self.canvas.coords(text_id, x, y)
+            e_uids.update(self.graph.aristasIncidentes(v_uid))
+        self._update_edge_coords(e_uids)
+
+    def _update_edge_coords(self, e_uids):
+        """Reubica las líneas y flechas ya dibujadas de las aristas dadas."""
+        for e_uid in e_uids:
+            items = self.edge_items.get(e_uid)
+            if items is None:
+                continue
+            line_id, arrow_id = items
+            v1_uid, v2_uid = self.graph.verticesFinales(e_uid)
+            x1, y1 = self.world_to_screen(*self.vertex_coords[v1_uid])
+            x2, y2 = self.world_to_screen(*self.vertex_coords[v2_uid])
+            self.canvas.coords(line_id, x1, y1, x2, y2)
+            if arrow_id is not None:
+                self.canvas.coords(arrow_id, *self._arrow_points(x1, y1, x2, y2))
+
+    # --- Handlers de Botones (Visualización) ---
+    
+    def _get_vertex_uid_from_entry(self, entry_widget):
+        """Helper para obtener UID desde el elemento en la entrada."""
+        element = entry_widget.get()
+        if not element:
+            self.show_result("Error: El campo del vértice está vacío.", is_error=True)
+            return None
+        
+        v_uid = self.graph.buscaVertice(element)
+        if not v_uid:
+            self.show_result(f"Error: Vértice '{element}' no encontrado.", is_error=True)
+            return None
+        return v_uid
+    
+    def _reset_visual(self):
+        """Resetea el grafo a su estado normal después de una visualización."""
+        self.draw_graph()
+        
+    def show_result(self, message, is_error=False):
+        """Muestra un mensaje en la etiqueta de resultados."""
+        if is_error:
+            self.result_label.configure(text=message, text_color="#FF5555")
+        else:
+            self.result_label.configure(text=message, text_color="white")
+
+    # --- IMPLEMENTADOS CON VISUALIZACIÓN ---
+
+    def on_insertaVertice(self):
+        """Visualiza la inserción de un vértice."""
+        element = self.entry_o.get()
+        if not element:
+            self.show_result("Error: Debe ingresar un 'Objeto o' (nombre) para el vértice.", is_error=True)
+            return
+        if self.graph.buscaVertice(element) is not None:
+            self.show_result(f"Error: El vértice '{element}' ya existe.", is_error=True)
+            return
+
+        try:
+            # Colocar en un lugar aleatorio
+            x = random.randint(self.VERTEX_RADIUS + 10, self.canvas.winfo_width() - self.VERTEX_RADIUS - 10)
+            y = random.randint(self.VERTEX_RADIUS + 10, self.canvas.winfo_height() - self.VERTEX_RADIUS - 10)
+            
+            v_uid = self.graph.insertaVertice(element)
+            self._set_vertex_coords(v_uid, *self.screen_to_world(x, y))
+            
+            self.draw_graph(highlights={"vertices": {v_uid: "green"}})
+            self.show_result(f"Vértice '{element}' (UID: {v_uid}) insertado.")
+            
+            self.after(2000, self._reset_visual)
+            
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_insertaArista(self, dirigida=False):
+        """Visualiza la inserción de una arista (dirigida o no)."""
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        w_uid = self._get_vertex_uid_from_entry(self.entry_w)
+        o = self.entry_o.get() or None # 'None' si está vacío
+        
+        if not v_uid or not w_uid:
+            return 
+            
+        try:
+            if dirigida:
+                e_uid = self.graph.insertaAristaDirigida(v_uid, w_uid, o)
+                msg = f"Arista dirigida '{o or e_uid}' insertada de {self.entry_v.get()} a {self.entry_w.get()}."
+            else:
+                e_uid = self.graph.insertaArista(v_uid, w_uid, o)
+                msg = f"Arista no dirigida '{o or e_uid}' insertada entre {self.entry_v.get()} y {self.entry_w.get()}."
+
+            self.draw_graph(highlights={"edges": {e_uid: "green"}})
+            self.show_result(msg)
+            self.after(2000, self._reset_visual)
+
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_insertaAristaDirigida(self):
+        self.on_insertaArista(dirigida=True)
+
+    def on_eliminaVertice(self):
+        """Visualiza la eliminación de un vértice."""
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        if not v_uid:
+            return
+
+        try:
+            element = self.entry_v.get()
+            aristas_a_eliminar = self.graph.aristasIncidentes(v_uid)
+            
+            h_v = {v_uid: "red"}
+            h_e = {e_uid: "red" for e_uid in aristas_a_eliminar}
+            
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            self.show_result(f"Eliminando vértice '{element}' y {len(aristas_a_eliminar)} aristas incidentes...")
+            
+            def do_delete():
+                # Las coordenadas e índices se limpian en _on_graph_change
+                self.graph.eliminaVertice(v_uid)
+                self.draw_graph()
+                self.show_result(f"Vértice '{element}' eliminado.")
+                
+            self.after(2000, do_delete)
+
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_eliminaArista(self):
+        e_uid = self.entry_e.get()
+        if not e_uid:
+            self.show_result("Error: Debe ingresar un 'UID de Arista e'.", is_error=True)
+            return
+            
+        try:
+            self.graph._validate_edge(e_uid)
+            
+            self.draw_graph(highlights={"edges": {e_uid: "red"}})
+            self.show_result(f"Eliminando arista '{e_uid}'...")
+            
+            def do_delete():
+                self.graph.eliminaArista(e_uid)
+                self.draw_graph()
+                self.show_result(f"Arista '{e_uid}' eliminada.")
+                
+            self.after(2000, do_delete)
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+
+    def on_grado(self):
+        """Visualiza las aristas que contribuyen al grado de v."""
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        if not v_uid:
+            return
+        
+        try:
+            grado = self.graph.grado(v_uid)
+            aristas_incidentes = self.graph.aristasIncidentes(v_uid)
+            
+            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
+            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas_incidentes}
+            
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            self.show_result(f"grado({self.entry_v.get()}) = {grado}")
+            self.after(3000, self._reset_visual)
+            
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_verticesAdyacentes(self):
+        """Visualiza los vértices adyacentes a v."""
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        if not v_uid:
+            return
+
+        try:
+            adyacentes_uids = self.graph.verticesAdyacentes(v_uid)
+            aristas_incidentes = self.graph.aristasIncidentes(v_uid)
+            
+            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
+            for uid in adyacentes_uids:
+                h_v[uid] = self.NODE_SECOND_COLOR
+                
+            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas_incidentes}
+            
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            
+            adyacentes_elements = [self.graph.get_vertex_element(uid) for uid in adyacentes_uids]
+            self.show_result(f"verticesAdyacentes({self.entry_v.get()}) = {adyacentes_elements}")
+            self.after(3000, self._reset_visual)
+
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    # --- STUBS (Sin visualización, solo muestran resultado) ---
+    
+    def on_numVertices(self):
+        num = self.graph.numVertices()
+        self.show_result(f"numVertices() = {num}")
+        self.draw_graph(highlights={"vertices": {v_uid: self.NODE_HIGHLIGHT_COLOR for v_uid in self.graph.vertices()}})
+        self.after(2000, self._reset_visual)
+
+    def on_numAristas(self):
+        num = self.graph.numAristas()
+        self.show_result(f"numAristas() = {num}")
+        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in self.graph.aristas()}})
+        self.after(2000, self._reset_visual)
+
+    def on_vertices(self):
+        v_list = self.graph.vertices()
+        self.show_result(f"vertices() = {v_list}")
+        self.draw_graph(highlights={"vertices": {v_uid: self.NODE_HIGHLIGHT_COLOR for v_uid in v_list}})
+        self.after(2000, self._reset_visual)
+
+    def on_aristas(self):
+        e_list = self.graph.aristas()
+        self.show_result(f"aristas() = {e_list}")
+        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in e_list}})
+        self.after(2000, self._reset_visual)
+
+    def on_aristasIncidentes(self):
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        if not v_uid: return
+        try:
+            aristas = self.graph.aristasIncidentes(v_uid)
+            self.show_result(f"aristasIncidentes({self.entry_v.get()}) = {aristas}")
+            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
+            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            self.after(3000, self._reset_visual)
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_verticesFinales(self):
+        e_uid = self.entry_e.get()
+        if not e_uid:
+            self.show_result("Error: Debe ingresar un 'UID de Arista e'.", is_error=True)
+            return
+        try:
+            v1, v2 = self.graph.verticesFinales(e_uid)
+            v1_elem = self.graph.get_vertex_element(v1)
+            v2_elem = self.graph.get_vertex_element(v2)
+            self.show_result(f"verticesFinales({e_uid}) = ({v1_elem}, {v2_elem})")
+            h_v = {v1: self.NODE_SECOND_COLOR, v2: self.NODE_SECOND_COLOR}
+            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR}
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            self.after(3000, self._reset_visual)
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_opuesto(self):
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        e_uid = self.entry_e.get()
+        if not v_uid or not e_uid: return
+        try:
+            op_uid = self.graph.opuesto(v_uid, e_uid)
+            op_elem = self.graph.get_vertex_element(op_uid)
+            self.show_result(f"opuesto({self.entry_v.get()}, {e_uid}) = {op_elem} (UID: {op_uid})")
+            
+            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR, op_uid: self.NODE_SECOND_COLOR}
+            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR}
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            self.after(3000, self._reset_visual)
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_esAdyacente(self):
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        w_uid = self._get_vertex_uid_from_entry(self.entry_w)
+        if not v_uid or not w_uid: return
+        try:
+            resultado = self.graph.esAdyacente(v_uid, w_uid)
+            self.show_result(f"esAdyacente({self.entry_v.get()}, {self.entry_w.get()}) = {resultado}")
+            
+            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR, w_uid: self.NODE_HIGHLIGHT_COLOR}
+            self.draw_graph(highlights={"vertices": h_v})
+            self.after(3000, self._reset_visual)
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    # --- Handlers para Métodos Dirigidos (Stubs) ---
+    def on_aristasDirigidas(self):
+        aristas = self.graph.aristasDirigidas()
+        self.show_result(f"aristasDirigidas() = {aristas}")
+        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}})
+        self.after(2000, self._reset_visual)
+
+    def on_aristasNodirigidas(self):
+        aristas = self.graph.aristasNodirigidas()
+        self.show_result(f"aristasNodirigidas() = {aristas}")
+        self.draw_graph(highlights={"edges": {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}})
+        self.after(2000, self._reset_visual)
+
+    def on_gradoEnt(self):
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        if not v_uid: return
+        try:
+            grado = self.graph.gradoEnt(v_uid)
+            aristas = self.graph.aristasIncidentesEnt(v_uid)
+            self.show_result(f"gradoEnt({self.entry_v.get()}) = {grado}")
+            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
+            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in arISTAS}
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            self.after(3000, self._reset_visual)
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+    def on_gradoSalida(self):
+        v_uid = self._get_vertex_uid_from_entry(self.entry_v)
+        if not v_uid: return
+        try:
+            grado = self.graph.gradoSalida(v_uid)
+            aristas = self.graph.aristasIncidentesSal(v_uid)
+            self.show_result(f"gradoSalida({self.entry_v.get()}) = {grado}")
+            h_v = {v_uid: self.NODE_HIGHLIGHT_COLOR}
+            h_e = {e_uid: self.EDGE_HIGHLIGHT_COLOR for e_uid in aristas}
+            self.draw_graph(highlights={"vertices": h_v, "edges": h_e})
+            self.after(3000, self._reset_visual)
+        except Exception as e:
+            self.show_result(f"Error: {e}", is_error=True)
+
+
+    # --- Otros ---
+
+    def on_frame_stats(self):
+        """Muestra el costo de dibujo de los últimos cuadros."""
+        s = self.frame_stats()
+        self.show_result(f"Cuadros: {s['frames']} | último: {s['last_ms']:.1f} ms | "
+                         f"promedio: {s['avg_ms']:.1f} ms | máx: {s['max_ms']:.1f} ms | "
+                         f"límite: {s['fps_cap']} FPS | modo: {'raster' if s['raster'] else 'items'}")
+    
+    def on_clear_graph(self):
+        """Limpia el grafo y el canvas."""
+        self._set_graph(Graph(elementos_unicos=True))
+        self.selected_vertices = set()
+        # No borramos el fondo, solo los items del grafo
+        self.draw_graph()
+        self.show_result("Grafo limpiado.")
+
+
+# --- 3. EJECUCIÓN DE LA APP ---
+
+if __name__ == "__main__":
+    app = GraphApp()
+    app.mainloop()
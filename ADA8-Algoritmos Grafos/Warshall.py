@@ -1,15 +1,31 @@
+import mmap
+import random
+import struct
 import sys
+import time
+import tracemalloc
+from array import array
 
 INF = sys.maxsize
+NO_PRED = -1  # Predecesor de los pares sin camino (y de i a sí mismo)
+ENGINES = ("python", "blocked")
+
+def floyd_warshall(graph, engine="python", workers=None):
+    # Devuelve (dist, pred). pred es una lista de filas array('i') de enteros de
+    # 32 bits, con NO_PRED (-1) donde no hay predecesor. engine="blocked" usa el
+    # motor por bloques de floyd.py (NumPy y varios núcleos); workers es su
+    # número de procesos (por defecto, núcleos).
+    if engine not in ENGINES:
+        raise ValueError(f"Motor desconocido: {engine!r} (use uno de {', '.join(ENGINES)}).")
+    if engine == "blocked":
+        return _floyd_warshall_blocked(graph, workers)
 
-def floyd_warshall(graph):
-    
     V = len(graph)
     dist = [list(row) for row in graph]
-    pred = [[None] * V for _ in range(V)]
+    pred = [array('i', [NO_PRED]) * V for _ in range(V)]
     for i in range(V):
         for j in range(V):
-            if graph[i][j] != 0 and graph[i][j] != INF:
+            if i != j and graph[i][j] != INF:
                 pred[i][j] = i
 
     for k in range(V):
@@ -25,28 +41,290 @@ def floyd_warshall(graph):
 
     return dist, pred
 
+def _floyd_warshall_blocked(graph, workers=None):
+    import floyd
+    enteros = all(isinstance(x, int) for row in graph for x in row)
+    dist, pred = floyd.floyd_warshall_blocked(graph, workers=workers, predecessors=True)
+    if (dist.diagonal() < 0).any():
+        raise ValueError("El grafo contiene un ciclo de peso negativo.")
+    filas = []
+    for row in pred:
+        fila = array('i')
+        fila.frombytes(row.tobytes())
+        filas.append(fila)
+    return floyd._to_lists(dist, enteros), filas
+
+# --- Actualización incremental ---
+# Si aparece la arista u -> v con peso w (o baja su peso a w), un camino i -> j
+# solo puede mejorar pasando por ella: dist[i][u] + w + dist[v][j]. Basta un
+# recorrido O(V²) en lugar de repetir el O(V³). Las filas de v y la columna de
+# u no cambian (salvo ciclo negativo), así que se puede actualizar en su lugar.
+# No sirve para borrar aristas ni para subir pesos: ahí hay que recalcular.
+
+def update_edge(dist, pred, u, v, w):
+    # Modifica dist y pred en su lugar y devuelve la lista de pares (i, j) cuya
+    # distancia cambió. Acepta las listas de floyd_warshall o las matrices de
+    # NumPy de floyd.floyd_warshall_blocked (en ese caso, vectorizado).
+    if dist[v][u] != INF and dist[v][u] + w < 0:
+        raise ValueError("El grafo contiene un ciclo de peso negativo.")
+    if not w < dist[u][v]:
+        return []
+    if hasattr(dist, "shape"):
+        return _update_edge_numpy(dist, pred, u, v, w)
+
+    V = len(dist)
+    fila_v = dist[v]
+    # Nuevo predecesor de j en las rutas que mejoran: el de la ruta de v a j
+    # (u si j es v). Con pred None solo se actualizan las distancias.
+    destinos = [(j, fila_v[j], u if j == v or pred is None else pred[v][j])
+                for j in range(V) if fila_v[j] != INF]
+    cambios = []
+    for i in range(V):
+        d_iu = dist[i][u]
+        if d_iu == INF:
+            continue
+        base = d_iu + w
+        fila = dist[i]
+        fila_pred = None if pred is None else pred[i]
+        for j, d_vj, p in destinos:
+            if base + d_vj < fila[j]:
+                fila[j] = base + d_vj
+                if fila_pred is not None:
+                    fila_pred[j] = p
+                cambios.append((i, j))
+    return cambios
+
+def _update_edge_numpy(dist, pred, u, v, w):
+    import numpy as np
+    d_u = dist[:, u]
+    d_v = dist[v, :]
+    I = np.flatnonzero(np.isfinite(d_u) & (d_u != INF))
+    J = np.flatnonzero(np.isfinite(d_v) & (d_v != INF))
+    candidato = (d_u[I] + w)[:, None] + d_v[J][None, :]
+    bloque = np.ix_(I, J)
+    mejora = candidato < dist[bloque]
+    ii, jj = np.nonzero(mejora)
+    if pred is not None:
+        nuevo_pred = pred[v, J].copy()
+        nuevo_pred[J == v] = u
+        pred[I[ii], J[jj]] = nuevo_pred[jj]
+    dist[I[ii], J[jj]] = candidato[ii, jj]
+    return list(zip(I[ii].tolist(), J[jj].tolist()))
+
+# --- Clausura transitiva (Warshall con conjuntos de bits) ---
+# Para saber solo si j es alcanzable desde i no hacen falta distancias: cada
+# fila es un entero de Python usado como conjunto de bits y el paso k de
+# Warshall es "si i alcanza k, i alcanza todo lo que alcanza k", un OR de
+# filas enteras (unas V/64 operaciones de palabra en lugar de V).
+
+class TransitiveClosure:
+    def __init__(self, graph):
+        # graph es una matriz como la de floyd_warshall (INF = sin arista).
+        # Cada vértice se alcanza a sí mismo, igual que dist[i][i] = 0.
+        V = len(graph)
+        self.V = V
+        self._ancho = (V + 7) // 8  # Bytes por fila
+        filas = []
+        for i, row in enumerate(graph):
+            bits = bytearray(self._ancho)
+            for j, x in enumerate(row):
+                if x != INF or j == i:
+                    bits[j >> 3] |= 1 << (j & 7)
+            filas.append(int.from_bytes(bits, "little"))
+
+        for k in range(V):
+            bit = 1 << k
+            fila_k = filas[k]
+            for i in range(V):
+                if filas[i] & bit:
+                    filas[i] |= fila_k
+
+        # Todas las filas en un solo bloque de bytes: alcanzable es una lectura
+        # de un byte, sin desplazar enteros de V bits
+        self._bits = b"".join(f.to_bytes(self._ancho, "little") for f in filas)
+
+    def alcanzable(self, i, j):
+        # O(1): ¿hay camino de i a j?
+        return bool(self._bits[i * self._ancho + (j >> 3)] >> (j & 7) & 1)
+
+    def alcanzables(self, i):
+        # Vértices alcanzables desde i, en orden
+        inicio = i * self._ancho
+        for b, byte in enumerate(self._bits[inicio:inicio + self._ancho]):
+            while byte:
+                bajo = byte & -byte  # Bit más bajo encendido
+                yield b * 8 + bajo.bit_length() - 1
+                byte ^= bajo
+
+    @property
+    def nbytes(self):
+        return len(self._bits)
+
+def benchmark_closure(V=200, density=0.01, seed=0):
+    # Compara tiempo y memoria máxima de TransitiveClosure con floyd_warshall
+    # sobre un grafo aleatorio de V nodos, y comprueba que coinciden.
+    rng = random.Random(seed)
+    graph = [[0 if i == j else (rng.randint(1, 100) if rng.random() < density else INF)
+              for j in range(V)] for i in range(V)]
+
+    resultados = {}
+    for nombre, calcular in (("bits", TransitiveClosure), ("distancias", floyd_warshall)):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        resultado = calcular(graph)
+        t = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        resultados[nombre] = resultado
+        print(f"{nombre:>10}: {t:8.3f} s  {pico / 1024:10.1f} KiB de pico")
+
+    clausura, (dist, _) = resultados["bits"], resultados["distancias"]
+    correcto = all(clausura.alcanzable(i, j) == (dist[i][j] != INF)
+                   for i in range(V) for j in range(V))
+    print(f"V={V}, densidad={density}: {'ok' if correcto else 'DISTINTO'}")
+
+# --- Consulta de rutas ---
+
+def _anterior(pred, i, k):
+    # Paso hacia atrás de la ruta de i a k; una ruta cortada a medias indica
+    # una matriz de predecesores inconsistente
+    k = pred[i][k]
+    if k == NO_PRED:
+        raise ValueError(f"La matriz de predecesores no tiene una ruta completa desde {i}.")
+    return k
+
+def path(pred, i, j, reverse=False):
+    # Genera los vértices de la ruta más corta de i a j (nada si no hay ruta).
+    # Con reverse=True se generan de j a i sin guardar nada: cada paso es una
+    # consulta a pred. En orden normal primero se recorre la ruta hacia atrás.
+    if i != j and pred[i][j] == NO_PRED:
+        return
+    if reverse:
+        while j != i:
+            yield j
+            j = _anterior(pred, i, j)
+        yield i
+        return
+
+    inversa = array('i', [j])
+    while j != i:
+        j = _anterior(pred, i, j)
+        inversa.append(j)
+    for k in reversed(inversa):
+        yield k
+
+def paths(pred, pairs):
+    # Rutas de varios pares (i, j) de una vez: lista de listas de vértices, o
+    # None para los pares sin ruta. Una ruta de i que pasa por un destino ya
+    # resuelto desde i reutiliza ese tramo inicial en lugar de recorrerlo.
+    resultado = []
+    hechas = {}
+    for i, j in pairs:
+        if i != j and pred[i][j] == NO_PRED:
+            resultado.append(None)
+            continue
+        inversa = []
+        k = j
+        while True:
+            conocida = hechas.get((i, k))
+            if conocida is not None:
+                ruta = conocida + inversa[::-1]
+                break
+            inversa.append(k)
+            if k == i:
+                ruta = inversa[::-1]
+                break
+            k = _anterior(pred, i, k)
+        hechas[(i, j)] = ruta
+        resultado.append(ruta)
+    return resultado
+
+# --- Guardar y cargar (con mmap) ---
+# Formato: cabecera de 16 bytes (magia, V, tipo de dist), dist V×V ('q' enteros
+# de 64 bits con INF tal cual, o 'd' reales con inf) y pred V×V enteros de 32
+# bits, todo en el orden de bytes de la máquina.
+
+_MAGIA = b"FWM1"
+_CABECERA = struct.Struct("<4sIc7x")
+
+def save_matrices(ruta, dist, pred):
+    V = len(dist)
+    enteros = all(isinstance(x, int) for row in dist for x in row)
+    tipo = 'q' if enteros else 'd'
+    with open(ruta, "wb") as f:
+        f.write(_CABECERA.pack(_MAGIA, V, tipo.encode()))
+        for row in dist:
+            if enteros:
+                f.write(array('q', row).tobytes())
+            else:
+                f.write(array('d', (float('inf') if x == INF else x for x in row)).tobytes())
+        for row in pred:
+            f.write(array('i', row).tobytes())
+
+def load_matrices(ruta, use_mmap=True):
+    # Devuelve (dist, pred) como listas de filas. Con use_mmap las filas son
+    # vistas (memoryview) del archivo proyectado en memoria: la carga es
+    # inmediata y solo se leen del disco las filas que se consultan.
+    with open(ruta, "rb") as f:
+        cabecera = f.read(_CABECERA.size)
+        if len(cabecera) < _CABECERA.size or cabecera[:4] != _MAGIA:
+            raise ValueError(f"'{ruta}' no es un archivo de matrices de Floyd-Warshall.")
+        magia, V, tipo = _CABECERA.unpack(cabecera)
+        tipo = tipo.decode()
+        if tipo not in ('q', 'd'):
+            raise ValueError(f"'{ruta}' no es un archivo de matrices de Floyd-Warshall.")
+        if use_mmap:
+            datos = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            f.seek(0)
+            datos = memoryview(f.read())
+
+    inicio = _CABECERA.size
+    fin_dist = inicio + V * V * 8
+    if len(datos) < fin_dist + V * V * 4:
+        raise ValueError(f"'{ruta}' está truncado.")
+    dist = datos[inicio:fin_dist].cast(tipo)
+    pred = datos[fin_dist:fin_dist + V * V * 4].cast('i')
+    return ([dist[i * V:(i + 1) * V] for i in range(V)],
+            [pred[i * V:(i + 1) * V] for i in range(V)])
+
 def print_solution(dist, pred, V):
     print("Matriz de distancias más cortas:")
     for i in range(V):
         for j in range(V):
-            if dist[i][j] == INF:
+            if dist[i][j] == INF or dist[i][j] == float('inf'):
                 print("%7s" % "INF", end="")
             else:
                 print("%7d" % (dist[i][j]), end="")
         print()
 
-    print("\nPredecesores (para reconstruir rutas):")
+    print("\nPredecesores (para reconstruir rutas, -1 = ninguno):")
     for row in pred:
-        print(row)
+        print(list(row))
+
+if __name__ == "__main__":
+    # python Warshall.py --benchmark-closure [V]: bits contra distancias
+    if "--benchmark-closure" in sys.argv:
+        args = sys.argv[sys.argv.index("--benchmark-closure") + 1:]
+        benchmark_closure(*(int(a) for a in args[:1]))
+        sys.exit()
+
+    graph_example = [
+        [0, 5, INF, 10],
+        [INF, 0, 3, INF],
+        [INF, INF, 0, 1],
+        [INF, INF, INF, 0]
+    ]
 
-graph_example = [
-    [0, 5, INF, 10],
-    [INF, 0, 3, INF],
-    [INF, INF, 0, 1],
-    [INF, INF, INF, 0]
-]
+    num_vertices = len(graph_example)
+    dist_matrix, pred_matrix = floyd_warshall(graph_example)
+    print_solution(dist_matrix, pred_matrix, num_vertices)
+    print("\nRuta de 0 a 3:", list(path(pred_matrix, 0, 3)))
 
-num_vertices = len(graph_example)
-dist_matrix, pred_matrix = floyd_warshall(graph_example)
-print_solution(dist_matrix, pred_matrix, num_vertices)
+    cambios = update_edge(dist_matrix, pred_matrix, 0, 2, 4)
+    print("\nNueva arista 0 -> 2 (peso 4), pares que cambian:", cambios)
+    print("Ruta de 0 a 3:", list(path(pred_matrix, 0, 3)))
 
+    clausura = TransitiveClosure(graph_example)
+    print("\n¿3 alcanza a 0?", clausura.alcanzable(3, 0))
+    print("Alcanzables desde 1:", list(clausura.alcanzables(1)))
@@ -1,6 +1,11 @@
 import heapq
+import itertools
+import math
+from array import array
 
-def dijkstra(graph, start_node):
+def dijkstra(graph, start_node, target=None):
+    # Con target se detiene en cuanto target sale de la cola: su distancia ya
+    # es definitiva, y las de los nodos aún no extraídos son solo provisionales.
     distances = {node: float('inf') for node in graph}
     distances[start_node] = 0
 
@@ -13,6 +18,8 @@ def dijkstra(graph, start_node):
 
         if current_distance > distances[current_node]:
             continue
+        if current_node == target:
+            break
 
         for neighbor, weight in graph.get(current_node, {}).items():
             distance = current_distance + weight
@@ -24,23 +31,183 @@ def dijkstra(graph, start_node):
     
     return distances, previous_nodes
 
-graph = {
-    'A': {'B': 1, 'C': 4},
-    'B': {'A': 1, 'C': 2, 'D': 5},
-    'C': {'A': 4, 'B': 2, 'D': 1},
-    'D': {'B': 5, 'C': 1}
-}
+def _path(previous_nodes, start_node, target):
+    path = [target]
+    while path[-1] != start_node:
+        path.append(previous_nodes[path[-1]])
+    path.reverse()
+    return path
 
-start_node = 'A'
-distances, previous_nodes = dijkstra(graph, start_node)
+def bidirectional_dijkstra(graph, start_node, target, reverse_graph=None):
+    # Dijkstra desde start_node hacia delante y desde target hacia atrás (por
+    # las aristas invertidas), avanzando siempre el lado con la cola menor.
+    # Termina cuando la suma de los dos mínimos de las colas ya no puede
+    # mejorar el mejor camino encontrado. Devuelve (distancia, camino), o
+    # (inf, []) si no hay camino. reverse_graph permite reutilizar el grafo
+    # invertido entre consultas.
+    if start_node == target:
+        return 0, [start_node]
+    if reverse_graph is None:
+        reverse_graph = {}
+        for node, neighbors in graph.items():
+            for neighbor, weight in neighbors.items():
+                reverse_graph.setdefault(neighbor, {})[node] = weight
 
-print(f"Distancias más cortas desde {start_node}: {distances}")
+    lados = (
+        (graph, {start_node: 0}, {}, [(0, start_node)]),
+        (reverse_graph, {target: 0}, {}, [(0, target)]),
+    )
+    best, meeting = math.inf, None
+    settled = (set(), set())
 
-path = []
-current = 'D'
-while current != start_node:
-    path.insert(0, current)
-    current = previous_nodes[current]
-path.insert(0, start_node)
-print(f"Camino más corto a 'D': {' -> '.join(path)}")
+    while lados[0][3] and lados[1][3]:
+        if lados[0][3][0][0] + lados[1][3][0][0] >= best:
+            break
+        lado = 0 if len(lados[0][3]) <= len(lados[1][3]) else 1
+        adjacency, distances, previous_nodes, queue = lados[lado]
+        other_distances = lados[1 - lado][1]
 
+        current_distance, current_node = heapq.heappop(queue)
+        if current_node in settled[lado]:
+            continue
+        settled[lado].add(current_node)
+
+        for neighbor, weight in adjacency.get(current_node, {}).items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, math.inf):
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                heapq.heappush(queue, (distance, neighbor))
+            if neighbor in other_distances and distance + other_distances[neighbor] < best:
+                best = distance + other_distances[neighbor]
+                meeting = neighbor
+
+    if meeting is None:
+        return math.inf, []
+    forward = _path(lados[0][2], start_node, meeting)
+    backward = _path(lados[1][2], target, meeting)
+    return best, forward + backward[-2::-1]
+
+def a_star(graph, start_node, target, heuristic):
+    # A*: la cola se ordena por distancia + heuristic(nodo, target). Si la
+    # heurística nunca sobrestima la distancia que falta (p. ej. la distancia
+    # en línea recta con pesos que son longitudes), el resultado es el mismo
+    # que el de dijkstra, explorando solo la zona en dirección al destino.
+    # Un nodo ya extraído se vuelve a abrir si luego se encuentra un camino
+    # más corto hasta él (puede pasar si la heurística no es consistente).
+    # Devuelve (distancia, camino), o (inf, []) si no hay camino.
+    distances = {start_node: 0}
+    previous_nodes = {}
+    priority_queue = [(heuristic(start_node, target), 0, start_node)]
+
+    while priority_queue:
+        _, current_distance, current_node = heapq.heappop(priority_queue)
+        if current_distance > distances[current_node]:
+            continue
+        if current_node == target:
+            return current_distance, _path(previous_nodes, start_node, target)
+
+        for neighbor, weight in graph.get(current_node, {}).items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, math.inf):
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                heapq.heappush(priority_queue, (distance + heuristic(neighbor, target), distance, neighbor))
+
+    return math.inf, []
+
+# --- Dijkstra sobre arreglos (CSR) ---
+# El grafo se guarda como tres arreglos: las aristas que salen del vértice u
+# son targets[offsets[u]:offsets[u + 1]] con pesos weights[...]. Distancias y
+# predecesores son arreglos tipados indexados por número de vértice, así que
+# no hay diccionarios ni hashing de etiquetas por relajación. La cola es la
+# de heapq (en C) con borrado perezoso: se mete otra entrada al mejorar una
+# distancia y las viejas se descartan al salir. Conviene cuando se hacen
+# muchas consultas sobre el mismo grafo: to_csr se paga una sola vez.
+
+def to_csr(graph):
+    # Traduce una sola vez un diccionario de adyacencia con etiquetas a CSR.
+    # Devuelve (nodes, index, offsets, targets, weights): nodes[i] es la
+    # etiqueta del vértice i e index[etiqueta] su número.
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    for neighbors in graph.values():
+        for neighbor in neighbors:
+            if neighbor not in index:
+                index[neighbor] = len(nodes)
+                nodes.append(neighbor)
+
+    adjacency = [graph.get(node, {}) for node in nodes]
+    offsets = array('q', [0])
+    offsets.extend(itertools.accumulate(map(len, adjacency)))
+    targets = array('i', [index[neighbor] for neighbors in adjacency for neighbor in neighbors])
+    weights = array('d', [weight for neighbors in adjacency for weight in neighbors.values()])
+    return nodes, index, offsets, targets, weights
+
+def dijkstra_csr(offsets, targets, weights, source, target=None):
+    # Devuelve (dist, pred): array('d') con inf para los no alcanzables y
+    # array('i') con -1 donde no hay predecesor. target detiene la búsqueda
+    # como en dijkstra. Los pesos deben ser no negativos; se comprueban en
+    # cada llamada (un solo recorrido de weights, en C).
+    if weights and min(weights) < 0:
+        raise ValueError("Dijkstra no admite pesos negativos.")
+    V = len(offsets) - 1
+    dist = array('d', [math.inf]) * V
+    pred = array('i', [-1]) * V
+    dist[source] = 0.0
+    queue = [(0.0, source)]
+    pop, push = heapq.heappop, heapq.heappush
+
+    while queue:
+        du, u = pop(queue)
+        if du > dist[u]:
+            continue  # Entrada vieja: u ya salió con una distancia menor
+        if u == target:
+            break
+
+        a, b = offsets[u], offsets[u + 1]
+        for v, weight in zip(targets[a:b], weights[a:b]):
+            distance = du + weight
+            if distance < dist[v]:
+                dist[v] = distance
+                pred[v] = u
+                push(queue, (distance, v))
+
+    return dist, pred
+
+def euclidean(coords):
+    # Heurística para a_star a partir de coordenadas {nodo: (x, y)}, como las
+    # posiciones de los vértices en el visualizador.
+    def heuristic(node, target):
+        (x0, y0), (x1, y1) = coords[node], coords[target]
+        return math.hypot(x1 - x0, y1 - y0)
+    return heuristic
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'C': 2, 'D': 5},
+        'C': {'A': 4, 'B': 2, 'D': 1},
+        'D': {'B': 5, 'C': 1}
+    }
+
+    start_node = 'A'
+    distances, previous_nodes = dijkstra(graph, start_node)
+
+    print(f"Distancias más cortas desde {start_node}: {distances}")
+
+    path = []
+    current = 'D'
+    while current != start_node:
+        path.insert(0, current)
+        current = previous_nodes[current]
+    path.insert(0, start_node)
+    print(f"Camino más corto a 'D': {' -> '.join(path)}")
+
+    print("Camino bidireccional de 'A' a 'D':", bidirectional_dijkstra(graph, 'A', 'D'))
+    coords = {'A': (0, 0), 'B': (1, 0), 'C': (2, 1), 'D': (3, 1)}
+    print("Camino A* de 'A' a 'D':", a_star(graph, 'A', 'D', euclidean(coords)))
+
+    nodes, index, offsets, targets, weights = to_csr(graph)
+    dist, pred = dijkstra_csr(offsets, targets, weights, index['A'])
+    print("Distancias con CSR:", {nodes[i]: d for i, d in enumerate(dist)})
@@ -1,18 +1,251 @@
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 INF = sys.maxsize
 
-def floyd_warshall(graph):
+ENGINES = ("python", "numpy", "blocked", "auto")
+
+def floyd_warshall(graph, engine="python"):
+    # engine: "python" (triple bucle), "numpy", "blocked" (por bloques en varios
+    # núcleos) o "auto" (NumPy si está instalado). En todos los casos devuelve
+    # una lista de listas con INF para los pares sin camino. Los motores de
+    # NumPy calculan en float64: los enteros mayores que 2**53 pierden
+    # precisión y cualquier "sin camino" (también float('inf')) vuelve como INF.
+    if engine not in ENGINES:
+        raise ValueError(f"Motor desconocido: {engine!r} (use uno de {', '.join(ENGINES)}).")
+    if engine == "blocked":
+        enteros = all(isinstance(x, int) for row in graph for x in row)
+        return _to_lists(floyd_warshall_blocked(graph), enteros)
+    if engine == "numpy" or (engine == "auto" and np is not None):
+        enteros = all(isinstance(x, int) for row in graph for x in row)
+        return _to_lists(floyd_warshall_numpy(graph), enteros)
+
     V = len(graph)
     dist = list(map(lambda i: list(i), graph))
     for k in range(V):
+        fila_k = dist[k]
         for i in range(V):
+            # INF no es infinito para la suma: con pesos negativos INF - w
+            # parecería un camino, así que los pares sin camino se saltan
+            d_ik = dist[i][k]
+            if d_ik == INF:
+                continue
+            fila_i = dist[i]
             for j in range(V):
-                dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+                if fila_k[j] != INF and d_ik + fila_k[j] < fila_i[j]:
+                    fila_i[j] = d_ik + fila_k[j]
+
+    return dist
+
+def floyd_warshall_numpy(graph):
+    # Matriz float64 con np.inf para "sin camino". En cada k se relaja toda la
+    # matriz de una vez: D = min(D, D[:, k] + D[k, :]), reutilizando los buffers.
+    if np is None:
+        raise ImportError("Se necesita NumPy para este motor (pip install numpy).")
+    dist = np.array(graph, dtype=np.float64)
+    dist[dist >= INF] = np.inf
+    V = len(dist)
+    candidato = np.empty_like(dist)
+    for k in range(V):
+        np.add(dist[:, k, None], dist[None, k, :], out=candidato)
+        np.minimum(dist, candidato, out=dist)
 
     return dist
 
+# --- Floyd-Warshall por bloques en varios núcleos ---
+# La matriz se divide en bloques de block x block. Para cada bloque kb de la
+# diagonal hay tres fases, cada una depende de la anterior:
+#   1. el bloque (kb, kb) se resuelve solo;
+#   2. los bloques de la fila kb y de la columna kb, usando el de la fase 1;
+#   3. todos los demás, que solo leen la fila y la columna kb y son independientes.
+# Los bloques de las fases 2 y 3 se reparten entre procesos que trabajan sobre
+# la misma matriz en memoria compartida; el bloque cabe en caché.
+
+_dist = None  # Matriz de distancias (memoria compartida) en cada proceso
+_pred = None  # Matriz de predecesores, o None si no se calculan
+_shms = []
+
+def _attach(dist_name, pred_name, V):
+    global _dist, _pred
+    shm = shared_memory.SharedMemory(name=dist_name)
+    _shms.append(shm)
+    _dist = np.ndarray((V, V), dtype=np.float64, buffer=shm.buf)
+    _pred = None
+    if pred_name is not None:
+        shm = shared_memory.SharedMemory(name=pred_name)
+        _shms.append(shm)
+        _pred = np.ndarray((V, V), dtype=np.int32, buffer=shm.buf)
+
+def _detach():
+    global _dist, _pred
+    _dist = _pred = None
+    for shm in _shms:
+        shm.close()
+    _shms.clear()
+
+def _relax_tiles(block, kb, tiles):
+    # D[i, j] = min(D[i, j], D[i, k] + D[k, j]) para cada k del bloque kb y
+    # cada bloque (ti, tj). Sirve para las tres fases: en las dos primeras la
+    # fila o la columna k es parte del propio bloque, y se actualiza en orden.
+    V = len(_dist)
+    k0, k1 = kb * block, min((kb + 1) * block, V)
+    for ti, tj in tiles:
+        i0, i1 = ti * block, min((ti + 1) * block, V)
+        j0, j1 = tj * block, min((tj + 1) * block, V)
+        Dij = _dist[i0:i1, j0:j1]
+        Dik = _dist[i0:i1, k0:k1]
+        Dkj = _dist[k0:k1, j0:j1]
+        candidato = np.empty_like(Dij)
+        if _pred is None:
+            for k in range(k1 - k0):
+                np.add(Dik[:, k, None], Dkj[None, k, :], out=candidato)
+                np.minimum(Dij, candidato, out=Dij)
+        else:
+            Pij = _pred[i0:i1, j0:j1]
+            Pkj = _pred[k0:k1, j0:j1]
+            mejora = np.empty(Dij.shape, dtype=bool)
+            for k in range(k1 - k0):
+                np.add(Dik[:, k, None], Dkj[None, k, :], out=candidato)
+                np.less(candidato, Dij, out=mejora)
+                np.copyto(Dij, candidato, where=mejora)
+                np.copyto(Pij, np.broadcast_to(Pkj[k], Pij.shape), where=mejora)
+
+def _split(tiles, parts):
+    parts = max(1, min(parts, len(tiles)))
+    return [tiles[p::parts] for p in range(parts)]
+
+def _repair_pred(dist, pred, inicial):
+    # Con ciclos de peso 0 el orden por fases puede dejar empates que cierran
+    # un ciclo en pred (pred[i][a] = b y pred[i][b] = a). Se detectan con saltos
+    # dobles (tras log V pasos toda ruta válida llega a i) y solo esas filas
+    # se rehacen como árbol BFS sobre las aristas ajustadas:
+    # dist[i][u] + w(u, v) == dist[i][v].
+    V = len(dist)
+    filas = np.arange(V)[:, None]
+    salto = np.where(pred < 0, filas, pred)
+    for _ in range(max(1, (V - 1).bit_length())):
+        salto = np.take_along_axis(salto, salto, axis=1)
+    for i in np.flatnonzero((salto != filas).any(axis=1)):
+        d = dist[i]
+        fila = np.full(V, -1, dtype=np.int32)
+        visto = np.zeros(V, dtype=bool)
+        visto[i] = True
+        frontera = np.array([i])
+        while len(frontera):
+            candidato = d[frontera, None] + inicial[frontera]
+            ajustada = np.isfinite(candidato) & (candidato <= d + 1e-12 * np.maximum(1.0, np.abs(d))) & ~visto
+            u, v = np.nonzero(ajustada)
+            v, primero = np.unique(v, return_index=True)
+            fila[v] = frontera[u[primero]]
+            visto[v] = True
+            frontera = v
+        pred[i] = fila
+
+def floyd_warshall_blocked(graph, block=256, workers=None, predecessors=False):
+    # Devuelve la matriz float64 de distancias (np.inf = sin camino) y, si
+    # predecessors es verdadero, también la de predecesores int32 (-1 = ninguno,
+    # con la misma convención que Warshall.py). block ajusta el tamaño de los
+    # bloques a la caché; workers es el número de procesos (por defecto, núcleos).
+    if np is None:
+        raise ImportError("Se necesita NumPy para este motor (pip install numpy).")
+    inicial = np.array(graph, dtype=np.float64)
+    inicial[inicial >= INF] = np.inf
+    V = len(inicial)
+    workers = workers or os.cpu_count() or 1
+    nb = -(-V // block)
+
+    shms = [shared_memory.SharedMemory(create=True, size=max(inicial.nbytes, 1))]
+    if predecessors:
+        shms.append(shared_memory.SharedMemory(create=True, size=max(V * V * 4, 1)))
+    pool = None
+    try:
+        _attach(shms[0].name, shms[1].name if predecessors else None, V)
+        _dist[:] = inicial
+        if predecessors:
+            _pred[:] = -1
+            arista = ~np.eye(V, dtype=bool) & np.isfinite(inicial)
+            _pred[arista] = np.nonzero(arista)[0]
+
+        if workers > 1 and nb > 1:
+            pool = ProcessPoolExecutor(workers, initializer=_attach,
+                                       initargs=(shms[0].name, shms[1].name if predecessors else None, V))
+
+        def run(kb, tiles):
+            if pool is None:
+                _relax_tiles(block, kb, tiles)
+                return
+            futures = [pool.submit(_relax_tiles, block, kb, part) for part in _split(tiles, workers * 2)]
+            for f in futures:
+                f.result()
+
+        for kb in range(nb):
+            otros = [t for t in range(nb) if t != kb]
+            _relax_tiles(block, kb, [(kb, kb)])
+            run(kb, [(kb, t) for t in otros] + [(t, kb) for t in otros])
+            run(kb, [(ti, tj) for ti in otros for tj in otros])
+
+        dist = _dist.copy()
+        pred = _pred.copy() if predecessors else None
+        if predecessors:
+            _repair_pred(dist, pred, inicial)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        _detach()
+        for shm in shms:
+            shm.unlink()
+
+    return (dist, pred) if predecessors else dist
+
+def benchmark_blocked(V=2000, block=256, cores=None, density=0.01, seed=0):
+    # Mide floyd_warshall_blocked con 1, 2, 4, ... núcleos sobre un grafo
+    # aleatorio de V nodos y compara con floyd_warshall_numpy (un núcleo).
+    rng = np.random.default_rng(seed)
+    graph = np.where(rng.random((V, V)) < density, rng.integers(1, 100, (V, V)), INF)
+    np.fill_diagonal(graph, 0)
+    if cores is None:
+        cores, c = [], 1
+        while c <= (os.cpu_count() or 1):
+            cores.append(c)
+            c *= 2
+
+    inicio = time.perf_counter()
+    referencia = floyd_warshall_numpy(graph)
+    base = time.perf_counter() - inicio
+    print(f"V={V}, bloque={block}")
+    print(f"numpy (1 núcleo): {base:.2f} s")
+    for c in cores:
+        inicio = time.perf_counter()
+        dist = floyd_warshall_blocked(graph, block=block, workers=c)
+        t = time.perf_counter() - inicio
+        correcto = np.array_equal(dist, referencia)
+        print(f"bloques, {c} núcleo(s): {t:.2f} s  (x{base / t:.2f})  {'ok' if correcto else 'DISTINTO'}")
+
+def _to_lists(dist, enteros):
+    # Vuelve al formato original: listas de Python con INF en lugar de inf
+    sin_camino = np.isinf(dist)
+    if enteros:
+        resultado = np.where(sin_camino, 0, dist).astype(np.int64)
+    else:
+        resultado = dist.astype(object)
+    resultado[sin_camino] = INF
+    return resultado.tolist()
+
 if __name__ == "__main__":
+    # python floyd.py --benchmark [V] [bloque]: escalado por número de núcleos
+    if "--benchmark" in sys.argv:
+        args = sys.argv[sys.argv.index("--benchmark") + 1:]
+        benchmark_blocked(*(int(a) for a in args[:2]))
+        sys.exit()
+
     graph = [
         [0, 5, INF, 10],
         [INF, 0, 3, INF],
@@ -25,4 +258,3 @@ if __name__ == "__main__":
     print("Las distancias más cortas entre todos los pares de nodos son:")
     for row in distances:
         print(row)
-
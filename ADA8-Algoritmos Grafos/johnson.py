@@ -0,0 +1,172 @@
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from dijkstra import dijkstra
+import Warshall
+
+INF = sys.maxsize
+
+# Por encima de esta densidad (aristas / V²) se usa Floyd-Warshall: Johnson
+# cuesta O(V·E·log V) y Floyd-Warshall O(V³), así que Johnson conviene cuando
+# E·log V es menor que V². El umbral corrige además la diferencia de constantes
+# entre el Dijkstra en Python puro y el Floyd-Warshall vectorizado.
+DENSITY_THRESHOLD = 0.05
+
+# --- Algoritmo de Johnson ---
+# 1. Bellman-Ford desde un nodo virtual unido a todos con peso 0 da un
+#    potencial h(v) tal que w(u, v) + h(u) - h(v) >= 0 para toda arista.
+# 2. Con esos pesos no negativos se corre Dijkstra desde cada nodo; las
+#    fuentes se reparten entre procesos.
+# 3. La distancia real es d'(u, v) - h(u) + h(v).
+
+def _nodes(graph):
+    # Nodos del diccionario de adyacencia, incluidos los que solo son destino
+    nodes = list(graph)
+    vistos = set(nodes)
+    for vecinos in graph.values():
+        for v in vecinos:
+            if v not in vistos:
+                vistos.add(v)
+                nodes.append(v)
+    return nodes
+
+def bellman_ford_potentials(graph):
+    # Potenciales h de Johnson. Empezar con h = 0 en todos los nodos equivale
+    # a la primera ronda desde el nodo virtual; luego bastan V - 1 rondas.
+    nodes = _nodes(graph)
+    h = dict.fromkeys(nodes, 0)
+    aristas = [(u, v, w) for u, vecinos in graph.items() for v, w in vecinos.items()]
+    for _ in range(len(nodes) - 1):
+        cambio = False
+        for u, v, w in aristas:
+            if h[u] + w < h[v]:
+                h[v] = h[u] + w
+                cambio = True
+        if not cambio:
+            break
+    else:
+        for u, v, w in aristas:
+            if h[u] + w < h[v]:
+                raise ValueError("El grafo contiene un ciclo de peso negativo.")
+    return h
+
+_reweighted = None  # Grafo con los pesos ajustados, en cada proceso
+_h = None
+
+def _init_worker(reweighted, h):
+    global _reweighted, _h
+    _reweighted, _h = reweighted, h
+
+def _sources(sources):
+    # Dijkstra desde cada fuente del lote, deshaciendo el ajuste de pesos
+    resultado = []
+    for s in sources:
+        distances, previous_nodes = dijkstra(_reweighted, s)
+        hs = _h[s]
+        distances = {v: d - hs + _h[v] if d != math.inf else d for v, d in distances.items()}
+        resultado.append((s, distances, previous_nodes))
+    return resultado
+
+def johnson(graph, workers=None):
+    # graph es un diccionario de adyacencia como el de dijkstra.py (admite
+    # pesos negativos sin ciclos negativos). Devuelve (dist, prev): dist[s] es
+    # el diccionario de distancias desde s (inf = sin camino) y prev[s] el de
+    # nodos anteriores que devuelve dijkstra. workers es el número de procesos
+    # (por defecto, núcleos; con 1 todo se hace en este proceso).
+    h = bellman_ford_potentials(graph)
+    reweighted = {u: {} for u in h}
+    for u, vecinos in graph.items():
+        for v, w in vecinos.items():
+            reweighted[u][v] = w + h[u] - h[v]
+
+    nodes = list(h)
+    workers = workers or os.cpu_count() or 1
+    dist, prev = {}, {}
+    if workers == 1 or len(nodes) < 2:
+        _init_worker(reweighted, h)
+        try:
+            resultados = [_sources(nodes)]
+        finally:
+            _init_worker(None, None)
+    else:
+        # Lotes de fuentes para no pagar el envío entre procesos por cada nodo
+        lotes = [nodes[p::workers * 4] for p in range(workers * 4)]
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(reweighted, h)) as pool:
+            resultados = list(pool.map(_sources, [lote for lote in lotes if lote]))
+
+    for lote in resultados:
+        for s, distances, previous_nodes in lote:
+            dist[s] = distances
+            prev[s] = previous_nodes
+    return dist, prev
+
+# --- Elección automática entre Johnson y Floyd-Warshall ---
+
+def density(graph):
+    V = len(_nodes(graph))
+    E = sum(len(vecinos) for vecinos in graph.values())
+    return E / (V * V) if V else 0.0
+
+def all_pairs_shortest_paths(graph, engine="auto", workers=None, threshold=DENSITY_THRESHOLD):
+    # Caminos más cortos entre todos los pares de un diccionario de adyacencia,
+    # con el mismo resultado (dist, prev) que johnson. engine: "johnson",
+    # "warshall" o "auto" (Johnson para grafos dispersos, Floyd-Warshall si la
+    # densidad supera threshold).
+    if engine == "auto":
+        engine = "warshall" if density(graph) > threshold else "johnson"
+    if engine == "johnson":
+        return johnson(graph, workers)
+
+    nodes = _nodes(graph)
+    indice = {v: i for i, v in enumerate(nodes)}
+    V = len(nodes)
+    matriz = [[INF] * V for _ in range(V)]
+    for i in range(V):
+        matriz[i][i] = 0
+    for u, vecinos in graph.items():
+        for v, w in vecinos.items():
+            # Un lazo negativo queda en la diagonal y se detecta como ciclo negativo
+            matriz[indice[u]][indice[v]] = min(matriz[indice[u]][indice[v]], w)
+
+    import floyd
+    motor = "blocked" if floyd.np is not None else "python"
+    dist_m, pred_m = Warshall.floyd_warshall(matriz, engine=motor, workers=workers)
+
+    dist, prev = {}, {}
+    for i, s in enumerate(nodes):
+        fila, pred = dist_m[i], pred_m[i]
+        dist[s] = {v: math.inf if fila[j] == INF else fila[j] for j, v in enumerate(nodes)}
+        prev[s] = {v: nodes[pred[j]] for j, v in enumerate(nodes) if j != i and pred[j] != Warshall.NO_PRED}
+    return dist, prev
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 3, 'C': 8, 'E': -4},
+        'B': {'D': 1, 'E': 7},
+        'C': {'B': 4},
+        'D': {'A': 2, 'C': -5},
+        'E': {'D': 6, 'F': 0},
+        'F': {'C': 2}
+    }
+
+    print(f"Densidad: {density(graph):.2f}")
+    dist, prev = all_pairs_shortest_paths(graph, engine="johnson")
+    print("Distancias más cortas entre todos los pares (Johnson):")
+    for s in dist:
+        print(s, dist[s])
+
+    # Los dos motores dan las mismas distancias y rutas completas, también
+    # con aristas de peso 0 (E -> F)
+    for engine in ("johnson", "warshall"):
+        dist_engine, prev = all_pairs_shortest_paths(graph, engine=engine, workers=1)
+        assert dist_engine == dist
+        path = []
+        current = 'F'
+        while current != 'A':
+            path.insert(0, current)
+            current = prev['A'][current]
+        path.insert(0, 'A')
+        print(f"Camino más corto de 'A' a 'F' ({engine}): {' -> '.join(path)}")
@@ -0,0 +1,148 @@
+import math
+import random
+
+import pytest
+
+import dijkstra
+
+# --- PRUEBAS DE DIJKSTRA.PY ---
+# Las variantes punto a punto (target, bidireccional y A*) deben dar la misma
+# distancia que dijkstra completo, con caminos válidos. Se ejecuta con pytest.
+
+
+def grafo_en_el_plano(V, vecinos, semilla):
+    """Grafo dirigido entre puntos al azar; cada arista pesa al menos su longitud.
+
+    Así la distancia euclidiana nunca sobrestima y sirve de heurística para A*.
+    """
+    rng = random.Random(semilla)
+    coords = {v: (rng.uniform(0, 100), rng.uniform(0, 100)) for v in range(V)}
+    graph = {v: {} for v in range(V)}
+    for u in range(V):
+        for v in rng.sample(range(V), min(vecinos, V)):
+            if u != v:
+                (x0, y0), (x1, y1) = coords[u], coords[v]
+                graph[u][v] = math.hypot(x1 - x0, y1 - y0) * rng.uniform(1, 1.5)
+    return graph, coords
+
+
+def costo(graph, camino):
+    return sum(graph[a][b] for a, b in zip(camino, camino[1:]))
+
+
+def referencia(graph, s, t):
+    distances, previous_nodes = dijkstra.dijkstra(graph, s)
+    return distances[t]
+
+
+CASOS = [(V, vecinos, semilla) for semilla, (V, vecinos) in
+         enumerate([(2, 1), (10, 2), (30, 2), (60, 3), (100, 1), (100, 4)])]
+
+
+@pytest.mark.parametrize("V, vecinos, semilla", CASOS)
+def test_target_detiene_con_la_distancia_final(V, vecinos, semilla):
+    graph, _ = grafo_en_el_plano(V, vecinos, semilla)
+    completo, _ = dijkstra.dijkstra(graph, 0)
+    for t in range(V):
+        distances, previous_nodes = dijkstra.dijkstra(graph, 0, target=t)
+        assert distances[t] == completo[t]
+        if completo[t] != math.inf:
+            assert costo(graph, dijkstra._path(previous_nodes, 0, t)) == pytest.approx(completo[t])
+
+
+@pytest.mark.parametrize("V, vecinos, semilla", CASOS)
+def test_bidireccional_igual_a_dijkstra(V, vecinos, semilla):
+    graph, _ = grafo_en_el_plano(V, vecinos, semilla)
+    rng = random.Random(semilla)
+    reverse_graph = {}
+    for u, vecinos_u in graph.items():
+        for v, w in vecinos_u.items():
+            reverse_graph.setdefault(v, {})[u] = w
+    for _ in range(20):
+        s, t = rng.randrange(V), rng.randrange(V)
+        esperado = referencia(graph, s, t)
+        for invertido in (None, reverse_graph):
+            d, camino = dijkstra.bidirectional_dijkstra(graph, s, t, invertido)
+            if esperado == math.inf:
+                assert (d, camino) == (math.inf, [])
+            else:
+                assert d == pytest.approx(esperado)
+                assert camino[0] == s and camino[-1] == t
+                assert costo(graph, camino) == pytest.approx(d)
+
+
+@pytest.mark.parametrize("V, vecinos, semilla", CASOS)
+def test_a_star_igual_a_dijkstra(V, vecinos, semilla):
+    graph, coords = grafo_en_el_plano(V, vecinos, semilla)
+    rng = random.Random(semilla)
+    for _ in range(20):
+        s, t = rng.randrange(V), rng.randrange(V)
+        esperado = referencia(graph, s, t)
+        for heuristica in (dijkstra.euclidean(coords), lambda u, v: 0):
+            d, camino = dijkstra.a_star(graph, s, t, heuristica)
+            if esperado == math.inf:
+                assert (d, camino) == (math.inf, [])
+            else:
+                assert d == pytest.approx(esperado)
+                assert camino[0] == s and camino[-1] == t
+                assert costo(graph, camino) == pytest.approx(d)
+
+
+def test_a_star_reabre_nodos_con_heuristica_inconsistente():
+    """Admisible pero no consistente: B sale primero por el camino caro."""
+    graph = {'S': {'A': 1, 'B': 4}, 'A': {'B': 1}, 'B': {'T': 5}}
+    h = {'S': 0, 'A': 5, 'B': 0, 'T': 0}
+    assert dijkstra.a_star(graph, 'S', 'T', lambda u, t: h[u]) == (7, ['S', 'A', 'B', 'T'])
+
+
+def test_mismo_origen_y_destino():
+    graph = {'A': {'B': 1}}
+    assert dijkstra.bidirectional_dijkstra(graph, 'A', 'A') == (0, ['A'])
+    assert dijkstra.a_star(graph, 'A', 'A', lambda u, v: 0) == (0, ['A'])
+
+
+# --- Dijkstra sobre arreglos (CSR) ---
+
+@pytest.mark.parametrize("V, vecinos, semilla", CASOS)
+def test_csr_igual_a_dijkstra(V, vecinos, semilla):
+    graph, _ = grafo_en_el_plano(V, vecinos, semilla)
+    graph[V] = {0: 1.0}  # Etiqueta que no es entero consecutivo
+    nodes, index, offsets, targets, weights = dijkstra.to_csr(graph)
+    assert [index[node] for node in nodes] == list(range(len(nodes)))
+    for s in (0, V):
+        distances, _ = dijkstra.dijkstra(graph, s)
+        dist, pred = dijkstra.dijkstra_csr(offsets, targets, weights, index[s])
+        assert {nodes[i]: d for i, d in enumerate(dist)} == pytest.approx(distances)
+        for i, d in enumerate(dist):
+            if d == math.inf or i == index[s]:
+                assert pred[i] == -1
+            else:
+                camino = [i]
+                while camino[-1] != index[s]:
+                    camino.append(pred[camino[-1]])
+                assert costo(graph, [nodes[j] for j in reversed(camino)]) == pytest.approx(d)
+
+        for t in range(len(nodes)):
+            dist_t, _ = dijkstra.dijkstra_csr(offsets, targets, weights, index[s], target=t)
+            assert dist_t[t] == dist[t]
+
+
+def test_csr_nodos_solo_destino():
+    nodes, index, offsets, targets, weights = dijkstra.to_csr({'A': {'B': 2, 'C': 5}, 'B': {'C': 1}})
+    assert nodes == ['A', 'B', 'C'] and list(offsets) == [0, 2, 3, 3]
+    dist, pred = dijkstra.dijkstra_csr(offsets, targets, weights, index['A'])
+    assert list(dist) == [0, 2, 3] and list(pred) == [-1, 0, 1]
+
+
+def test_csr_rechaza_pesos_negativos_en_cada_llamada():
+    """to_csr no comprueba los pesos: los arreglos pueden cambiar entre llamadas."""
+    nodes, index, offsets, targets, weights = dijkstra.to_csr({'A': {'B': 2}, 'B': {'A': 1}})
+    assert list(dijkstra.dijkstra_csr(offsets, targets, weights, 0)[0]) == [0, 2]
+    weights[1] = -1.0
+    with pytest.raises(ValueError):
+        dijkstra.dijkstra_csr(offsets, targets, weights, 0)
+    # to_csr acepta pesos negativos (p. ej. para reajustarlos antes de usarlos)
+    _, _, offsets, targets, weights = dijkstra.to_csr({'A': {'B': -2}})
+    assert list(weights) == [-2.0]
+    with pytest.raises(ValueError):
+        dijkstra.dijkstra_csr(offsets, targets, weights, 0)
@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+import floyd
+
+# --- PRUEBAS DE LOS MOTORES DE FLOYD-WARSHALL ---
+# Los motores "numpy", "blocked" y "auto" deben dar las mismas distancias que
+# el motor "python", y los predecesores del motor por bloques deben formar
+# rutas que cuestan exactamente dist[i][j]. Se ejecuta con pytest.
+
+INF = floyd.INF
+np = pytest.importorskip("numpy")
+
+
+def grafo_aleatorio(V, densidad, semilla, ciclo_cero=False):
+    """Matriz con pesos negativos pero sin ciclos negativos.
+
+    Los pesos se ajustan con un potencial h: w(u, v) + h(u) - h(v) cambia el
+    costo de cada ciclo en 0. Con ciclo_cero se agrega un ciclo de peso 0.
+    """
+    rng = random.Random(semilla)
+    h = [rng.randint(-20, 20) for _ in range(V)]
+    pesos = {}
+    for u in range(V):
+        for v in range(V):
+            if u != v and rng.random() < densidad:
+                pesos[u, v] = rng.randint(0, 30)
+    if ciclo_cero and V >= 3:
+        ciclo = rng.sample(range(V), 3)
+        for a, b in zip(ciclo, ciclo[1:] + ciclo[:1]):
+            pesos[a, b] = 0
+    graph = [[0 if u == v else INF for v in range(V)] for u in range(V)]
+    for (u, v), w in pesos.items():
+        graph[u][v] = w + h[u] - h[v]
+    return graph
+
+
+def comprobar_predecesores(graph, dist, pred):
+    """Cada ruta por pred llega a i en menos de V pasos y cuesta dist[i][j]."""
+    V = len(graph)
+    for i in range(V):
+        for j in range(V):
+            if dist[i][j] == INF:
+                assert pred[i][j] == -1
+                continue
+            total, k, pasos = 0, j, 0
+            while k != i:
+                p = int(pred[i][k])
+                assert p != -1, f"Ruta de {i} a {j} cortada en {k}"
+                total += graph[p][k]
+                k = p
+                pasos += 1
+                assert pasos < V, f"Ruta de {i} a {j} con ciclo"
+            assert total == dist[i][j]
+
+
+CASOS = [(V, densidad, semilla, ciclo_cero)
+         for semilla, (V, densidad) in enumerate([(1, 0.5), (5, 0.4), (12, 0.2), (20, 0.1), (33, 0.3)])
+         for ciclo_cero in (False, True)]
+
+
+@pytest.mark.parametrize("V, densidad, semilla, ciclo_cero", CASOS)
+@pytest.mark.parametrize("engine", ["numpy", "blocked", "auto"])
+def test_motores_iguales_a_python(V, densidad, semilla, ciclo_cero, engine):
+    graph = grafo_aleatorio(V, densidad, semilla, ciclo_cero)
+    assert floyd.floyd_warshall(graph, engine=engine) == floyd.floyd_warshall(graph)
+
+
+@pytest.mark.parametrize("V, densidad, semilla, ciclo_cero", CASOS)
+@pytest.mark.parametrize("block, workers", [(4, 1), (7, 1), (256, 1), (5, 2)])
+def test_bloques_con_predecesores(V, densidad, semilla, ciclo_cero, block, workers):
+    """Distintos tamaños de bloque y de procesos; los ciclos de peso 0 pasan por _repair_pred."""
+    graph = grafo_aleatorio(V, densidad, semilla, ciclo_cero)
+    referencia = floyd.floyd_warshall(graph)
+    dist, pred = floyd.floyd_warshall_blocked(graph, block=block, workers=workers, predecessors=True)
+    assert pred.dtype == np.int32
+    dist = floyd._to_lists(dist, True)
+    assert dist == referencia
+    comprobar_predecesores(graph, dist, pred)
+
+
+@pytest.mark.parametrize("semilla", range(100, 160))
+def test_muchos_grafos_pequeños(semilla):
+    """Grafos chicos con bloques de 3: muchas fronteras entre bloques y ciclos de peso 0."""
+    rng = random.Random(semilla)
+    graph = grafo_aleatorio(rng.randint(2, 16), rng.choice([0.1, 0.3, 0.6]), semilla, semilla % 2 == 0)
+    referencia = floyd.floyd_warshall(graph)
+    assert floyd.floyd_warshall(graph, engine="numpy") == referencia
+    dist, pred = floyd.floyd_warshall_blocked(graph, block=3, workers=1, predecessors=True)
+    dist = floyd._to_lists(dist, True)
+    assert dist == referencia
+    comprobar_predecesores(graph, dist, pred)
+
+
+def test_infinito_de_python_y_enteros_grandes():
+    """El motor por defecto conserva float('inf') y los enteros exactos."""
+    grande = 2 ** 60 + 1
+    graph = [[0, grande, float('inf')], [float('inf'), 0, 1], [float('inf'), float('inf'), 0]]
+    assert floyd.floyd_warshall(graph) == [[0, grande, grande + 1],
+                                           [float('inf'), 0, 1],
+                                           [float('inf'), float('inf'), 0]]
+
+
+def test_motor_desconocido():
+    with pytest.raises(ValueError):
+        floyd.floyd_warshall([[0]], engine="numpi")
+
+
+def test_benchmark_blocked(capsys):
+    floyd.benchmark_blocked(V=40, block=8, cores=[1], density=0.1)
+    salida = capsys.readouterr().out
+    assert "ok" in salida and "DISTINTO" not in salida
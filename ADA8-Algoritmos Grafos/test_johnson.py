@@ -0,0 +1,106 @@
+import math
+import random
+
+import pytest
+
+import johnson
+
+# --- PRUEBAS DE JOHNSON.PY ---
+# Johnson y Floyd-Warshall (all_pairs_shortest_paths) deben dar las mismas
+# distancias en grafos con pesos negativos, detectar los ciclos negativos y
+# devolver en prev rutas que cuestan exactamente dist. Se ejecuta con pytest.
+
+
+def grafo_aleatorio(V, densidad, semilla):
+    """Diccionario de adyacencia con pesos negativos pero sin ciclos negativos.
+
+    Los pesos se ajustan con un potencial h: w(u, v) + h(u) - h(v) no cambia
+    el costo de ningún ciclo. Algunos nodos solo aparecen como destino.
+    """
+    rng = random.Random(semilla)
+    h = [rng.randint(-20, 20) for _ in range(V)]
+    graph = {}
+    for u in range(V):
+        vecinos = {v: rng.randint(0, 30) + h[u] - h[v]
+                   for v in range(V) if u != v and rng.random() < densidad}
+        if vecinos or rng.random() < 0.7:
+            graph[u] = vecinos
+    return graph
+
+
+def comprobar_prev(graph, dist, prev):
+    """Cada ruta por prev[s] vuelve a s sin ciclos y cuesta dist[s][v]."""
+    for s, distancias in dist.items():
+        assert s not in prev[s]
+        for v, d in distancias.items():
+            if d == math.inf:
+                assert v not in prev[s]
+                continue
+            total, k = 0, v
+            for _ in range(len(distancias)):
+                if k == s:
+                    break
+                p = prev[s][k]
+                total += graph[p][k]
+                k = p
+            assert k == s, f"Ruta de {s} a {v} con ciclo"
+            assert total == d
+
+
+CASOS = [(V, densidad, semilla)
+         for semilla, (V, densidad) in enumerate([(1, 0.5), (4, 0.5), (10, 0.2), (15, 0.05),
+                                                  (20, 0.3), (25, 0.1), (30, 0.02)])]
+
+
+@pytest.mark.parametrize("V, densidad, semilla", CASOS)
+def test_johnson_igual_a_warshall(V, densidad, semilla):
+    graph = grafo_aleatorio(V, densidad, semilla)
+    dist_j, prev_j = johnson.johnson(graph, workers=1)
+    dist_w, prev_w = johnson.all_pairs_shortest_paths(graph, engine="warshall", workers=1)
+    assert dist_j == dist_w
+    assert set(dist_j) == set(johnson._nodes(graph))
+    comprobar_prev(graph, dist_j, prev_j)
+    comprobar_prev(graph, dist_w, prev_w)
+
+
+def test_johnson_con_varios_procesos():
+    graph = grafo_aleatorio(24, 0.15, 99)
+    assert johnson.johnson(graph, workers=2)[0] == johnson.johnson(graph, workers=1)[0]
+
+
+@pytest.mark.parametrize("umbral, esperado", [(0.0, "warshall"), (1.0, "johnson")])
+def test_eleccion_automatica(monkeypatch, umbral, esperado):
+    graph = grafo_aleatorio(12, 0.2, 5)
+    referencia = johnson.johnson(graph, workers=1)[0]
+    usado = []
+    original = johnson.johnson
+    monkeypatch.setattr(johnson, "johnson", lambda g, w=None: usado.append(1) or original(g, w))
+    dist, _ = johnson.all_pairs_shortest_paths(graph, workers=1, threshold=umbral)
+    assert dist == referencia
+    assert bool(usado) == (esperado == "johnson")
+
+
+def test_densidad():
+    assert johnson.density({}) == 0.0
+    assert johnson.density({'A': {'B': 1}, 'B': {}}) == 0.25
+    assert johnson.density({'A': {'B': 1, 'C': 2}}) == 2 / 9  # C y B solo son destino
+
+
+@pytest.mark.parametrize("engine", ["johnson", "warshall"])
+@pytest.mark.parametrize("graph", [
+    {'A': {'B': 1}, 'B': {'C': -3}, 'C': {'A': 1}},
+    {'A': {'A': -1, 'B': 2}},  # Lazo negativo
+    {'A': {'B': -2}, 'B': {'A': 1}},
+])
+def test_ciclo_negativo(engine, graph):
+    with pytest.raises(ValueError):
+        johnson.all_pairs_shortest_paths(graph, engine=engine, workers=1)
+
+
+def test_lazos_y_aristas_de_peso_cero():
+    """Un lazo positivo no cambia dist[s][s] = 0 y las aristas de peso 0 sí se siguen."""
+    graph = {'A': {'A': 5, 'B': 0}, 'B': {'C': -1}, 'C': {'A': 1}}
+    for engine in ("johnson", "warshall"):
+        dist, prev = johnson.all_pairs_shortest_paths(graph, engine=engine, workers=1)
+        assert dist['A'] == {'A': 0, 'B': 0, 'C': -1}
+        comprobar_prev(graph, dist, prev)
@@ -0,0 +1,291 @@
+import random
+from array import array
+
+import pytest
+
+import Warshall
+
+# --- PRUEBAS DE WARSHALL.PY ---
+# Floyd-Warshall con predecesores (motores "python" y "blocked").
+# Se ejecuta con pytest.
+
+INF = Warshall.INF
+NO_PRED = Warshall.NO_PRED
+
+
+def grafo_aleatorio(V, densidad, semilla, negativos=True):
+    """Matriz sin ciclos negativos; con negativos, algunos pesos son negativos.
+
+    Los pesos se ajustan con un potencial h: w(u, v) + h(u) - h(v) no cambia
+    el costo de ningún ciclo.
+    """
+    rng = random.Random(semilla)
+    h = [rng.randint(-20, 20) if negativos else 0 for _ in range(V)]
+    graph = [[0 if u == v else INF for v in range(V)] for u in range(V)]
+    for u in range(V):
+        for v in range(V):
+            if u != v and rng.random() < densidad:
+                graph[u][v] = rng.randint(0, 30) + h[u] - h[v]
+    return graph
+
+
+def costo_por_predecesores(graph, pred, i, j):
+    """Costo de la ruta de i a j siguiendo pred (falla si se corta o da vueltas)."""
+    total, k = 0, j
+    for _ in range(len(graph)):
+        if k == i:
+            return total
+        p = pred[i][k]
+        assert p != NO_PRED, f"Ruta de {i} a {j} cortada en {k}"
+        total += graph[p][k]
+        k = p
+    assert k == i, f"Ruta de {i} a {j} con ciclo"
+    return total
+
+
+def comprobar(graph, dist, pred):
+    V = len(graph)
+    for i in range(V):
+        assert pred[i][i] == NO_PRED
+        for j in range(V):
+            if dist[i][j] == INF:
+                assert pred[i][j] == NO_PRED
+            elif i != j:
+                assert costo_por_predecesores(graph, pred, i, j) == dist[i][j]
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_python_con_predecesores(semilla):
+    graph = grafo_aleatorio(2 + semilla % 10, 0.3, semilla)
+    dist, pred = Warshall.floyd_warshall(graph)
+    comprobar(graph, dist, pred)
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_blocked_igual_a_python(semilla):
+    pytest.importorskip("numpy")
+    graph = grafo_aleatorio(2 + semilla, 0.25, semilla)
+    dist, _ = Warshall.floyd_warshall(graph)
+    dist_b, pred_b = Warshall.floyd_warshall(graph, engine="blocked", workers=1)
+    assert dist_b == dist
+    assert all(isinstance(fila, array) and fila.typecode == 'i' and fila.itemsize == 4
+               for fila in pred_b)
+    comprobar(graph, dist_b, pred_b)
+
+
+@pytest.mark.parametrize("engine", ["python", "blocked"])
+def test_ciclo_negativo(engine):
+    if engine == "blocked":
+        pytest.importorskip("numpy")
+    graph = [[0, 1, INF], [INF, 0, -2], [0, INF, 0]]
+    with pytest.raises(ValueError):
+        Warshall.floyd_warshall(graph, engine=engine, workers=1)
+
+
+def test_motor_desconocido():
+    with pytest.raises(ValueError):
+        Warshall.floyd_warshall([[0]], engine="numpy")
+
+
+# --- Consulta de rutas ---
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_path_y_paths(semilla):
+    graph = grafo_aleatorio(8, 0.25, semilla)
+    dist, pred = Warshall.floyd_warshall(graph)
+    pares = [(i, j) for i in range(8) for j in range(8)]
+    rutas = Warshall.paths(pred, pares)
+    for (i, j), ruta in zip(pares, rutas):
+        camino = list(Warshall.path(pred, i, j))
+        if dist[i][j] == INF:
+            assert camino == [] and ruta is None
+            continue
+        assert camino[0] == i and camino[-1] == j
+        assert sum(graph[a][b] for a, b in zip(camino, camino[1:])) == dist[i][j]
+        assert list(Warshall.path(pred, i, j, reverse=True)) == camino[::-1]
+        assert ruta == camino
+
+
+def test_ruta_cortada():
+    """Una matriz de predecesores inconsistente se detecta al recorrerla."""
+    pred = [array('i', [NO_PRED, 0, 1]), array('i', [NO_PRED] * 3), array('i', [NO_PRED] * 3)]
+    pred[0][1] = NO_PRED
+    with pytest.raises(ValueError):
+        list(Warshall.path(pred, 0, 2))
+    with pytest.raises(ValueError):
+        Warshall.paths(pred, [(0, 2)])
+
+
+# --- Guardar y cargar ---
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+@pytest.mark.parametrize("reales", [False, True])
+def test_guardar_y_cargar(tmp_path, use_mmap, reales):
+    graph = grafo_aleatorio(9, 0.2, 7)
+    if reales:
+        graph = [[x if x == INF else x / 2 for x in fila] for fila in graph]
+    dist, pred = Warshall.floyd_warshall(graph)
+    ruta = tmp_path / "matrices.fwm"
+    Warshall.save_matrices(str(ruta), dist, pred)
+
+    dist_c, pred_c = Warshall.load_matrices(str(ruta), use_mmap=use_mmap)
+    esperado = [[float('inf') if x == INF else x for x in fila] for fila in dist] if reales else dist
+    assert [list(fila) for fila in dist_c] == esperado
+    assert [list(fila) for fila in pred_c] == [list(fila) for fila in pred]
+    # Las filas cargadas sirven para reconstruir rutas
+    assert list(Warshall.path(pred_c, 0, 8)) == list(Warshall.path(pred, 0, 8))
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_cargar_archivo_invalido(tmp_path, use_mmap):
+    dist, pred = Warshall.floyd_warshall(grafo_aleatorio(5, 0.5, 1))
+    ruta = tmp_path / "matrices.fwm"
+    Warshall.save_matrices(str(ruta), dist, pred)
+    datos = ruta.read_bytes()
+
+    for nombre, contenido in (("magia.fwm", b"XXXX" + datos[4:]),
+                              ("truncado.fwm", datos[:-4]),
+                              ("corto.fwm", datos[:6]),
+                              ("vacio.fwm", b"")):
+        mal = tmp_path / nombre
+        mal.write_bytes(contenido)
+        with pytest.raises(ValueError):
+            Warshall.load_matrices(str(mal), use_mmap=use_mmap)
+
+
+# --- Actualización incremental (update_edge) ---
+# Pesos grandes y distintos para que las rutas más cortas sean únicas: así
+# también los predecesores deben coincidir con los de un cálculo completo.
+
+def grafo_sin_empates(V, semilla):
+    rng = random.Random(semilla)
+    h = [rng.randint(-10 ** 5, 10 ** 5) for _ in range(V)]
+    graph = [[0 if u == v else INF for v in range(V)] for u in range(V)]
+    for u in range(V):
+        for v in range(V):
+            if u != v and rng.random() < 0.25:
+                graph[u][v] = rng.randint(1, 10 ** 6) + h[u] - h[v]
+    return graph
+
+
+def arista_nueva(dist, semilla):
+    """(u, v, w) con w menor que dist[u][v] y sin formar un ciclo negativo."""
+    rng = random.Random(semilla)
+    V = len(dist)
+    while True:
+        u, v = rng.sample(range(V), 2)
+        minimo = -dist[v][u] + 1 if dist[v][u] != INF else -10 ** 6
+        maximo = dist[u][v] - 1 if dist[u][v] != INF else 10 ** 6
+        if minimo <= maximo:
+            return u, v, rng.randint(minimo, maximo)
+
+
+def con_arista(graph, u, v, w):
+    nuevo = [list(fila) for fila in graph]
+    nuevo[u][v] = min(nuevo[u][v], w)
+    return nuevo
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_update_edge_listas(semilla):
+    graph = grafo_sin_empates(4 + semilla % 9, semilla)
+    dist, pred = Warshall.floyd_warshall(graph)
+    antes = [list(fila) for fila in dist]
+    for paso in range(3):
+        u, v, w = arista_nueva(dist, semilla * 10 + paso)
+        cambios = Warshall.update_edge(dist, pred, u, v, w)
+        graph = con_arista(graph, u, v, w)
+        dist_c, pred_c = Warshall.floyd_warshall(graph)
+        assert dist == dist_c
+        assert [list(fila) for fila in pred] == [list(fila) for fila in pred_c]
+        esperados = {(i, j) for i in range(len(dist)) for j in range(len(dist)) if antes[i][j] != dist[i][j]}
+        assert len(cambios) == len(esperados) and set(cambios) == esperados
+        antes = [list(fila) for fila in dist]
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_update_edge_numpy(semilla):
+    np = pytest.importorskip("numpy")
+    import floyd
+    graph = grafo_sin_empates(4 + semilla % 9, semilla)
+    dist, pred = floyd.floyd_warshall_blocked(graph, block=4, workers=1, predecessors=True)
+    for paso in range(3):
+        antes = dist.copy()
+        u, v, w = arista_nueva(floyd._to_lists(dist, True), semilla * 10 + paso)
+        cambios = Warshall.update_edge(dist, pred, u, v, w)
+        graph = con_arista(graph, u, v, w)
+        dist_c, pred_c = floyd.floyd_warshall_blocked(graph, block=4, workers=1, predecessors=True)
+        assert np.array_equal(dist, dist_c)
+        assert np.array_equal(pred, pred_c)
+        assert sorted(cambios) == sorted(zip(*(x.tolist() for x in np.nonzero(antes != dist))))
+
+
+def test_update_edge_sin_predecesores():
+    """Con pred None solo se actualizan las distancias, en listas y en NumPy."""
+    graph = grafo_sin_empates(8, 3)
+    dist, pred = Warshall.floyd_warshall(graph)
+    u, v, w = arista_nueva(dist, 3)
+    solo_dist = [list(fila) for fila in dist]
+    assert Warshall.update_edge(solo_dist, None, u, v, w) == Warshall.update_edge(dist, pred, u, v, w)
+    assert solo_dist == dist
+
+    np = pytest.importorskip("numpy")
+    import floyd
+    matriz = floyd.floyd_warshall_blocked(con_arista(graph, 0, 0, 0), workers=1)
+    referencia = floyd.floyd_warshall_blocked(con_arista(graph, u, v, w), workers=1)
+    Warshall.update_edge(matriz, None, u, v, w)
+    assert np.array_equal(matriz, referencia)
+
+
+def test_update_edge_sin_mejora():
+    graph = grafo_sin_empates(6, 5)
+    dist, pred = Warshall.floyd_warshall(graph)
+    u, v = next((u, v) for u in range(6) for v in range(6) if u != v and dist[u][v] != INF)
+    assert Warshall.update_edge(dist, pred, u, v, dist[u][v]) == []
+
+
+@pytest.mark.parametrize("numpy", [False, True])
+def test_update_edge_ciclo_negativo(numpy):
+    """Una arista que cierra un ciclo negativo lanza ValueError sin modificar nada."""
+    graph = [[0, 3, INF], [INF, 0, 4], [INF, INF, 0]]
+    if numpy:
+        np = pytest.importorskip("numpy")
+        import floyd
+        dist, pred = floyd.floyd_warshall_blocked(graph, workers=1, predecessors=True)
+        antes = dist.copy(), pred.copy()
+    else:
+        dist, pred = Warshall.floyd_warshall(graph)
+        antes = [list(fila) for fila in dist], [list(fila) for fila in pred]
+    with pytest.raises(ValueError):
+        Warshall.update_edge(dist, pred, 2, 0, -8)
+    if numpy:
+        assert np.array_equal(dist, antes[0]) and np.array_equal(pred, antes[1])
+    else:
+        assert dist == antes[0] and [list(fila) for fila in pred] == antes[1]
+
+
+# --- Clausura transitiva ---
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_clausura_igual_a_distancias(semilla):
+    """alcanzable(i, j) equivale a dist[i][j] != INF; V cruza límites de byte."""
+    V = 1 + semilla * 2
+    graph = grafo_aleatorio(V, [0.02, 0.1, 0.3][semilla % 3], semilla)
+    dist, _ = Warshall.floyd_warshall(graph)
+    clausura = Warshall.TransitiveClosure(graph)
+    assert clausura.nbytes == V * ((V + 7) // 8)
+    for i in range(V):
+        esperados = [j for j in range(V) if dist[i][j] != INF]
+        assert [j for j in range(V) if clausura.alcanzable(i, j)] == esperados
+        assert list(clausura.alcanzables(i)) == esperados
+
+
+def test_clausura_sin_aristas():
+    clausura = Warshall.TransitiveClosure([[INF] * 9 for _ in range(9)])
+    assert all(list(clausura.alcanzables(i)) == [i] for i in range(9))
+
+
+def test_benchmark_closure(capsys):
+    Warshall.benchmark_closure(V=40, density=0.05)
+    salida = capsys.readouterr().out
+    assert "ok" in salida and "DISTINTO" not in salida